@@ -0,0 +1,170 @@
+"""Headless benchmarks for the dashboard's collection and render hot paths.
+
+Each path runs against synthetic input (a SimulatedCollector with N processes
+and M connections, a generated directory tree, fixed chart data) so results are
+reproducible and do not depend on the load of the machine running them.
+
+    python benchmark.py                      # run and compare with the baseline
+    python benchmark.py --save-baseline      # run and store the results as the baseline
+    python benchmark.py --processes 10000 --connections 50000
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from collectors import SimulatedCollector
+from system_dashboard import (collect_connections, collect_processes, render_history_plot,
+                              scan_directory, sort_processes)
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+
+
+def make_directory_tree(root, dirs=20, depth=3, files_per_dir=25, seed=0):
+    """Create a tree of sparse files under root and return the number of files"""
+    rng = random.Random(seed)
+    count = 0
+
+    def populate(path, level):
+        nonlocal count
+        for i in range(files_per_dir):
+            with open(os.path.join(path, f"file{i}.dat"), "wb") as f:
+                f.truncate(rng.randrange(1, 1024**2))
+            count += 1
+        if level < depth:
+            for i in range(max(1, dirs // (level + 1))):
+                child = os.path.join(path, f"dir{level}_{i}")
+                os.mkdir(child)
+                populate(child, level + 1)
+
+    populate(root, 1)
+    return count
+
+
+def measure(func, repeat):
+    """Run func once to warm up, then repeat times; return durations in seconds"""
+    func()
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def summarize(durations, items):
+    durations = sorted(durations)
+    median = statistics.median(durations)
+    return {
+        "median_ms": median * 1000,
+        "p95_ms": durations[min(len(durations) - 1, int(round(0.95 * (len(durations) - 1))))] * 1000,
+        "items": items,
+        "items_per_s": items / median if median > 0 else 0.0,
+    }
+
+
+def run_benchmarks(args):
+    collector = SimulatedCollector(args.processes, args.connections)
+    results = {}
+
+    def bench(name, func, items):
+        if args.only and not any(part in name for part in args.only):
+            return
+        results[name] = summarize(measure(func, args.repeat), items)
+        print(f"  {name:<28} {results[name]['median_ms']:10.2f} ms")
+
+    print(f"Running benchmarks ({args.processes} processes, {args.connections} connections, "
+          f"{args.repeat} repeats)")
+
+    bench("collect_processes", lambda: collect_processes(collector), args.processes)
+    processes = collect_processes(collector)
+    for key in ("CPU", "Memory", "Name", "PID"):
+        bench(f"sort_processes[{key}]", lambda: sort_processes(list(processes), key), args.processes)
+    bench("collect_connections", lambda: collect_connections(collector), args.connections)
+
+    with tempfile.TemporaryDirectory(prefix="dashboard-bench-") as root:
+        files = make_directory_tree(root, dirs=args.dirs)
+        bench("scan_directory", lambda: scan_directory(root), files)
+
+    # Chart redraws, rendered with the Agg backend
+    rng = random.Random(0)
+    figure = Figure(figsize=(5, 3), dpi=100, facecolor="#2E2E2E")
+    canvas = FigureCanvasAgg(figure)
+    plot = figure.add_subplot(111)
+    single = [rng.random() * 100 for _ in range(60)]
+    pair = [[rng.random() * 1000 for _ in range(60)] for _ in range(2)]
+
+    def draw_single():
+        render_history_plot(plot, "CPU %", 100, [(single, "#3E8ADE", None)])
+        canvas.draw()
+
+    def draw_pair():
+        render_history_plot(plot, "KB/s", 1100, [(pair[0], "#3E8ADE", "Sent"), (pair[1], "#28A745", "Received")])
+        canvas.draw()
+
+    bench("render_chart[1 line]", draw_single, 1)
+    bench("render_chart[2 lines]", draw_pair, 1)
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Print a comparison table; return the names that regressed beyond tolerance"""
+    regressions = []
+    print(f"\n{'benchmark':<28} {'median ms':>10} {'p95 ms':>10} {'items/s':>12} {'baseline':>10} {'ratio':>7}")
+    for name, row in results.items():
+        base = baseline.get(name)
+        if base:
+            ratio = row["median_ms"] / base["median_ms"] if base["median_ms"] else 0.0
+            base_text = f"{base['median_ms']:10.2f}"
+            ratio_text = f"{ratio:6.2f}x"
+            if ratio > 1 + tolerance:
+                regressions.append(name)
+                ratio_text += " REGRESSION"
+        else:
+            base_text, ratio_text = f"{'-':>10}", f"{'-':>7}"
+        print(f"{name:<28} {row['median_ms']:10.2f} {row['p95_ms']:10.2f} {row['items_per_s']:12.0f} "
+              f"{base_text} {ratio_text}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the dashboard's collection and render hot paths")
+    parser.add_argument("--processes", type=int, default=1000, help="synthetic processes (default 1000)")
+    parser.add_argument("--connections", type=int, default=5000, help="synthetic connections (default 5000)")
+    parser.add_argument("--dirs", type=int, default=20, help="top-level directories in the generated tree")
+    parser.add_argument("--repeat", type=int, default=10, help="timed runs per benchmark")
+    parser.add_argument("--only", nargs="*", help="run only benchmarks whose name contains one of these")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed slowdown before a result counts as a regression (default 0.25)")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) slower than baseline by more than {args.tolerance:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
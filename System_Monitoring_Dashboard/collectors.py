@@ -0,0 +1,812 @@
+"""Metric collectors used by the System Monitoring Dashboard.
+
+The dashboard only talks to a Collector. PsutilCollector reads the real system;
+SimulatedCollector generates deterministic synthetic data at any scale
+(thousands of processes, tens of thousands of connections, dozens of disks) so
+the UI pipelines can be tested and load-tested without real system load.
+
+Return values mirror the shapes psutil uses (named tuples with the same field
+names), so code written against psutil works unchanged with either collector.
+"""
+import glob
+import os
+import random
+import socket
+import sys
+import time
+from abc import ABC, abstractmethod
+from collections import namedtuple
+
+import psutil
+
+PROCESS_ATTRS = ['pid', 'name', 'username', 'cpu_percent', 'memory_percent', 'status', 'num_threads', 'create_time']
+
+CpuTimesPercent = namedtuple("CpuTimesPercent", ["user", "system", "idle", "iowait", "steal", "irq"])
+VirtualMemory = namedtuple("VirtualMemory", ["total", "available", "percent", "used", "free"])
+NetIO = namedtuple("NetIO", ["bytes_sent", "bytes_recv", "packets_sent", "packets_recv"])
+DiskIO = namedtuple("DiskIO", ["read_count", "write_count", "read_bytes", "write_bytes"])
+Partition = namedtuple("Partition", ["device", "mountpoint", "fstype", "opts"])
+DiskUsage = namedtuple("DiskUsage", ["total", "used", "free", "percent"])
+Temperature = namedtuple("Temperature", ["label", "current", "high", "critical"])
+Fan = namedtuple("Fan", ["label", "current"])
+Battery = namedtuple("Battery", ["percent", "secsleft", "power_plugged"])
+Address = namedtuple("Address", ["ip", "port"])
+Connection = namedtuple("Connection", ["fd", "family", "type", "laddr", "raddr", "status", "pid"])
+InterfaceAddress = namedtuple("InterfaceAddress", ["family", "address", "netmask", "broadcast", "ptp"])
+MemoryDetails = namedtuple("MemoryDetails", ["total", "used", "cached", "buffers", "slab", "dirty", "writeback",
+                                             "swap_total", "swap_used", "swap_in", "swap_out"])
+Pressure = namedtuple("Pressure", ["some_avg10", "some_avg60", "some_avg300", "some_total",
+                                   "full_avg10", "full_avg60", "full_avg300", "full_total"])
+ProcessMemory = namedtuple("ProcessMemory", ["rss", "pss", "uss"])
+CgroupStats = namedtuple("CgroupStats", ["cpu_usage_usec", "memory_current", "io_read_bytes", "io_write_bytes"])
+
+# Mount point of the unified (v2) cgroup hierarchy
+CGROUP_ROOT = "/sys/fs/cgroup"
+
+# Linux sensor and power supply classes
+HWMON_ROOT = "/sys/class/hwmon"
+THERMAL_ROOT = "/sys/class/thermal"
+POWER_SUPPLY_ROOT = "/sys/class/power_supply"
+
+
+class ProcFile:
+    """A /proc file kept open and re-read from offset 0 with pread
+
+    Reading from offset 0 makes the kernel regenerate the contents, so one
+    descriptor serves every tick. A file that cannot be opened (e.g. no PSI
+    support in the kernel) is not retried.
+    """
+    def __init__(self, path, size=65536):
+        self.path = path
+        self.size = size
+        self.fd = None
+        self.missing = False
+
+    def read(self):
+        """Return the current contents as text, or None when unavailable"""
+        if self.missing:
+            return None
+        try:
+            if self.fd is None:
+                self.fd = os.open(self.path, os.O_RDONLY)
+        except OSError:
+            self.missing = True
+            return None
+        try:
+            return os.pread(self.fd, self.size, 0).decode()
+        except OSError:
+            return None
+
+
+def parse_pressure(text):
+    """Parse the contents of a /proc/pressure file into a Pressure"""
+    values = {}
+    for line in text.splitlines():
+        kind, *fields = line.split()
+        for field in fields:
+            key, _, value = field.partition("=")
+            values[f"{kind}_{key}"] = float(value)
+    return Pressure(*(values.get(field) for field in Pressure._fields))
+
+
+def _read_text(path):
+    """Return the stripped contents of a small sysfs file, or None"""
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _read_number(path, scale=1.0):
+    text = _read_text(path)
+    try:
+        return int(text) / scale
+    except (TypeError, ValueError):
+        return None
+
+
+class SysfsSensors:
+    """Linux hwmon and thermal zone sensors, discovered once and re-read with pread
+
+    Every input file is opened at discovery and re-read from offset 0 through its
+    cached descriptor, so a reading is one syscall instead of a directory scan and
+    an open/read/close. Reads are rate-limited per sensor to min_interval, and a
+    sensor whose driver is slow to answer is only re-read every SLOW_INTERVAL.
+    """
+    SLOW_READ = 0.05
+    SLOW_INTERVAL = 30.0
+
+    def __init__(self, min_interval=1.0):
+        self.min_interval = min_interval
+        self.sensors = []
+
+        for hwmon in sorted(glob.glob(os.path.join(HWMON_ROOT, "hwmon*"))):
+            chip = _read_text(os.path.join(hwmon, "name")) or os.path.basename(hwmon)
+            for path in sorted(glob.glob(os.path.join(hwmon, "temp*_input"))):
+                base = path[:-len("_input")]
+                self._add("temperature", chip, _read_text(base + "_label") or "", path, 1000.0,
+                          _read_number(base + "_max", 1000.0), _read_number(base + "_crit", 1000.0))
+            for path in sorted(glob.glob(os.path.join(hwmon, "fan*_input"))):
+                self._add("fan", chip, _read_text(path[:-len("_input")] + "_label") or "", path, 1.0)
+
+        for zone in sorted(glob.glob(os.path.join(THERMAL_ROOT, "thermal_zone*"))):
+            self._add("temperature", os.path.basename(zone), _read_text(os.path.join(zone, "type")) or "",
+                      os.path.join(zone, "temp"), 1000.0)
+
+    def _add(self, kind, chip, label, path, scale, high=None, critical=None):
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return
+        self.sensors.append({
+            "kind": kind,
+            "chip": chip,
+            "label": label,
+            "fd": fd,
+            "scale": scale,
+            "high": high,
+            "critical": critical,
+            "value": None,
+            "next_read": 0.0,
+        })
+
+    def read(self):
+        """Re-read the sensors that are due; return (temperatures, fans) shaped like psutil's"""
+        for sensor in self.sensors:
+            start = time.monotonic()
+            if start < sensor["next_read"]:
+                continue
+            try:
+                sensor["value"] = int(os.pread(sensor["fd"], 32, 0)) / sensor["scale"]
+            except (OSError, ValueError):
+                sensor["value"] = None  # Sensor offline or not reporting
+            slow = time.monotonic() - start > self.SLOW_READ
+            sensor["next_read"] = start + (self.SLOW_INTERVAL if slow else self.min_interval)
+
+        temperatures, fans = {}, {}
+        for sensor in self.sensors:
+            if sensor["value"] is None:
+                continue
+            if sensor["kind"] == "fan":
+                fans.setdefault(sensor["chip"], []).append(Fan(sensor["label"], sensor["value"]))
+            else:
+                temperatures.setdefault(sensor["chip"], []).append(
+                    Temperature(sensor["label"], sensor["value"], sensor["high"], sensor["critical"]))
+        return temperatures, fans
+
+
+class SysfsBattery:
+    """Battery state from /sys/class/power_supply, parsed only when its files change
+
+    The status files are stat()ed on every call and only re-read when an mtime
+    moved. Not every driver touches mtimes, so the state is also re-read once it
+    is max_age seconds old.
+    """
+    def __init__(self, max_age=60.0):
+        self.max_age = max_age
+        self.battery = None
+        self.mains = []
+        for supply in sorted(glob.glob(os.path.join(POWER_SUPPLY_ROOT, "*"))):
+            supply_type = _read_text(os.path.join(supply, "type"))
+            if supply_type == "Battery" and self.battery is None:
+                self.battery = supply
+            elif supply_type == "Mains":
+                self.mains.append(supply)
+
+        self.watched = []
+        if self.battery is not None:
+            self.watched = [os.path.join(self.battery, "capacity"), os.path.join(self.battery, "status")]
+            self.watched += [os.path.join(supply, "online") for supply in self.mains]
+        self.mtimes = None
+        self.value = None
+        self.read_at = 0.0
+
+    def read(self):
+        if self.battery is None:
+            return None
+        mtimes = []
+        for path in self.watched:
+            try:
+                mtimes.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        now = time.monotonic()
+        if mtimes == self.mtimes and now - self.read_at < self.max_age:
+            return self.value
+        self.mtimes = mtimes
+        self.read_at = now
+
+        percent = _read_number(os.path.join(self.battery, "capacity"))
+        if percent is None:
+            self.value = None
+            return None
+        status = _read_text(os.path.join(self.battery, "status"))
+        plugged = (status in ("Charging", "Full", "Not charging")
+                   or any(_read_text(os.path.join(supply, "online")) == "1" for supply in self.mains))
+
+        secsleft = psutil.POWER_TIME_UNLIMITED if plugged else psutil.POWER_TIME_UNKNOWN
+        if not plugged:
+            # Energy (uWh / uW) or charge (uAh / uA) based estimate
+            for amount, rate in (("energy_now", "power_now"), ("charge_now", "current_now")):
+                remaining = _read_number(os.path.join(self.battery, amount))
+                draw = _read_number(os.path.join(self.battery, rate))
+                if remaining is not None and draw:
+                    secsleft = int(remaining / draw * 3600)
+                    break
+        self.value = Battery(percent, secsleft, plugged)
+        return self.value
+
+
+class Collector(ABC):
+    """Interface between the dashboard and a source of system metrics
+
+    Every method is abstract, so a collector missing one fails when it is
+    created instead of in the middle of a tick.
+    """
+    name = "collector"
+
+    # CPU and memory
+    @abstractmethod
+    def cpu_percent(self, percpu=False):
+        raise NotImplementedError
+
+    @abstractmethod
+    def cpu_times_percent(self):
+        """Return CPU time percentages by category (user, system, iowait, steal, irq, ...)"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def cpu_count(self):
+        raise NotImplementedError
+
+    @abstractmethod
+    def virtual_memory(self):
+        raise NotImplementedError
+
+    # Network and disk I/O
+    @abstractmethod
+    def net_io_counters(self):
+        raise NotImplementedError
+
+    @abstractmethod
+    def disk_io_counters(self):
+        raise NotImplementedError
+
+    # Partitions
+    @abstractmethod
+    def disk_partitions(self):
+        raise NotImplementedError
+
+    @abstractmethod
+    def disk_usage(self, mountpoint):
+        raise NotImplementedError
+
+    # Memory details, pressure and load
+    @abstractmethod
+    def memory_details(self):
+        """Return a MemoryDetails in bytes; swap_in/swap_out are cumulative, fields unavailable are None"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def pressure(self, resource):
+        """Return the Pressure of "cpu", "io" or "memory", or None without PSI support"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def process_memory(self, pid):
+        """Return the ProcessMemory of pid; expensive, raises psutil.Error on failure"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def load_average(self):
+        """Return the 1, 5 and 15 minute load averages"""
+        raise NotImplementedError
+
+    # Sensors
+    @abstractmethod
+    def sensors_temperatures(self):
+        """Return {sensor name: [Temperature, ...]}; empty when unavailable"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def sensors_fans(self):
+        """Return {sensor name: [Fan, ...]} with speeds in RPM; empty when unavailable"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def sensors_battery(self):
+        """Return a Battery, or None when there is no battery"""
+        raise NotImplementedError
+
+    # System information
+    @abstractmethod
+    def boot_time(self):
+        raise NotImplementedError
+
+    @abstractmethod
+    def net_if_addrs(self):
+        raise NotImplementedError
+
+    # Processes and connections
+    @abstractmethod
+    def processes(self):
+        """Return one dict per process with the keys in PROCESS_ATTRS"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def connections(self):
+        """Return the inet connections as Connection-shaped tuples"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def process_name(self, pid):
+        """Return the name of pid, or None if it cannot be looked up"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def process_cmdline(self, pid):
+        """Return the command line of pid as one string, or None if it cannot be looked up"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def process_details(self, pid):
+        """Return a list of (label, value) pairs; raises psutil.Error on failure"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def terminate(self, pid):
+        """Terminate pid; raises psutil.Error on failure"""
+        raise NotImplementedError
+
+    # Control groups
+    @abstractmethod
+    def cgroups(self):
+        """Return {cgroup path: CgroupStats} for every cgroup v2 group; empty without cgroup v2
+
+        Counters are cumulative like the kernel's; fields a group does not account
+        (e.g. memory.current of the root) are None.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def process_cgroup(self, pid):
+        """Return the cgroup v2 path of pid, or None if it cannot be looked up"""
+        raise NotImplementedError
+
+
+class PsutilCollector(Collector):
+    """Collector backed by psutil (the real system)"""
+    name = "psutil"
+
+    def __init__(self):
+        # On Linux, sensors are discovered once and read through cached descriptors
+        self.sysfs_sensors = None
+        self.sysfs_battery = None
+        self.meminfo = ProcFile("/proc/meminfo")
+        self.vmstat = ProcFile("/proc/vmstat")
+        self.pressure_files = {resource: ProcFile(f"/proc/pressure/{resource}")
+                               for resource in ("cpu", "io", "memory")}
+        if sys.platform.startswith("linux"):
+            sensors = SysfsSensors()
+            if sensors.sensors:
+                self.sysfs_sensors = sensors
+            battery = SysfsBattery()
+            if battery.battery is not None:
+                self.sysfs_battery = battery
+
+    def cpu_percent(self, percpu=False):
+        return psutil.cpu_percent(percpu=percpu)
+
+    def cpu_times_percent(self):
+        return psutil.cpu_times_percent()
+
+    def cpu_count(self):
+        return psutil.cpu_count(logical=True)
+
+    def virtual_memory(self):
+        return psutil.virtual_memory()
+
+    def memory_details(self):
+        meminfo = self.meminfo.read() if sys.platform.startswith("linux") else None
+        if meminfo is None:
+            memory = psutil.virtual_memory()
+            swap = psutil.swap_memory()
+            return MemoryDetails(memory.total, memory.used, getattr(memory, "cached", None),
+                                 getattr(memory, "buffers", None), getattr(memory, "slab", None), None, None,
+                                 swap.total, swap.used, swap.sin, swap.sout)
+
+        fields = {}
+        for line in meminfo.splitlines():
+            key, _, value = line.partition(":")
+            fields[key] = int(value.split()[0]) * 1024
+        page_size = os.sysconf("SC_PAGE_SIZE")
+        swapped = {}
+        for line in (self.vmstat.read() or "").splitlines():
+            if line.startswith("psw"):
+                key, value = line.split()
+                swapped[key] = int(value) * page_size
+        total = fields["MemTotal"]
+        return MemoryDetails(
+            total,
+            total - fields.get("MemAvailable", fields.get("MemFree", 0)),
+            fields.get("Cached"),
+            fields.get("Buffers"),
+            fields.get("Slab"),
+            fields.get("Dirty"),
+            fields.get("Writeback"),
+            fields.get("SwapTotal", 0),
+            fields.get("SwapTotal", 0) - fields.get("SwapFree", 0),
+            swapped.get("pswpin"),
+            swapped.get("pswpout"),
+        )
+
+    def pressure(self, resource):
+        text = self.pressure_files[resource].read()
+        return parse_pressure(text) if text else None
+
+    def process_memory(self, pid):
+        info = psutil.Process(pid).memory_full_info()
+        return ProcessMemory(info.rss, getattr(info, "pss", None), info.uss)
+
+    def load_average(self):
+        if hasattr(os, "getloadavg"):
+            return os.getloadavg()
+        return psutil.getloadavg()  # Emulated on Windows
+
+    def net_io_counters(self):
+        return psutil.net_io_counters()
+
+    def disk_io_counters(self):
+        return psutil.disk_io_counters(perdisk=False)
+
+    def disk_partitions(self):
+        return psutil.disk_partitions()
+
+    def disk_usage(self, mountpoint):
+        return psutil.disk_usage(mountpoint)
+
+    def sensors_temperatures(self):
+        if self.sysfs_sensors is not None:
+            return self.sysfs_sensors.read()[0]
+        if hasattr(psutil, "sensors_temperatures"):
+            return psutil.sensors_temperatures() or {}
+        return {}
+
+    def sensors_fans(self):
+        if self.sysfs_sensors is not None:
+            return self.sysfs_sensors.read()[1]
+        if hasattr(psutil, "sensors_fans"):
+            return psutil.sensors_fans() or {}
+        return {}
+
+    def sensors_battery(self):
+        if self.sysfs_battery is not None:
+            return self.sysfs_battery.read()
+        if not hasattr(psutil, "sensors_battery"):
+            return None
+        return psutil.sensors_battery()
+
+    def boot_time(self):
+        return psutil.boot_time()
+
+    def net_if_addrs(self):
+        return psutil.net_if_addrs()
+
+    def processes(self):
+        processes = []
+        for proc in psutil.process_iter(PROCESS_ATTRS):
+            try:
+                processes.append(proc.info)
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                pass
+        return processes
+
+    def connections(self):
+        return psutil.net_connections(kind='inet')
+
+    def process_name(self, pid):
+        try:
+            return psutil.Process(pid).name()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return None
+
+    def process_cmdline(self, pid):
+        try:
+            return ' '.join(psutil.Process(pid).cmdline())
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            return None
+
+    def process_details(self, pid):
+        proc = psutil.Process(pid)
+        return [
+            ("PID", pid),
+            ("Name", proc.name()),
+            ("Executable", proc.exe()),
+            ("Command Line", ' '.join(proc.cmdline())),
+            ("Working Directory", proc.cwd()),
+            ("Status", proc.status()),
+            ("User", proc.username()),
+            ("CPU Usage", f"{proc.cpu_percent(interval=0.1):.1f}%"),
+            ("Memory Usage", f"{proc.memory_info().rss / (1024 * 1024):.2f} MB"),
+            ("Open Files", len(proc.open_files())),
+            ("Threads", proc.num_threads()),
+        ]
+
+    def terminate(self, pid):
+        psutil.Process(pid).terminate()
+
+    def cgroups(self):
+        if not os.path.exists(os.path.join(CGROUP_ROOT, "cgroup.controllers")):
+            return {}  # Not a unified hierarchy
+
+        # One walk over the hierarchy; only files the listing shows are opened
+        groups = {}
+        for dirpath, dirnames, filenames in os.walk(CGROUP_ROOT):
+            files = set(filenames)
+            cpu_usage = memory = read_bytes = write_bytes = None
+            try:
+                if "cpu.stat" in files:
+                    with open(os.path.join(dirpath, "cpu.stat")) as f:
+                        for line in f:
+                            key, _, value = line.partition(" ")
+                            if key == "usage_usec":
+                                cpu_usage = int(value)
+                                break
+                if "memory.current" in files:
+                    with open(os.path.join(dirpath, "memory.current")) as f:
+                        memory = int(f.read())
+                if "io.stat" in files:
+                    read_bytes = write_bytes = 0
+                    with open(os.path.join(dirpath, "io.stat")) as f:
+                        for line in f:
+                            # "<major>:<minor> rbytes=N wbytes=N rios=N ..."
+                            for field in line.split()[1:]:
+                                key, _, value = field.partition("=")
+                                if key == "rbytes":
+                                    read_bytes += int(value)
+                                elif key == "wbytes":
+                                    write_bytes += int(value)
+            except (OSError, ValueError):
+                continue  # Group removed while walking
+            groups[dirpath[len(CGROUP_ROOT):] or "/"] = CgroupStats(cpu_usage, memory, read_bytes, write_bytes)
+        return groups
+
+    def process_cgroup(self, pid):
+        try:
+            with open(f"/proc/{pid}/cgroup") as f:
+                for line in f:
+                    # The unified hierarchy is the "0::<path>" entry
+                    if line.startswith("0::"):
+                        return line[3:].strip()
+        except OSError:
+            pass
+        return None
+
+
+class SimulatedCollector(Collector):
+    """Deterministic synthetic system for testing and load-testing the dashboard
+
+    The same seed always produces the same sequence of samples. Counters grow
+    and utilisation values wander a little on every call, so charts move.
+    """
+    name = "simulated"
+
+    STATUSES = ["running", "sleeping", "idle", "disk-sleep", "zombie"]
+    CONN_STATUSES = ["ESTABLISHED", "LISTEN", "TIME_WAIT", "CLOSE_WAIT", "SYN_SENT"]
+
+    def __init__(self, processes=1000, connections=5000, disks=8, cores=8, seed=0):
+        self.rng = random.Random(seed)
+        self.cores = cores
+        self.start_time = time.time()
+        self.memory_total = 64 * 1024**3
+        self.memory_percent = 40.0
+        self.core_load = [self.rng.random() * 50 for _ in range(cores)]
+        self.net = [0, 0, 0, 0]
+        self.disk_io = [0, 0, 0, 0]
+        self.swap = [0, 0]
+
+        self._processes = {}
+        for pid in range(1, processes + 1):
+            self._processes[pid] = {
+                'pid': pid,
+                'name': f"proc-{self.rng.randrange(processes // 4 + 1)}",
+                'username': f"user{self.rng.randrange(20)}",
+                'cpu_percent': self.rng.random() * 5,
+                'memory_percent': self.rng.random() * 100 / max(processes, 1),
+                'status': self.rng.choice(self.STATUSES),
+                'num_threads': self.rng.randrange(1, 64),
+                'create_time': self.start_time - self.rng.randrange(86400 * 30),
+            }
+
+        self._connections = []
+        for fd in range(connections):
+            listening = self.rng.random() < 0.1
+            self._connections.append(Connection(
+                fd=fd,
+                family=socket.AF_INET,
+                type=socket.SOCK_STREAM,
+                laddr=Address(f"10.0.{self.rng.randrange(256)}.{self.rng.randrange(256)}",
+                              self.rng.randrange(1024, 65535)),
+                raddr=() if listening else Address(
+                    f"192.168.{self.rng.randrange(256)}.{self.rng.randrange(256)}", 443),
+                status="LISTEN" if listening else self.rng.choice(self.CONN_STATUSES),
+                pid=self.rng.randrange(1, processes + 1) if processes and self.rng.random() < 0.9 else None,
+            ))
+
+        self._partitions = []
+        self._usage = {}
+        for i in range(disks):
+            mountpoint = "/" if i == 0 else f"/mnt/disk{i:02d}"
+            self._partitions.append(Partition(f"/dev/sim{i}", mountpoint, "ext4", "rw"))
+            total = self.rng.choice([256, 512, 1024, 4096]) * 1024**3
+            self._usage[mountpoint] = [total, int(total * self.rng.uniform(0.1, 0.97))]
+
+        # Control groups: a few system services plus one container per pod
+        self._cgroup_leaves = [f"/system.slice/sim{i}.service" for i in range(4)]
+        for i in range(max(1, processes // 50)):
+            self._cgroup_leaves.append(f"/kubepods.slice/kubepods-pod{i:04d}.slice/"
+                                       f"cri-containerd-{self.rng.getrandbits(256):064x}.scope")
+        self._cgroup_counters = {path: [0, self.rng.randrange(16, 2048) * 1024**2, 0, 0]
+                                 for path in self._cgroup_leaves}
+
+    def _wander(self, value, step, low=0.0, high=100.0):
+        return min(high, max(low, value + self.rng.uniform(-step, step)))
+
+    def cpu_percent(self, percpu=False):
+        self.core_load = [self._wander(load, 10) for load in self.core_load]
+        if percpu:
+            return list(self.core_load)
+        return sum(self.core_load) / len(self.core_load)
+
+    def cpu_times_percent(self):
+        busy = sum(self.core_load) / len(self.core_load)
+        user = busy * self.rng.uniform(0.55, 0.75)
+        system = busy * self.rng.uniform(0.15, 0.3)
+        iowait = self.rng.uniform(0, 5)
+        steal = self.rng.uniform(0, 2)
+        irq = max(0.0, busy - user - system)
+        return CpuTimesPercent(user, system, max(0.0, 100 - busy - iowait - steal), iowait, steal, irq)
+
+    def cpu_count(self):
+        return self.cores
+
+    def virtual_memory(self):
+        self.memory_percent = self._wander(self.memory_percent, 2)
+        used = int(self.memory_total * self.memory_percent / 100)
+        return VirtualMemory(self.memory_total, self.memory_total - used, self.memory_percent,
+                             used, self.memory_total - used)
+
+    def memory_details(self):
+        used = int(self.memory_total * self.memory_percent / 100)
+        self.swap = [value + self.rng.randrange(0, 256 * 1024) for value in self.swap]
+        return MemoryDetails(self.memory_total, used, self.memory_total // 4, self.memory_total // 64,
+                             self.memory_total // 32, self.rng.randrange(0, 64 * 1024**2),
+                             self.rng.randrange(0, 8 * 1024**2), 8 * 1024**3, 1024**3, *self.swap)
+
+    def pressure(self, resource):
+        busy = sum(self.core_load) / len(self.core_load) if resource == "cpu" else self.memory_percent
+        some = max(0.0, busy - 40) / 3
+        full = None if resource == "cpu" else some / 2
+        return Pressure(some, some, some, some * 1e6, full, full, full, None if full is None else full * 1e6)
+
+    def load_average(self):
+        load = sum(self.core_load) / 100
+        return (load, load * 0.9, load * 0.8)
+
+    def process_memory(self, pid):
+        info = self._processes.get(pid)
+        if info is None:
+            raise psutil.NoSuchProcess(pid)
+        rss = int(info['memory_percent'] * self.memory_total / 100)
+        return ProcessMemory(rss, int(rss * 0.7), int(rss * 0.5))
+
+    def net_io_counters(self):
+        self.net[0] += self.rng.randrange(0, 2 * 1024**2)
+        self.net[1] += self.rng.randrange(0, 8 * 1024**2)
+        self.net[2] += self.rng.randrange(0, 2000)
+        self.net[3] += self.rng.randrange(0, 6000)
+        return NetIO(*self.net)
+
+    def disk_io_counters(self):
+        self.disk_io[0] += self.rng.randrange(0, 500)
+        self.disk_io[1] += self.rng.randrange(0, 500)
+        self.disk_io[2] += self.rng.randrange(0, 20 * 1024**2)
+        self.disk_io[3] += self.rng.randrange(0, 20 * 1024**2)
+        return DiskIO(*self.disk_io)
+
+    def disk_partitions(self):
+        return list(self._partitions)
+
+    def disk_usage(self, mountpoint):
+        if mountpoint not in self._usage:
+            raise FileNotFoundError(mountpoint)
+        usage = self._usage[mountpoint]
+        usage[1] = min(usage[0], max(0, usage[1] + self.rng.randrange(-1024**3, 1024**3)))
+        total, used = usage
+        return DiskUsage(total, used, total - used, round(used / total * 100, 1))
+
+    def sensors_temperatures(self):
+        return {"simcpu": [Temperature(f"Core {i}", 40 + load / 2, 80.0, 100.0)
+                           for i, load in enumerate(self.core_load)]}
+
+    def sensors_fans(self):
+        return {"simfan": [Fan(f"Fan {i}", 800 + 20 * load) for i, load in enumerate(self.core_load[:2])]}
+
+    def sensors_battery(self):
+        return None
+
+    def boot_time(self):
+        return self.start_time - 86400
+
+    def net_if_addrs(self):
+        return {
+            "lo": [InterfaceAddress(socket.AF_INET, "127.0.0.1", "255.0.0.0", None, None)],
+            "sim0": [InterfaceAddress(socket.AF_INET, "10.0.0.2", "255.255.0.0", None, None),
+                     InterfaceAddress(psutil.AF_LINK, "02:00:00:00:00:01", None, None, None)],
+        }
+
+    def processes(self):
+        rng = self.rng
+        # Only a slice of processes changes per call, which keeps large simulations cheap
+        for pid in rng.sample(list(self._processes), min(len(self._processes), 200)):
+            info = self._processes[pid]
+            info['cpu_percent'] = self._wander(info['cpu_percent'], 5)
+        return [dict(info) for info in self._processes.values()]
+
+    def connections(self):
+        return list(self._connections)
+
+    def process_name(self, pid):
+        info = self._processes.get(pid)
+        return info['name'] if info else None
+
+    def process_cmdline(self, pid):
+        info = self._processes.get(pid)
+        return f"/usr/bin/{info['name']} --simulated" if info else None
+
+    def process_details(self, pid):
+        info = self._processes.get(pid)
+        if info is None:
+            raise psutil.NoSuchProcess(pid)
+        return [
+            ("PID", pid),
+            ("Name", info['name']),
+            ("Executable", f"/usr/bin/{info['name']}"),
+            ("Command Line", f"/usr/bin/{info['name']} --simulated"),
+            ("Working Directory", "/"),
+            ("Status", info['status']),
+            ("User", info['username']),
+            ("CPU Usage", f"{info['cpu_percent']:.1f}%"),
+            ("Memory Usage", f"{info['memory_percent'] * self.memory_total / (1024 * 1024 * 100):.2f} MB"),
+            ("Open Files", 0),
+            ("Threads", info['num_threads']),
+        ]
+
+    def terminate(self, pid):
+        if self._processes.pop(pid, None) is None:
+            raise psutil.NoSuchProcess(pid)
+
+    def cgroups(self):
+        rng = self.rng
+        groups = {}
+        for path, counters in self._cgroup_counters.items():
+            counters[0] += rng.randrange(0, 1000000)
+            counters[1] = max(1024**2, counters[1] + rng.randrange(-8 * 1024**2, 8 * 1024**2))
+            counters[2] += rng.randrange(0, 4 * 1024**2)
+            counters[3] += rng.randrange(0, 4 * 1024**2)
+
+            # Like the kernel, parents account for all of their descendants
+            while True:
+                total = groups.setdefault(path, [0, 0, 0, 0])
+                for i, value in enumerate(counters):
+                    total[i] += value
+                if path == "/":
+                    break
+                path = os.path.dirname(path)
+        return {path: CgroupStats(*total) for path, total in groups.items()}
+
+    def process_cgroup(self, pid):
+        if pid not in self._processes:
+            return None
+        return self._cgroup_leaves[pid % len(self._cgroup_leaves)]
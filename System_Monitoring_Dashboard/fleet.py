@@ -0,0 +1,219 @@
+"""Fleet mode: stream dashboard snapshots from many hosts to one dashboard.
+
+A dashboard started with --serve HOST:PORT runs headless and publishes a
+snapshot of its collector (CPU, memory, network and disk rates) once a second
+to every connected client as newline-delimited JSON. The first message on a
+connection carries the full snapshot; after that each message only carries the
+fields whose rounded value changed, so an idle host costs a few bytes a second.
+
+    {"seq": 1, "full": true, "data": {"hostname": "web1", "cpu": 12.5, ...}}
+    {"seq": 2, "data": {"cpu": 14.0}}
+
+FleetClient keeps one persistent connection per host, all multiplexed on a
+single asyncio loop in a background thread, and reconnects with backoff. The
+UI drains only the hosts that changed since its last poll.
+"""
+import asyncio
+import json
+import socket
+import threading
+import time
+from collections import deque
+
+DEFAULT_PORT = 8765
+
+# Fields of a snapshot that are charted per host
+SNAPSHOT_FIELDS = ["cpu", "memory", "net_sent_kbs", "net_recv_kbs", "disk_read_kbs", "disk_write_kbs"]
+HISTORY_LENGTH = 60
+
+# A client whose unsent data grows past this is dropped; it resyncs on reconnect
+MAX_CLIENT_BUFFER = 1024 * 1024
+
+
+def parse_address(text):
+    """Split "host:port" (port optional) into (host, port)"""
+    host, separator, port = text.rpartition(":")
+    if not separator:
+        return text, DEFAULT_PORT
+    return host, int(port)
+
+
+def encode(message):
+    return (json.dumps(message, separators=(",", ":")) + "\n").encode()
+
+
+def diff_snapshot(previous, current):
+    """Return the fields of current whose value differs from previous"""
+    return {key: value for key, value in current.items() if previous.get(key) != value}
+
+
+class SnapshotSource:
+    """Turns a collector's counters into snapshots of percentages and rates"""
+    def __init__(self, collector):
+        self.collector = collector
+        self.hostname = socket.gethostname()
+        self.last_net = collector.net_io_counters()
+        self.last_disk = collector.disk_io_counters()
+        self.last_time = time.monotonic()
+
+    def take(self):
+        now = time.monotonic()
+        elapsed = max(now - self.last_time, 1e-6)
+        net = self.collector.net_io_counters()
+        disk = self.collector.disk_io_counters()
+
+        def kbs(current, last):
+            return round((current - last) / elapsed / 1024, 1)
+
+        # Values are rounded so that noise does not defeat the delta encoding
+        snapshot = {
+            "hostname": self.hostname,
+            "cpu": round(self.collector.cpu_percent(), 1),
+            "memory": round(self.collector.virtual_memory().percent, 1),
+            "net_sent_kbs": kbs(net.bytes_sent, self.last_net.bytes_sent),
+            "net_recv_kbs": kbs(net.bytes_recv, self.last_net.bytes_recv),
+            "disk_read_kbs": kbs(disk.read_bytes, self.last_disk.read_bytes),
+            "disk_write_kbs": kbs(disk.write_bytes, self.last_disk.write_bytes),
+        }
+        self.last_net, self.last_disk, self.last_time = net, disk, now
+        return snapshot
+
+
+class FleetServer:
+    """Publishes snapshots of a collector to every connected client"""
+    def __init__(self, collector, interval=1.0):
+        self.source = SnapshotSource(collector)
+        self.interval = interval
+        self.state = {}
+        self.seq = 0
+        self.clients = set()
+
+    async def handle(self, reader, writer):
+        writer.write(encode({"seq": self.seq, "full": True, "data": self.state}))
+        self.clients.add(writer)
+        try:
+            # Clients never send; whatever arrives is discarded in bounded reads until they disconnect
+            while await reader.read(4096):
+                pass
+        except OSError:
+            pass
+        finally:
+            self.clients.discard(writer)
+            writer.close()
+
+    def broadcast(self, snapshot):
+        delta = diff_snapshot(self.state, snapshot)
+        self.state = snapshot
+        self.seq += 1
+        line = encode({"seq": self.seq, "data": delta})
+        for writer in list(self.clients):
+            if writer.transport.get_write_buffer_size() > MAX_CLIENT_BUFFER:
+                # Too slow to keep up
+                self.clients.discard(writer)
+                writer.close()
+                continue
+            writer.write(line)
+
+    async def serve(self, host, port, on_ready=None):
+        """Publish until cancelled; on_ready gets the bound (host, port) addresses once listening"""
+        loop = asyncio.get_running_loop()
+        server = await asyncio.start_server(self.handle, host, port)
+        if on_ready is not None:
+            on_ready([sock.getsockname()[:2] for sock in server.sockets])
+        async with server:
+            deadline = loop.time()
+            while True:
+                # The first rates need a full interval of counter deltas
+                deadline = max(deadline + self.interval, loop.time())
+                await asyncio.sleep(deadline - loop.time())
+                # Collectors may block, so they run off the event loop
+                self.broadcast(await loop.run_in_executor(None, self.source.take))
+
+
+def serve(collector, address, on_ready=None):
+    """Run a snapshot server for collector on "host:port" until interrupted"""
+    host, port = parse_address(address)
+    asyncio.run(FleetServer(collector).serve(host, port, on_ready))
+
+
+class FleetClient:
+    """Follows the snapshot streams of many hosts from a background thread"""
+    def __init__(self, addresses, timeout=10.0, max_backoff=30.0):
+        self.timeout = timeout
+        self.max_backoff = max_backoff
+        self.hosts = {}
+        for address in addresses:
+            self.hosts[address] = {
+                "data": {},
+                "connected": False,
+                "updated": None,
+                "history": {field: deque([0] * HISTORY_LENGTH, maxlen=HISTORY_LENGTH)
+                            for field in SNAPSHOT_FIELDS},
+            }
+        self.dirty = set(self.hosts)
+        self.lock = threading.Lock()
+
+    def start(self):
+        threading.Thread(target=lambda: asyncio.run(self._follow_all()), name="fleet", daemon=True).start()
+
+    async def _follow_all(self):
+        await asyncio.gather(*(self._follow(address) for address in self.hosts), return_exceptions=True)
+
+    async def _follow(self, address):
+        """Keep one connection to address open, reconnecting with exponential backoff"""
+        host, port = parse_address(address)
+        backoff = 1.0
+        while True:
+            try:
+                reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), self.timeout)
+                try:
+                    seq = None
+                    while True:
+                        line = await asyncio.wait_for(reader.readline(), self.timeout)
+                        if not line:
+                            break
+                        message = json.loads(line)
+                        if not message.get("full") and (seq is None or message["seq"] != seq + 1):
+                            break  # Lost a delta; reconnect for a full snapshot
+                        seq = message["seq"]
+                        self._apply(address, message)
+                        backoff = 1.0
+                finally:
+                    writer.close()
+            except Exception:
+                # Unreachable host or a malformed stream; either way this host reconnects
+                # and the other hosts are not affected
+                pass
+            with self.lock:
+                if self.hosts[address]["connected"]:
+                    self.hosts[address]["connected"] = False
+                    self.dirty.add(address)
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, self.max_backoff)
+
+    def _apply(self, address, message):
+        with self.lock:
+            host = self.hosts[address]
+            if message.get("full"):
+                host["data"] = dict(message["data"])
+            else:
+                host["data"].update(message["data"])
+                # One history sample per server tick
+                for field in SNAPSHOT_FIELDS:
+                    host["history"][field].append(host["data"].get(field, 0))
+            host["connected"] = True
+            host["updated"] = time.time()
+            self.dirty.add(address)
+
+    def take_changes(self):
+        """Return {address: (connected, data)} for the hosts that changed since the last call"""
+        with self.lock:
+            changes = {address: (self.hosts[address]["connected"], dict(self.hosts[address]["data"]))
+                       for address in self.dirty}
+            self.dirty.clear()
+        return changes
+
+    def history(self, address):
+        """Return {field: [last HISTORY_LENGTH values]} for address"""
+        with self.lock:
+            return {field: list(values) for field, values in self.hosts[address]["history"].items()}
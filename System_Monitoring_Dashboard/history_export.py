@@ -0,0 +1,105 @@
+"""Streaming export of the dashboard's metric history.
+
+Samples are written in long format, one row per (timestamp, series, value), so
+any mix of series exports to a single file. Series are copied out of the
+history one at a time and written in chunks of chunk_size rows; only one series
+and one chunk are held in memory at once, however large the export.
+
+CSV and JSON lines are always available. Parquet needs pyarrow and is written
+one row group per chunk.
+"""
+import csv
+import json
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+FORMATS = {
+    "csv": ("CSV", ".csv"),
+    "jsonl": ("JSON lines", ".jsonl"),
+    "parquet": ("Parquet", ".parquet"),
+}
+
+
+def available_formats():
+    """Return the format keys that can be written in this environment"""
+    return [fmt for fmt in FORMATS if fmt != "parquet" or pa is not None]
+
+
+class ExportCancelled(Exception):
+    pass
+
+
+class CsvWriter:
+    def __init__(self, path):
+        self.file = open(path, "w", newline="")
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(("timestamp", "series", "value"))
+
+    def write(self, rows):
+        self.writer.writerows(rows)
+
+    def close(self):
+        self.file.close()
+
+
+class JsonlWriter:
+    def __init__(self, path):
+        self.file = open(path, "w")
+
+    def write(self, rows):
+        self.file.writelines(json.dumps({"timestamp": t, "series": name, "value": value}) + "\n"
+                             for t, name, value in rows)
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetWriter:
+    def __init__(self, path):
+        if pa is None:
+            raise RuntimeError("Parquet export needs pyarrow (pip install pyarrow)")
+        self.schema = pa.schema([("timestamp", pa.float64()), ("series", pa.string()), ("value", pa.float64())])
+        self.writer = pq.ParquetWriter(path, self.schema)
+
+    def write(self, rows):
+        timestamps, names, values = zip(*rows)
+        self.writer.write_table(pa.Table.from_arrays(
+            [pa.array(timestamps, pa.float64()), pa.array(names, pa.string()), pa.array(values, pa.float64())],
+            schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+WRITERS = {"csv": CsvWriter, "jsonl": JsonlWriter, "parquet": ParquetWriter}
+
+
+def export_history(history, names, path, fmt, start=None, end=None, chunk_size=10000,
+                   progress=None, cancel=None):
+    """Stream the samples of names between start and end (epoch seconds) to path
+
+    progress(series_done, series_total, rows_written) is called after every
+    chunk; setting the cancel event stops the export with ExportCancelled.
+    Returns the number of rows written.
+    """
+    writer = WRITERS[fmt](path)
+    written = 0
+    try:
+        for done, name in enumerate(names):
+            samples = history.range(name, start, end)
+            for offset in range(0, len(samples), chunk_size):
+                if cancel is not None and cancel.is_set():
+                    raise ExportCancelled(path)
+                writer.write([(t, name, value) for t, value in samples[offset:offset + chunk_size]])
+                written += min(chunk_size, len(samples) - offset)
+                if progress:
+                    progress(done, len(names), written)
+            if progress:
+                progress(done + 1, len(names), written)
+    finally:
+        writer.close()
+    return written
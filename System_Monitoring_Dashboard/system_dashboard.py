@@ -1,5 +1,5 @@
 import tkinter as tk
-from tkinter import ttk, scrolledtext
+from tkinter import ttk, scrolledtext, filedialog
 import threading
 import time
 import datetime
@@ -9,19 +9,634 @@ import os
 import subprocess
 import socket
 import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 import shutil
 from pathlib import Path
 import re
+import json
+import argparse
+import queue
+import heapq
+import bisect
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 
-class SystemDashboard(tk.Tk):
+try:
+    import pwd
+except ImportError:  # Windows
+    pwd = None
+
+from collectors import PsutilCollector, SimulatedCollector
+from history_export import FORMATS, ExportCancelled, available_formats, export_history
+import fleet
+
+# Sampling period used for views that are not on screen
+BACKGROUND_INTERVAL = 5
+
+# Seconds a partition usage refresh waits for slow mounts before showing them as stale
+DISK_USAGE_TIMEOUT = 2.0
+
+# Pressure stall (PSI) series charted on the CPU tab: (resource, kind, color)
+PRESSURE_FIELDS = [
+    ("cpu", "some", "#3E8ADE"),
+    ("io", "some", "#FFC107"),
+    ("io", "full", "#DC3545"),
+    ("memory", "some", "#28A745"),
+    ("memory", "full", "#6A0DAD"),
+]
+
+# avg10 levels (%) above which contention is logged
+PRESSURE_ALERTS = {("cpu", "some"): 25, ("io", "full"): 10, ("memory", "full"): 10}
+
+# File age buckets of the directory analyzer, by time since last modification
+AGE_BUCKETS = [
+    (86400, "< 1 day"),
+    (7 * 86400, "< 1 week"),
+    (30 * 86400, "< 30 days"),
+    (365 * 86400, "< 1 year"),
+    (float("inf"), ">= 1 year"),
+]
+
+# Rows of the Memory tab's top-N list, and how long a PSS/USS reading stays fresh
+TOP_MEMORY_PROCESSES = 100
+PROCESS_MEMORY_TTL = 30
+
+# Time ranges offered by the history export dialog, in seconds (None exports everything)
+EXPORT_RANGES = {
+    "Last 5 minutes": 300,
+    "Last 15 minutes": 900,
+    "Last hour": 3600,
+    "Everything": None,
+}
+
+# CPU time categories charted on the CPU tab, with their colors
+CPU_TIME_FIELDS = [
+    ("user", "#3E8ADE"),
+    ("system", "#DC3545"),
+    ("iowait", "#FFC107"),
+    ("steal", "#6A0DAD"),
+    ("irq", "#28A745"),
+]
+
+
+class Sampler:
+    """Drift-free tick scheduler that measures its own cost and backs off on overruns
+    
+    Ticks are scheduled against the monotonic clock. When a tick (collection plus
+    drawing) takes longer than its budget the interval doubles, up to max_interval,
+    and it relaxes back towards the base interval once ticks are cheap again.
+    """
+    def __init__(self, name, interval, budget=None, max_interval=None):
+        self.name = name
+        self.base_interval = interval
+        self.interval = interval
+        self.budget = budget if budget is not None else interval / 2
+        self.max_interval = max_interval if max_interval is not None else interval * 8
+        
+        self.last_tick = time.monotonic()
+        self.deadline = self.last_tick
+        self.elapsed = 0.0  # True time since the previous tick
+        self.cost = 0.0  # Time spent inside the last tick
+        self.rate = 0.0  # Achieved ticks per second
+    
+    def begin(self):
+        """Start a tick and return the seconds elapsed since the previous one"""
+        now = time.monotonic()
+        self.elapsed = now - self.last_tick
+        self.rate = 1 / self.elapsed if self.elapsed > 0 else 0.0
+        self.last_tick = now
+        return self.elapsed
+    
+    def end(self):
+        """Finish a tick; returns True if the interval had to be backed off"""
+        self.cost = time.monotonic() - self.last_tick
+        if self.cost > self.budget and self.interval < self.max_interval:
+            self.interval = min(self.interval * 2, self.max_interval)
+            return True
+        if self.cost < self.budget / 2 and self.interval > self.base_interval:
+            self.interval = max(self.interval * 0.75, self.base_interval)
+        return False
+    
+    def delay(self, interval=None):
+        """Advance the schedule by one period and return the seconds left until it"""
+        now = time.monotonic()
+        period = max(interval or 0, self.interval)
+        self.deadline += period
+        if self.deadline < now:
+            # Missed ticks are dropped rather than run back to back
+            self.deadline = now + period
+        return self.deadline - now
+    
+    def snapshot(self):
+        return {
+            "interval": self.interval,
+            "elapsed": self.elapsed,
+            "cost": self.cost,
+            "rate": self.rate,
+        }
+
+
+class MetricHistory:
+    """Thread-safe store of timestamped samples, one bounded series per metric"""
+    def __init__(self, maxlen=3600):
+        self.maxlen = maxlen
+        self._series = {}
+        self._lock = threading.Lock()
+    
+    def append(self, name, value, timestamp=None):
+        if timestamp is None:
+            timestamp = time.time()
+        with self._lock:
+            series = self._series.get(name)
+            if series is None:
+                series = self._series[name] = deque(maxlen=self.maxlen)
+            series.append((timestamp, value))
+    
+    def names(self):
+        with self._lock:
+            return sorted(self._series)
+    
+    def series(self, name):
+        """Return a copy of the (timestamp, value) samples recorded for name"""
+        with self._lock:
+            return list(self._series.get(name, ()))
+    
+    def range(self, name, start=None, end=None):
+        """Return a copy of the samples of name with start <= timestamp <= end"""
+        with self._lock:
+            return [(t, value) for t, value in self._series.get(name, ())
+                    if (start is None or t >= start) and (end is None or t <= end)]
+
+
+class RingBuffer2D:
+    """Fixed-size rows x columns ring buffer; each push writes one column (e.g. cores x time)"""
+    def __init__(self, rows, columns):
+        self.rows = rows
+        self.columns = columns
+        self.data = np.zeros((rows, columns), dtype=np.float32)
+        self.index = 0  # Column the next push writes
+    
+    def push(self, column):
+        self.data[:, self.index] = column
+        self.index = (self.index + 1) % self.columns
+    
+    def ordered(self):
+        """Return the buffer with the oldest column first"""
+        return np.concatenate((self.data[:, self.index:], self.data[:, :self.index]), axis=1)
+
+
+class PartitionUsagePool:
+    """Collects partition usage on daemon worker threads with a timeout per mount
+    
+    A mount that does not answer in time (a stale NFS/SSHFS mount, for example) is
+    reported as stale with its last known value. It keeps at most one worker busy
+    and is not queried again until that request returns; a replacement worker is
+    started for it so that hung mounts cannot starve the healthy ones.
+    """
+    def __init__(self, collector, workers=4, timeout=DISK_USAGE_TIMEOUT):
+        self.collector = collector
+        self.workers = workers
+        self.timeout = timeout
+        self.cache = {}  # mountpoint -> last usage
+        self.pending = {}  # mountpoint with a request in flight -> monotonic start time (None while queued)
+        self.failed = set()  # mountpoints that could not be read
+        self.threads = 0
+        self._queue = queue.Queue()
+        self._cond = threading.Condition()
+        
+        with self._cond:
+            self._ensure_workers()
+    
+    def _ensure_workers(self):
+        """Keep `workers` threads free of hung mounts; called with the condition held"""
+        now = time.monotonic()
+        hung = sum(1 for started in self.pending.values() if started is not None and now - started > self.timeout)
+        while self.threads - hung < self.workers:
+            # Daemon threads so a hung mount cannot block interpreter exit
+            threading.Thread(target=self._worker, name=f"disk-usage-{self.threads}", daemon=True).start()
+            self.threads += 1
+    
+    def _worker(self):
+        while True:
+            mountpoint = self._queue.get()
+            with self._cond:
+                self.pending[mountpoint] = time.monotonic()
+            usage = None
+            try:
+                usage = self.collector.disk_usage(mountpoint)
+            except Exception:
+                # Any failure marks the mount unreadable; the worker must survive it
+                pass
+            finally:
+                with self._cond:
+                    self.pending.pop(mountpoint, None)
+                    if usage is None:
+                        self.failed.add(mountpoint)
+                    else:
+                        self.failed.discard(mountpoint)
+                        self.cache[mountpoint] = usage
+                    self._cond.notify_all()
+    
+    def collect(self, mountpoints):
+        """Return {mountpoint: (usage or None, stale)}, waiting at most timeout seconds
+        
+        Mounts that could not be read at all are left out.
+        """
+        deadline = time.monotonic() + self.timeout
+        with self._cond:
+            self._ensure_workers()
+            requested = []
+            for mountpoint in mountpoints:
+                if mountpoint not in self.pending:
+                    self.pending[mountpoint] = None
+                    self._queue.put(mountpoint)
+                    requested.append(mountpoint)
+            
+            while any(mountpoint in self.pending for mountpoint in requested):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            
+            results = {}
+            for mountpoint in mountpoints:
+                if mountpoint in self.failed and mountpoint not in self.pending:
+                    continue
+                results[mountpoint] = (self.cache.get(mountpoint), mountpoint in self.pending)
+            return results
+
+
+class Profiler:
+    """Timings of the dashboard's own collectors, chart redraws and Treeview refreshes"""
+    def __init__(self, maxlen=1000):
+        self.maxlen = maxlen
+        self._timings = {}
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def timed(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+    
+    def record(self, name, seconds):
+        with self._lock:
+            samples = self._timings.get(name)
+            if samples is None:
+                samples = self._timings[name] = deque(maxlen=self.maxlen)
+            samples.append(seconds)
+    
+    def reset(self):
+        with self._lock:
+            self._timings.clear()
+    
+    def summary(self):
+        """Return {section: {count, p50, p95, p99, max}} with times in milliseconds"""
+        with self._lock:
+            timings = {name: sorted(samples) for name, samples in self._timings.items()}
+        
+        result = {}
+        for name, samples in sorted(timings.items()):
+            def percentile(p):
+                return samples[min(len(samples) - 1, int(round(p / 100 * (len(samples) - 1))))] * 1000
+            result[name] = {
+                "count": len(samples),
+                "p50": percentile(50),
+                "p95": percentile(95),
+                "p99": percentile(99),
+                "max": samples[-1] * 1000,
+            }
+        return result
+    
+    def dump(self, path, process_stats=None):
+        """Write the summary to a JSON file for comparison between versions"""
+        report = {
+            "created": datetime.datetime.now().isoformat(timespec="seconds"),
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "process": process_stats or {},
+            "sections": self.summary(),
+        }
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+def render_history_plot(plot, ylabel, ymax, lines):
+    """Redraw a 60-sample history chart; lines are (values, color, label) tuples"""
+    plot.clear()
+    plot.set_facecolor("#2E2E2E")
+    plot.tick_params(colors="#FFFFFF")
+    plot.set_xlim(0, 60)
+    plot.set_ylim(0, ymax)
+    # Not seconds: hidden views sample every BACKGROUND_INTERVAL, and samplers back off under load
+    plot.set_xlabel("Samples", color="#FFFFFF")
+    plot.set_ylabel(ylabel, color="#FFFFFF")
+    
+    for values, color, label in lines:
+        plot.plot(range(60), values, color=color, linewidth=2, label=label)
+        plot.fill_between(range(60), values, color=color, alpha=0.2)
+    
+    if any(label for _, _, label in lines):
+        plot.legend(loc="upper right", facecolor="#2E2E2E", labelcolor="#FFFFFF")
+
+
+def collect_processes(collector):
+    """Return one dict per running process for the Processes tab"""
+    total_memory = collector.virtual_memory().total
+    processes = []
+    for pinfo in collector.processes():
+        # Get memory in MB
+        memory_mb = (pinfo['memory_percent'] or 0) * total_memory / (1024 * 1024 * 100)
+        create_time = datetime.datetime.fromtimestamp(pinfo['create_time']).strftime('%Y-%m-%d %H:%M:%S')
+        processes.append({
+            'pid': pinfo['pid'],
+            'name': pinfo['name'],
+            'user': pinfo['username'],
+            'cpu': pinfo['cpu_percent'],
+            'memory': f"{memory_mb:.2f} MB",
+            'memory_value': memory_mb,
+            'status': pinfo['status'],
+            'threads': pinfo['num_threads'],
+            'created': create_time
+        })
+    return processes
+
+
+# Ascending sort keys of the Processes tab; CPU and memory sort largest first
+PROCESS_SORT_KEYS = {
+    "CPU": lambda x: -(x['cpu'] or 0),
+    "Memory": lambda x: -x['memory_value'],
+    "Name": lambda x: x['name'].lower(),
+    "PID": lambda x: x['pid'],
+}
+
+# Sort keys whose value never changes during the life of a process
+STATIC_SORT_KEYS = {"Name", "PID"}
+
+
+def sort_processes(processes, sort_by):
+    """Sort process dicts in place by one of the Processes tab sort keys"""
+    if sort_by in PROCESS_SORT_KEYS:
+        processes.sort(key=PROCESS_SORT_KEYS[sort_by])
+
+
+class ProcessIndex:
+    """Sorted, searchable view of the processes, updated incrementally from each sweep
+    
+    The search text of a process (PID, name and user) is built once, when the
+    process first appears, so a sweep only looks up new processes. Command
+    lines cost a read per process, so they are only fetched, off the Tk thread,
+    once the filter is used, and appended through add_cmdlines. The sort order
+    is carried over between sweeps: for static keys exited processes are
+    dropped and new ones inserted with bisect, and for CPU/memory the previous
+    order is re-sorted, which Timsort does in close to linear time because it
+    is already nearly sorted. A query that extends the previous one only
+    re-checks the previous matches.
+    """
     def __init__(self):
+        self.processes = {}  # (pid, created) -> process dict of the latest sweep
+        self.search_text = {}  # (pid, created) -> lowercase search text
+        self.without_cmdline = set()  # keys whose command line has not been requested yet
+        self.order = []  # (sort value, key) in sort order
+        self.sort_by = None
+        self.version = 0  # Bumped whenever the order changes
+        self._last_search = ("", -1, None)  # (query, version, matching keys)
+    
+    def update(self, processes, sort_by):
+        """Merge a process sweep into the index and restore the sort order"""
+        current = {}
+        for proc in processes:
+            key = (proc['pid'], proc['created'])  # Guards against pid reuse
+            current[key] = proc
+            if key not in self.search_text:
+                self.search_text[key] = f"{proc['pid']} {proc['name']} {proc['user'] or ''}".lower()
+                self.without_cmdline.add(key)
+        gone = self.processes.keys() - current.keys()
+        new = current.keys() - self.processes.keys()
+        for key in gone:
+            del self.search_text[key]
+            self.without_cmdline.discard(key)
+        self.processes = current
+        
+        sort_key = PROCESS_SORT_KEYS[sort_by]
+        if sort_by != self.sort_by:
+            self.order = sorted((sort_key(proc), key) for key, proc in current.items())
+        elif sort_by in STATIC_SORT_KEYS:
+            if gone:
+                self.order = [entry for entry in self.order if entry[1] not in gone]
+            for key in new:
+                bisect.insort(self.order, (sort_key(current[key]), key))
+        else:
+            self.order = [(sort_key(current[key]), key) for _, key in self.order if key in current]
+            self.order.extend((sort_key(current[key]), key) for key in new)
+            self.order.sort()
+        self.sort_by = sort_by
+        self.version += 1
+    
+    def take_cmdline_requests(self):
+        """Return the keys whose command line is still missing, marking them as requested"""
+        keys = list(self.without_cmdline)
+        self.without_cmdline.clear()
+        return keys
+    
+    def add_cmdlines(self, cmdlines):
+        """Append {key: command line or None} to the search text of processes still running"""
+        for key, cmdline in cmdlines.items():
+            if cmdline and key in self.search_text:
+                self.search_text[key] += " " + cmdline.lower()
+        self.version += 1  # Earlier matches may have missed these processes
+    
+    def search(self, query):
+        """Return the process dicts matching every word of query, in sort order"""
+        query = query.strip().lower()
+        if not query:
+            self._last_search = ("", self.version, None)
+            return [self.processes[key] for _, key in self.order]
+        
+        last_query, version, last_keys = self._last_search
+        if last_keys is not None and version == self.version and query.startswith(last_query):
+            candidates = last_keys  # Narrowing the previous query
+        else:
+            candidates = [key for _, key in self.order]
+        
+        text = self.search_text
+        terms = query.split()
+        if len(terms) == 1:
+            term = terms[0]
+            keys = [key for key in candidates if term in text[key]]
+        else:
+            keys = [key for key in candidates if all(term in text[key] for term in terms)]
+        self._last_search = (query, self.version, keys)
+        return [self.processes[key] for key in keys]
+
+
+def collect_connections(collector):
+    """Return Treeview rows for the active inet connections"""
+    rows = []
+    for conn in collector.connections():
+        # Format addresses
+        laddr = f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else "-"
+        raddr = f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else "-"
+        
+        # Get process name
+        proc_name = "-"
+        if conn.pid:
+            proc_name = collector.process_name(conn.pid) or "-"
+        
+        rows.append((conn.type, laddr, raddr, conn.status, conn.pid or "-", proc_name))
+    return rows
+
+
+def sensor_readings(temperatures, fans):
+    """Flatten psutil-shaped sensor dicts into (name, value, unit, high, critical) rows"""
+    readings = []
+    for unit, sensors in (("°C", temperatures), ("RPM", fans)):
+        for chip, entries in sensors.items():
+            for i, entry in enumerate(entries):
+                name = f"{chip}/{entry.label or i}"
+                readings.append((name, entry.current, unit,
+                                 getattr(entry, "high", None), getattr(entry, "critical", None)))
+    return readings
+
+
+def cgroup_rates(previous, current, elapsed):
+    """Turn two cgroup samples into {path: (cpu %, memory MB, read KB/s, write KB/s)}
+    
+    CPU percent is relative to one core. Groups that are new since the previous
+    sample report zero rates; fields the group does not account are None.
+    """
+    rates = {}
+    for path, stats in current.items():
+        before = previous.get(path)
+        
+        def rate(field, scale):
+            value = getattr(stats, field)
+            if value is None:
+                return None
+            last = getattr(before, field) if before is not None else None
+            if last is None or elapsed <= 0:
+                return 0.0
+            # A recreated group restarts its counters
+            return max(0, value - last) / elapsed / scale
+        
+        memory = stats.memory_current / (1024 * 1024) if stats.memory_current is not None else None
+        rates[path] = (rate("cpu_usage_usec", 1e4), memory,
+                       rate("io_read_bytes", 1024), rate("io_write_bytes", 1024))
+    return rates
+
+
+def cgroup_display_name(path):
+    """Last component of a cgroup path with container IDs shortened to 12 characters"""
+    name = path.rsplit("/", 1)[-1] or "/"
+    return re.sub(r"[0-9a-f]{64}", lambda match: match.group()[:12], name)
+
+
+DirectoryScan = namedtuple("DirectoryScan", ["total_size", "subdirs", "largest_files",
+                                             "by_extension", "by_age", "by_owner"])
+
+
+def format_size(size):
+    if size > 1024**3:
+        return f"{size / 1024**3:.2f} GB"
+    elif size > 1024**2:
+        return f"{size / 1024**2:.2f} MB"
+    return f"{size / 1024:.2f} KB"
+
+
+def scan_directory(path, largest=20):
+    """Walk path once and return a DirectoryScan
+    
+    Besides the total size and the size of each subdirectory, the same walk
+    keeps a bounded heap of the largest files and histograms ({key: [files,
+    bytes]}) by extension, age bucket and owner. Symlinks are not followed.
+    """
+    now = time.time()
+    total_size = 0
+    subdir_sizes = {}
+    heap = []  # (size, path) min-heap of the largest files
+    by_extension, by_age, by_uid = {}, {}, {}
+    
+    def count(histogram, key, size):
+        bucket = histogram.get(key)
+        if bucket is None:
+            bucket = histogram[key] = [0, 0]
+        bucket[0] += 1
+        bucket[1] += size
+    
+    # Each directory carries the top-level subdirectory its sizes are credited to
+    stack = [(path, None)]
+    while stack:
+        dirpath, top = stack.pop()
+        try:
+            entries = os.scandir(dirpath)
+        except OSError:
+            continue  # Can't access
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if top is None:
+                            subdir_sizes[entry.name] = 0
+                        stack.append((entry.path, top if top is not None else entry.name))
+                        continue
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    stat = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                
+                size = stat.st_size
+                total_size += size
+                if top is not None:
+                    subdir_sizes[top] += size
+                
+                if len(heap) < largest:
+                    heapq.heappush(heap, (size, entry.path, stat.st_mtime))
+                elif size > heap[0][0]:
+                    heapq.heapreplace(heap, (size, entry.path, stat.st_mtime))
+                
+                count(by_extension, os.path.splitext(entry.name)[1].lower() or "(none)", size)
+                age = now - stat.st_mtime
+                count(by_age, next(label for limit, label in AGE_BUCKETS if age < limit), size)
+                count(by_uid, stat.st_uid, size)
+    
+    # Owner names are only resolved for the uids seen
+    by_owner = {}
+    for uid, bucket in by_uid.items():
+        name = str(uid)
+        if pwd is not None:
+            try:
+                name = pwd.getpwuid(uid).pw_name
+            except KeyError:
+                pass
+        by_owner[name] = bucket
+    
+    # Sort subdirectories by size
+    subdirs = sorted(subdir_sizes.items(), key=lambda x: x[1], reverse=True)
+    return DirectoryScan(total_size, subdirs, sorted(heap, reverse=True), by_extension, by_age, by_owner)
+
+
+class SystemDashboard(tk.Tk):
+    def __init__(self, collector=None, fleet_hosts=None):
         super().__init__()
         self.title("System Monitoring Dashboard")
         self.geometry("1200x800")
         self.configure(bg="#2E2E2E")
         
+        # Source of all system metrics
+        self.collector = collector or PsutilCollector()
+        
+        # Remote dashboards followed on the Fleet tab
+        self.fleet_client = fleet.FleetClient(fleet_hosts) if fleet_hosts else None
+        self.fleet_rows = {}  # address -> row values, for sorting
+        self.fleet_sort = ("host", False)
+        self.fleet_windows = {}
+        
         # Data storage
         self.cpu_history = [0] * 60
         self.memory_history = [0] * 60
@@ -29,11 +644,66 @@ class SystemDashboard(tk.Tk):
         self.net_recv_history = [0] * 60
         self.disk_read_history = [0] * 60
         self.disk_write_history = [0] * 60
+        self.swap_in_history = [0] * 60
+        self.swap_out_history = [0] * 60
+        self.core_history = RingBuffer2D(self.collector.cpu_count() or 1, 60)
+        self.cpu_times_history = {field: [0] * 60 for field, _ in CPU_TIME_FIELDS}
+        self.pressure_history = {(resource, kind): [0] * 60 for resource, kind, _ in PRESSURE_FIELDS}
+        self.load_history = [0] * 60
+        self.pressure_alerts = set()  # PRESSURE_ALERTS keys currently above their level
+        self.history = MetricHistory()
+        self.partition_pool = PartitionUsagePool(self.collector)
+        self.partition_rows = {}
+        self.last_cgroups = {}
+        self.sensor_extremes = {}  # sensor name -> [min, max] since start
+        self.last_memory_details = None
+        
+        # PSS/USS is expensive per process: looked up on a pool, only for rows on screen
+        self.process_memory_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="process-memory")
+        self.process_memory_cache = {}  # (pid, created) -> (ProcessMemory or None, monotonic time)
+        self.process_memory_pending = set()
+        self.memory_rows = {}  # Treeview item -> (pid, created)
+        self.process_cgroups = {}  # (pid, created) -> cgroup path
+        self.process_index = ProcessIndex()
+        self.profiler = Profiler()
+        self.own_process = psutil.Process()
+        self.own_process.cpu_percent()  # Prime the CPU counter
+        
+        # View visibility (only the selected tab of a non-minimized window is visible)
+        self.visible_view = "overview"
+        self.minimized = False
+        self.record_hidden = False
+        self.view_events = {view: threading.Event() for view in ("overview", "processes", "network", "disk",
+                                                            "memory", "containers", "fleet", "self")}
+        self.view_events["cpu"] = self.view_events["overview"]  # Both are drawn by update_cpu_memory
+        self.view_events["sensors"] = self.view_events["overview"]  # Both are drawn by update_status
+        self._connections_job = None
+        self._disk_usage_job = None
+        self._self_stats_job = None
+        self._fleet_job = None
+        self._top_memory_job = None
+        self.export_cancel = None  # Set while an export runs
         
         # Network info for tracking
-        self.last_net_io = psutil.net_io_counters()
-        self.last_disk_io = psutil.disk_io_counters(perdisk=False)
-        self.last_update_time = time.time()
+        self.last_net_io = self.collector.net_io_counters()
+        self.last_disk_io = self.collector.disk_io_counters()
+        
+        # Samplers for each monitor loop
+        self.samplers = {
+            "system_info": Sampler("system_info", 30, budget=2),
+            "cpu_memory": Sampler("cpu_memory", 1),
+            "network": Sampler("network", 1),
+            "disk": Sampler("disk", 1),
+            "memory": Sampler("memory", 2, budget=0.5),
+            "top_memory": Sampler("top_memory", 10, budget=1),
+            "status": Sampler("status", 5, budget=1),
+            "connections": Sampler("connections", 10, budget=1),
+            # A tick may wait DISK_USAGE_TIMEOUT for slow mounts; only time beyond that counts as an overrun
+            "disk_usage": Sampler("disk_usage", 30, budget=DISK_USAGE_TIMEOUT + 2),
+            "cgroups": Sampler("cgroups", 2, budget=1),
+            "self": Sampler("self", 2, budget=0.5),
+            "fleet": Sampler("fleet", 1, budget=0.5),
+        }
         
         # Setup UI
         self.setup_ui()
@@ -68,20 +738,57 @@ class SystemDashboard(tk.Tk):
         
         # Create tabs
         self.overview_tab = ttk.Frame(self.notebook)
+        self.cpu_tab = ttk.Frame(self.notebook)
+        self.memory_tab = ttk.Frame(self.notebook)
         self.processes_tab = ttk.Frame(self.notebook)
         self.network_tab = ttk.Frame(self.notebook)
         self.disk_tab = ttk.Frame(self.notebook)
+        self.containers_tab = ttk.Frame(self.notebook)
+        self.sensors_tab = ttk.Frame(self.notebook)
+        self.fleet_tab = ttk.Frame(self.notebook)
+        self.self_tab = ttk.Frame(self.notebook)
         
         self.notebook.add(self.overview_tab, text="Overview")
+        self.notebook.add(self.cpu_tab, text="CPU")
+        self.notebook.add(self.memory_tab, text="Memory")
         self.notebook.add(self.processes_tab, text="Processes")
         self.notebook.add(self.network_tab, text="Network")
         self.notebook.add(self.disk_tab, text="Disk")
+        self.notebook.add(self.containers_tab, text="Containers")
+        self.notebook.add(self.sensors_tab, text="Sensors")
+        if self.fleet_client:
+            self.notebook.add(self.fleet_tab, text="Fleet")
+        self.notebook.add(self.self_tab, text="Self")
+        self.tab_views = {
+            str(self.overview_tab): "overview",
+            str(self.cpu_tab): "cpu",
+            str(self.memory_tab): "memory",
+            str(self.processes_tab): "processes",
+            str(self.network_tab): "network",
+            str(self.disk_tab): "disk",
+            str(self.containers_tab): "containers",
+            str(self.sensors_tab): "sensors",
+            str(self.fleet_tab): "fleet",
+            str(self.self_tab): "self",
+        }
+        
+        # Track which view is on screen
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_visibility_changed)
+        self.bind("<Unmap>", self.on_visibility_changed)
+        self.bind("<Map>", self.on_visibility_changed)
         
         # Set up each tab
         self.setup_overview_tab()
+        self.setup_cpu_tab()
+        self.setup_memory_tab()
         self.setup_processes_tab()
         self.setup_network_tab()
         self.setup_disk_tab()
+        self.setup_containers_tab()
+        self.setup_sensors_tab()
+        if self.fleet_client:
+            self.setup_fleet_tab()
+        self.setup_self_tab()
         
         # Setup console output at the bottom
         self.setup_console()
@@ -114,7 +821,7 @@ class SystemDashboard(tk.Tk):
         self.cpu_plot.tick_params(colors="#FFFFFF")
         self.cpu_plot.set_xlim(0, 60)
         self.cpu_plot.set_ylim(0, 100)
-        self.cpu_plot.set_xlabel("Time (s)", color="#FFFFFF")
+        self.cpu_plot.set_xlabel("Samples", color="#FFFFFF")
         self.cpu_plot.set_ylabel("CPU %", color="#FFFFFF")
         
         self.cpu_canvas = FigureCanvasTkAgg(self.cpu_figure, cpu_frame)
@@ -140,7 +847,7 @@ class SystemDashboard(tk.Tk):
         self.memory_plot.tick_params(colors="#FFFFFF")
         self.memory_plot.set_xlim(0, 60)
         self.memory_plot.set_ylim(0, 100)
-        self.memory_plot.set_xlabel("Time (s)", color="#FFFFFF")
+        self.memory_plot.set_xlabel("Samples", color="#FFFFFF")
         self.memory_plot.set_ylabel("Memory %", color="#FFFFFF")
         
         self.memory_canvas = FigureCanvasTkAgg(self.memory_figure, memory_frame)
@@ -182,6 +889,147 @@ class SystemDashboard(tk.Tk):
                                               orient=tk.HORIZONTAL, length=100, mode="determinate")
         self.battery_progress.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=5, pady=5)
     
+    def setup_cpu_tab(self):
+        # Per-core load heatmap (cores x time)
+        heatmap_frame = ttk.LabelFrame(self.cpu_tab, text="Per-Core Load")
+        heatmap_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        self.heatmap_figure = Figure(figsize=(5, 3), dpi=100, facecolor="#2E2E2E")
+        self.heatmap_plot = self.heatmap_figure.add_subplot(111)
+        self.heatmap_plot.tick_params(colors="#FFFFFF")
+        self.heatmap_plot.set_xlabel("Samples", color="#FFFFFF")
+        self.heatmap_plot.set_ylabel("Core", color="#FFFFFF")
+        
+        # One image for all cores, so the redraw cost does not grow with the core count
+        self.heatmap_image = self.heatmap_plot.imshow(
+            self.core_history.ordered(), aspect="auto", origin="lower", cmap="inferno",
+            vmin=0, vmax=100, interpolation="nearest", extent=(0, 60, -0.5, self.core_history.rows - 0.5))
+        colorbar = self.heatmap_figure.colorbar(self.heatmap_image, ax=self.heatmap_plot)
+        colorbar.ax.tick_params(colors="#FFFFFF")
+        
+        self.heatmap_canvas = FigureCanvasTkAgg(self.heatmap_figure, heatmap_frame)
+        self.heatmap_canvas.draw()
+        self.heatmap_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        self.core_balance = ttk.Label(heatmap_frame, text="Busiest core: - | Spread: -")
+        self.core_balance.pack(anchor=tk.W, padx=5, pady=5)
+        
+        # CPU time breakdown
+        breakdown_frame = ttk.LabelFrame(self.cpu_tab, text="CPU Time Breakdown")
+        breakdown_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        self.breakdown_figure = Figure(figsize=(5, 2), dpi=100, facecolor="#2E2E2E")
+        self.breakdown_plot = self.breakdown_figure.add_subplot(111)
+        self.breakdown_plot.set_facecolor("#2E2E2E")
+        self.breakdown_plot.tick_params(colors="#FFFFFF")
+        self.breakdown_plot.set_xlim(0, 60)
+        self.breakdown_plot.set_ylim(0, 100)
+        self.breakdown_plot.set_xlabel("Samples", color="#FFFFFF")
+        self.breakdown_plot.set_ylabel("%", color="#FFFFFF")
+        
+        # Lines are created once and updated with set_ydata
+        self.breakdown_lines = {}
+        for field, color in CPU_TIME_FIELDS:
+            self.breakdown_lines[field], = self.breakdown_plot.plot(
+                range(60), self.cpu_times_history[field], color=color, linewidth=1.5, label=field)
+        self.breakdown_plot.legend(loc="upper right", facecolor="#2E2E2E", labelcolor="#FFFFFF", ncol=len(CPU_TIME_FIELDS))
+        
+        self.breakdown_canvas = FigureCanvasTkAgg(self.breakdown_figure, breakdown_frame)
+        self.breakdown_canvas.draw()
+        self.breakdown_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        self.breakdown_label = ttk.Label(breakdown_frame, text="")
+        self.breakdown_label.pack(anchor=tk.W, padx=5, pady=5)
+        
+        # Pressure stall information and load average, charted together
+        pressure_frame = ttk.LabelFrame(self.cpu_tab, text="Pressure and Load")
+        pressure_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        self.pressure_figure = Figure(figsize=(5, 2), dpi=100, facecolor="#2E2E2E")
+        self.pressure_plot = self.pressure_figure.add_subplot(111)
+        self.pressure_plot.set_facecolor("#2E2E2E")
+        self.pressure_plot.tick_params(colors="#FFFFFF")
+        self.pressure_plot.set_xlim(0, 60)
+        self.pressure_plot.set_ylim(0, 10)
+        self.pressure_plot.set_xlabel("Samples", color="#FFFFFF")
+        self.pressure_plot.set_ylabel("Stalled % (avg10)", color="#FFFFFF")
+        
+        self.pressure_lines = {}
+        for resource, kind, color in PRESSURE_FIELDS:
+            self.pressure_lines[(resource, kind)], = self.pressure_plot.plot(
+                range(60), self.pressure_history[(resource, kind)], color=color, linewidth=1.5,
+                label=f"{resource} {kind}")
+        
+        # Load average on its own axis, dashed
+        self.load_plot = self.pressure_plot.twinx()
+        self.load_plot.tick_params(colors="#FFFFFF")
+        self.load_plot.set_ylabel("Load (1 min)", color="#FFFFFF")
+        self.load_line, = self.load_plot.plot(range(60), self.load_history, color="#FFFFFF",
+                                              linewidth=1, linestyle="--", label="load")
+        handles = list(self.pressure_lines.values()) + [self.load_line]
+        self.pressure_plot.legend(handles=handles, loc="upper left", facecolor="#2E2E2E", labelcolor="#FFFFFF",
+                                  ncol=len(handles), fontsize=7)
+        
+        self.pressure_canvas = FigureCanvasTkAgg(self.pressure_figure, pressure_frame)
+        self.pressure_canvas.draw()
+        self.pressure_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        self.pressure_label = ttk.Label(pressure_frame, text="")
+        self.pressure_label.pack(anchor=tk.W, padx=5, pady=5)
+    
+    def setup_memory_tab(self):
+        # Where the memory goes
+        breakdown_frame = ttk.LabelFrame(self.memory_tab, text="Memory Breakdown")
+        breakdown_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        self.memory_breakdown = ttk.Label(breakdown_frame, text="Loading memory information...")
+        self.memory_breakdown.pack(anchor=tk.W, padx=5, pady=5)
+        
+        self.memory_pressure = ttk.Label(breakdown_frame, text="")
+        self.memory_pressure.pack(anchor=tk.W, padx=5, pady=5)
+        
+        # Swap activity
+        swap_frame = ttk.LabelFrame(self.memory_tab, text="Swap Activity")
+        swap_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        self.swap_figure = Figure(figsize=(5, 2), dpi=100, facecolor="#2E2E2E")
+        self.swap_plot = self.swap_figure.add_subplot(111)
+        self.swap_plot.set_facecolor("#2E2E2E")
+        self.swap_plot.tick_params(colors="#FFFFFF")
+        self.swap_plot.set_xlim(0, 60)
+        self.swap_plot.set_ylabel("KB/s", color="#FFFFFF")
+        
+        self.swap_canvas = FigureCanvasTkAgg(self.swap_figure, swap_frame)
+        self.swap_canvas.draw()
+        self.swap_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        # Top processes by memory, with PSS/USS filled in lazily for the rows on screen
+        top_frame = ttk.LabelFrame(self.memory_tab, text="Top Processes by Memory")
+        top_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        columns = ("pid", "name", "rss", "pss", "uss")
+        self.memory_tree = ttk.Treeview(top_frame, columns=columns, show="headings", height=10)
+        self.memory_tree.heading("pid", text="PID")
+        self.memory_tree.heading("name", text="Name")
+        self.memory_tree.heading("rss", text="RSS")
+        self.memory_tree.heading("pss", text="PSS")
+        self.memory_tree.heading("uss", text="USS")
+        self.memory_tree.column("pid", width=70)
+        self.memory_tree.column("name", width=200)
+        for column in ("rss", "pss", "uss"):
+            self.memory_tree.column(column, width=100, anchor=tk.E)
+        
+        scrollbar = ttk.Scrollbar(top_frame, orient=tk.VERTICAL, command=self.memory_tree.yview)
+        
+        def on_scroll(first, last):
+            scrollbar.set(first, last)
+            self.request_process_memory()
+        
+        self.memory_tree.configure(yscrollcommand=on_scroll)
+        
+        self.memory_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    
     def setup_processes_tab(self):
         # Top processes frame
         control_frame = ttk.Frame(self.processes_tab)
@@ -196,6 +1044,21 @@ class SystemDashboard(tk.Tk):
         sort_options.pack(side=tk.LEFT, padx=5)
         sort_options.bind("<<ComboboxSelected>>", lambda e: self.refresh_processes())
         
+        self.group_cgroup_var = tk.BooleanVar(value=False)
+        group_check = ttk.Checkbutton(control_frame, text="Group by cgroup",
+                                      variable=self.group_cgroup_var, command=self.refresh_processes)
+        group_check.pack(side=tk.LEFT, padx=5)
+        
+        # Filter on name, command line, user and PID; applied on every keystroke
+        ttk.Label(control_frame, text="Filter:").pack(side=tk.LEFT, padx=(15, 5))
+        self.filter_var = tk.StringVar()
+        filter_entry = ttk.Entry(control_frame, textvariable=self.filter_var, width=30)
+        filter_entry.pack(side=tk.LEFT, padx=5)
+        self.filter_var.trace_add("write", lambda *args: self.show_processes())
+        
+        self.filter_status = ttk.Label(control_frame, text="")
+        self.filter_status.pack(side=tk.LEFT, padx=5)
+        
         kill_btn = ttk.Button(control_frame, text="End Process", command=self.kill_selected_process)
         kill_btn.pack(side=tk.RIGHT, padx=5)
         
@@ -223,6 +1086,7 @@ class SystemDashboard(tk.Tk):
         self.process_tree.column("status", width=100)
         self.process_tree.column("threads", width=70)
         self.process_tree.column("created", width=150)
+        self.process_tree.column("#0", width=250)  # cgroup, shown when grouping
         
         # Add scrollbar
         scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.process_tree.yview)
@@ -264,7 +1128,7 @@ class SystemDashboard(tk.Tk):
         self.network_plot.tick_params(colors="#FFFFFF")
         self.network_plot.set_xlim(0, 60)
         self.network_plot.set_ylim(0, 100)  # Will be auto-adjusted
-        self.network_plot.set_xlabel("Time (s)", color="#FFFFFF")
+        self.network_plot.set_xlabel("Samples", color="#FFFFFF")
         self.network_plot.set_ylabel("KB/s", color="#FFFFFF")
         
         self.network_canvas = FigureCanvasTkAgg(self.network_figure, speed_frame)
@@ -331,7 +1195,7 @@ class SystemDashboard(tk.Tk):
         self.disk_plot.tick_params(colors="#FFFFFF")
         self.disk_plot.set_xlim(0, 60)
         self.disk_plot.set_ylim(0, 100)  # Will be auto-adjusted
-        self.disk_plot.set_xlabel("Time (s)", color="#FFFFFF")
+        self.disk_plot.set_xlabel("Samples", color="#FFFFFF")
         self.disk_plot.set_ylabel("KB/s", color="#FFFFFF")
         
         self.disk_canvas = FigureCanvasTkAgg(self.disk_figure, io_frame)
@@ -371,6 +1235,126 @@ class SystemDashboard(tk.Tk):
         self.dir_results = ttk.Label(self.dir_results_frame, text="Enter a path and click Analyze")
         self.dir_results.pack(anchor=tk.W)
     
+    def setup_containers_tab(self):
+        # Summary of the busiest containers
+        summary_frame = ttk.LabelFrame(self.containers_tab, text="Containers")
+        summary_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        self.cgroups_summary = ttk.Label(summary_frame, text="Reading cgroup accounting...")
+        self.cgroups_summary.pack(anchor=tk.W, padx=5, pady=5)
+        
+        # Control group hierarchy with per-group usage
+        tree_frame = ttk.LabelFrame(self.containers_tab, text="Control Groups")
+        tree_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        columns = ("cpu", "memory", "read", "write")
+        self.cgroups_tree = ttk.Treeview(tree_frame, columns=columns, show="tree headings")
+        self.cgroups_tree.heading("#0", text="Cgroup")
+        self.cgroups_tree.heading("cpu", text="CPU %")
+        self.cgroups_tree.heading("memory", text="Memory")
+        self.cgroups_tree.heading("read", text="Read KB/s")
+        self.cgroups_tree.heading("write", text="Write KB/s")
+        self.cgroups_tree.column("#0", width=350)
+        for column in columns:
+            self.cgroups_tree.column(column, width=100, anchor=tk.E)
+        
+        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.cgroups_tree.yview)
+        self.cgroups_tree.configure(yscrollcommand=scrollbar.set)
+        
+        self.cgroups_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    
+    def setup_sensors_tab(self):
+        # Every temperature sensor and fan, discovered once at startup
+        sensors_frame = ttk.LabelFrame(self.sensors_tab, text="Temperatures and Fans")
+        sensors_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        columns = ("sensor", "current", "min", "max", "high", "critical")
+        self.sensors_tree = ttk.Treeview(sensors_frame, columns=columns, show="headings")
+        self.sensors_tree.heading("sensor", text="Sensor")
+        self.sensors_tree.heading("current", text="Current")
+        self.sensors_tree.heading("min", text="Min")
+        self.sensors_tree.heading("max", text="Max")
+        self.sensors_tree.heading("high", text="High")
+        self.sensors_tree.heading("critical", text="Critical")
+        self.sensors_tree.column("sensor", width=300)
+        for column in columns[1:]:
+            self.sensors_tree.column(column, width=100, anchor=tk.E)
+        
+        scrollbar = ttk.Scrollbar(sensors_frame, orient=tk.VERTICAL, command=self.sensors_tree.yview)
+        self.sensors_tree.configure(yscrollcommand=scrollbar.set)
+        
+        self.sensors_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    
+    def setup_fleet_tab(self):
+        self.fleet_summary = ttk.Label(self.fleet_tab, text="Connecting...")
+        self.fleet_summary.pack(anchor=tk.W, padx=5, pady=5)
+        
+        # Host grid, sortable by clicking a column heading
+        grid_frame = ttk.LabelFrame(self.fleet_tab, text="Hosts (double-click for charts)")
+        grid_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        columns = ("host", "address", "status", "cpu", "memory", "net_sent", "net_recv", "disk_read", "disk_write")
+        headings = ("Host", "Address", "Status", "CPU %", "Memory %", "Sent KB/s", "Recv KB/s",
+                    "Read KB/s", "Write KB/s")
+        self.fleet_tree = ttk.Treeview(grid_frame, columns=columns, show="headings")
+        for column, heading in zip(columns, headings):
+            self.fleet_tree.heading(column, text=heading, command=lambda c=column: self.sort_fleet(c))
+            self.fleet_tree.column(column, width=90, anchor=tk.E)
+        self.fleet_tree.column("host", width=160, anchor=tk.W)
+        self.fleet_tree.column("address", width=160, anchor=tk.W)
+        self.fleet_tree.column("status", width=100, anchor=tk.W)
+        
+        scrollbar = ttk.Scrollbar(grid_frame, orient=tk.VERTICAL, command=self.fleet_tree.yview)
+        self.fleet_tree.configure(yscrollcommand=scrollbar.set)
+        
+        self.fleet_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        self.fleet_tree.bind("<Double-1>", self.open_fleet_host)
+    
+    def setup_self_tab(self):
+        # Dashboard process usage
+        process_frame = ttk.LabelFrame(self.self_tab, text="Dashboard Process")
+        process_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        self.self_process_info = ttk.Label(process_frame, text="CPU: 0% | RSS: 0 MB | Threads: 0")
+        self.self_process_info.pack(side=tk.LEFT, padx=5, pady=5)
+        
+        dump_btn = ttk.Button(process_frame, text="Dump to File", command=self.dump_self_profile)
+        dump_btn.pack(side=tk.RIGHT, padx=5)
+        
+        reset_btn = ttk.Button(process_frame, text="Reset", command=self.profiler.reset)
+        reset_btn.pack(side=tk.RIGHT, padx=5)
+        
+        # Timing percentiles chart
+        chart_frame = ttk.LabelFrame(self.self_tab, text="Timings (ms)")
+        chart_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        self.self_figure = Figure(figsize=(5, 3), dpi=100, facecolor="#2E2E2E")
+        self.self_plot = self.self_figure.add_subplot(111)
+        self.self_plot.set_facecolor("#2E2E2E")
+        self.self_plot.tick_params(colors="#FFFFFF")
+        
+        self.self_canvas = FigureCanvasTkAgg(self.self_figure, chart_frame)
+        self.self_canvas.draw()
+        self.self_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        # Timing table
+        columns = ("section", "count", "p50", "p95", "p99", "max")
+        self.self_tree = ttk.Treeview(self.self_tab, columns=columns, show="headings", height=8)
+        self.self_tree.heading("section", text="Section")
+        self.self_tree.heading("count", text="Samples")
+        self.self_tree.heading("p50", text="p50 (ms)")
+        self.self_tree.heading("p95", text="p95 (ms)")
+        self.self_tree.heading("p99", text="p99 (ms)")
+        self.self_tree.heading("max", text="Max (ms)")
+        self.self_tree.column("section", width=200)
+        for column in columns[1:]:
+            self.self_tree.column(column, width=90, anchor=tk.E)
+        self.self_tree.pack(fill=tk.X, padx=5, pady=5)
+    
     def setup_console(self):
         console_frame = ttk.LabelFrame(self, text="System Log")
         console_frame.pack(fill=tk.X, padx=10, pady=10)
@@ -378,6 +1362,83 @@ class SystemDashboard(tk.Tk):
         self.console = scrolledtext.ScrolledText(console_frame, height=6, bg="#1E1E1E", fg="#FFFFFF")
         self.console.pack(fill=tk.X, padx=5, pady=5)
         self.console.config(state=tk.DISABLED)
+        
+        self.record_hidden_var = tk.BooleanVar(value=False)
+        record_check = ttk.Checkbutton(console_frame, text="Record full-rate history while hidden",
+                                       variable=self.record_hidden_var, command=self.toggle_record_hidden)
+        record_check.pack(side=tk.LEFT, padx=5)
+        
+        self.export_btn = ttk.Button(console_frame, text="Export History...", command=self.open_export_dialog)
+        self.export_btn.pack(side=tk.RIGHT, padx=5, pady=(0, 5))
+    
+    def toggle_record_hidden(self):
+        self.record_hidden = self.record_hidden_var.get()
+    
+    def on_visibility_changed(self, event):
+        """Track the visible view and wake its monitors so they catch up immediately"""
+        if event.widget is not self and event.widget is not self.notebook:
+            return
+        self.minimized = self.state() == "iconic"
+        self.visible_view = self.tab_views.get(self.notebook.select(), "overview")
+        if self.minimized:
+            return
+        
+        self.view_events[self.visible_view].set()
+        
+        # Refresh the after()-driven views right away instead of waiting for their next slot
+        if self.visible_view == "network" and self._connections_job is not None:
+            self.after_cancel(self._connections_job)
+            self.update_network_connections()
+        elif self.visible_view == "disk" and self._disk_usage_job is not None:
+            self.after_cancel(self._disk_usage_job)
+            self.update_disk_usage()
+        elif self.visible_view == "self" and self._self_stats_job is not None:
+            self.after_cancel(self._self_stats_job)
+            self.update_self_stats()
+        elif self.visible_view == "memory" and self._top_memory_job is not None:
+            self.after_cancel(self._top_memory_job)
+            self.update_top_memory()
+        elif self.visible_view == "fleet" and self._fleet_job is not None:
+            self.after_cancel(self._fleet_job)
+            self.update_fleet()
+    
+    def is_view_visible(self, *views):
+        return not self.minimized and self.visible_view in views
+    
+    def finish_tick(self, sampler):
+        """Close a sampler tick and record its achieved rate"""
+        if sampler.end():
+            self.log_to_console(f"Sampling of {sampler.name} took {sampler.cost:.2f}s, "
+                                f"interval backed off to {sampler.interval:.1f}s")
+        self.history.append(f"sampler.{sampler.name}.rate_hz", sampler.rate)
+    
+    def wait_for_tick(self, views, sampler):
+        """Finish the current tick and sleep until the next sample of a view is due
+        
+        views is a view name or a tuple of the views a monitor draws. Hidden views
+        fall back to BACKGROUND_INTERVAL unless full-rate recording is enabled, and
+        are woken early when they become visible.
+        """
+        self.finish_tick(sampler)
+        if views is None:
+            time.sleep(sampler.delay())
+            return
+        if isinstance(views, str):
+            views = (views,)
+        
+        interval = None
+        if not self.is_view_visible(*views) and not self.record_hidden:
+            interval = BACKGROUND_INTERVAL
+        event = self.view_events[views[0]]
+        if event.wait(sampler.delay(interval)):
+            # Woken early: restart the schedule from now
+            sampler.deadline = time.monotonic()
+        event.clear()
+    
+    def schedule_tick(self, sampler, callback):
+        """after()-based equivalent of wait_for_tick for monitors on the Tk main thread"""
+        self.finish_tick(sampler)
+        return self.after(int(sampler.delay() * 1000), callback)
     
     def log_to_console(self, message):
         self.console.config(state=tk.NORMAL)
@@ -392,12 +1453,19 @@ class SystemDashboard(tk.Tk):
         self.start_thread(self.update_cpu_memory)
         self.start_thread(self.update_network)
         self.start_thread(self.update_disk)
+        self.start_thread(self.update_memory)
         self.start_thread(self.update_status)
+        self.start_thread(self.update_cgroups)
         
         # Initial updates
         self.refresh_processes()
         self.update_disk_usage()
         self.update_network_connections()
+        self.update_self_stats()
+        self.update_top_memory()
+        if self.fleet_client:
+            self.fleet_client.start()
+            self.update_fleet()
         
         # Log startup
         self.log_to_console("System monitoring started")
@@ -409,77 +1477,83 @@ class SystemDashboard(tk.Tk):
     
     def update_system_info(self):
         """Update system information once every 30 seconds"""
+        sampler = self.samplers["system_info"]
         while True:
-            uname = platform.uname()
-            boot_time = datetime.datetime.fromtimestamp(psutil.boot_time())
-            uptime = datetime.datetime.now() - boot_time
-            
-            # Format uptime
-            days = uptime.days
-            hours, remainder = divmod(uptime.seconds, 3600)
-            minutes, seconds = divmod(remainder, 60)
-            uptime_str = f"{days}d {hours}h {minutes}m {seconds}s"
-            
-            # Get IP address
-            hostname = socket.gethostname()
-            try:
-                ip_address = socket.gethostbyname(hostname)
-            except:
-                ip_address = "Unknown"
-            
-            info_text = (
-                f"System: {uname.system} {uname.release} ({platform.architecture()[0]})\n"
-                f"Host: {uname.node} | CPU: {uname.machine} {uname.processor}\n"
-                f"Boot Time: {boot_time.strftime('%Y-%m-%d %H:%M:%S')} | Uptime: {uptime_str}\n"
-                f"Hostname: {hostname} | IP: {ip_address}"
-            )
-            
-            self.system_info.config(text=info_text)
-            
-            # Update network info
-            net_if_addrs = psutil.net_if_addrs()
-            net_info = "Network Interfaces:\n"
-            
-            for interface, addrs in net_if_addrs.items():
-                net_info += f"{interface}:\n"
-                for addr in addrs:
-                    if addr.family == socket.AF_INET:
-                        net_info += f"  IPv4: {addr.address} | Netmask: {addr.netmask}\n"
-                    elif addr.family == socket.AF_INET6:
-                        net_info += f"  IPv6: {addr.address}\n"
-                    elif addr.family == psutil.AF_LINK:
-                        net_info += f"  MAC: {addr.address}\n"
-            
-            self.network_info.config(text=net_info)
+            sampler.begin()
+            with self.profiler.timed("collect.system_info"):
+                uname = platform.uname()
+                boot_time = datetime.datetime.fromtimestamp(self.collector.boot_time())
+                uptime = datetime.datetime.now() - boot_time
+                
+                # Format uptime
+                days = uptime.days
+                hours, remainder = divmod(uptime.seconds, 3600)
+                minutes, seconds = divmod(remainder, 60)
+                uptime_str = f"{days}d {hours}h {minutes}m {seconds}s"
+                
+                # Get IP address
+                hostname = socket.gethostname()
+                try:
+                    ip_address = socket.gethostbyname(hostname)
+                except:
+                    ip_address = "Unknown"
+                
+                info_text = (
+                    f"System: {uname.system} {uname.release} ({platform.architecture()[0]})\n"
+                    f"Host: {uname.node} | CPU: {uname.machine} {uname.processor}\n"
+                    f"Boot Time: {boot_time.strftime('%Y-%m-%d %H:%M:%S')} | Uptime: {uptime_str}\n"
+                    f"Hostname: {hostname} | IP: {ip_address}"
+                )
+                
+                self.system_info.config(text=info_text)
+                
+                # Update network info
+                net_if_addrs = self.collector.net_if_addrs()
+                net_info = "Network Interfaces:\n"
+                
+                for interface, addrs in net_if_addrs.items():
+                    net_info += f"{interface}:\n"
+                    for addr in addrs:
+                        if addr.family == socket.AF_INET:
+                            net_info += f"  IPv4: {addr.address} | Netmask: {addr.netmask}\n"
+                        elif addr.family == socket.AF_INET6:
+                            net_info += f"  IPv6: {addr.address}\n"
+                        elif addr.family == psutil.AF_LINK:
+                            net_info += f"  MAC: {addr.address}\n"
+                
+                self.network_info.config(text=net_info)
             
-            time.sleep(30)
+            self.wait_for_tick(None, sampler)
     
     def update_cpu_memory(self):
         """Update CPU and memory usage every second"""
+        sampler = self.samplers["cpu_memory"]
         while True:
-            # CPU usage
-            cpu_percent = psutil.cpu_percent()
+            sampler.begin()
+            
+            # CPU and memory usage
+            with self.profiler.timed("collect.cpu_memory"):
+                per_core = self.collector.cpu_percent(percpu=True)
+                cpu_times = self.collector.cpu_times_percent()
+                memory = self.collector.virtual_memory()
+                # A pread per resource and a getloadavg() call, cheap enough for every tick
+                pressures = {resource: self.collector.pressure(resource) for resource in ("cpu", "io", "memory")}
+                load = self.collector.load_average()
+            
+            # The aggregate is the mean of the cores, which saves a second sampling call
+            cpu_percent = sum(per_core) / len(per_core) if per_core else 0.0
+            if len(per_core) != self.core_history.rows:
+                # Cores went on- or offline
+                self.core_history = RingBuffer2D(len(per_core), 60)
+            self.core_history.push(per_core)
+            
+            for field, _ in CPU_TIME_FIELDS:
+                self.cpu_times_history[field].pop(0)
+                self.cpu_times_history[field].append(getattr(cpu_times, field, 0.0))
+            
             self.cpu_history.pop(0)
             self.cpu_history.append(cpu_percent)
             
-            # Update CPU plot
-            self.cpu_plot.clear()
-            self.cpu_plot.set_facecolor("#2E2E2E")
-            self.cpu_plot.tick_params(colors="#FFFFFF")
-            self.cpu_plot.set_xlim(0, 60)
-            self.cpu_plot.set_ylim(0, 100)
-            self.cpu_plot.set_xlabel("Time (s)", color="#FFFFFF")
-            self.cpu_plot.set_ylabel("CPU %", color="#FFFFFF")
-            self.cpu_plot.plot(range(60), self.cpu_history, color="#3E8ADE", linewidth=2)
-            self.cpu_plot.fill_between(range(60), self.cpu_history, color="#3E8ADE", alpha=0.2)
-            self.cpu_canvas.draw()
-            
-            # Update CPU info
-            self.cpu_percentage.config(text=f"Current: {cpu_percent:.1f}%")
-            self.cpu_cores.config(text=f"Cores: {psutil.cpu_count(logical=True)}")
-            
-            # Memory usage
-            memory = psutil.virtual_memory()
             memory_percent = memory.percent
             memory_used = memory.used / (1024 * 1024 * 1024)  # Convert to GB
             memory_total = memory.total / (1024 * 1024 * 1024)  # Convert to GB
@@ -487,21 +1561,48 @@ class SystemDashboard(tk.Tk):
             self.memory_history.pop(0)
             self.memory_history.append(memory_percent)
             
-            # Update memory plot
-            self.memory_plot.clear()
-            self.memory_plot.set_facecolor("#2E2E2E")
-            self.memory_plot.tick_params(colors="#FFFFFF")
-            self.memory_plot.set_xlim(0, 60)
-            self.memory_plot.set_ylim(0, 100)
-            self.memory_plot.set_xlabel("Time (s)", color="#FFFFFF")
-            self.memory_plot.set_ylabel("Memory %", color="#FFFFFF")
-            self.memory_plot.plot(range(60), self.memory_history, color="#28A745", linewidth=2)
-            self.memory_plot.fill_between(range(60), self.memory_history, color="#28A745", alpha=0.2)
-            self.memory_canvas.draw()
-            
-            # Update memory info
-            self.memory_percentage.config(text=f"Current: {memory_percent:.1f}%")
-            self.memory_usage.config(text=f"{memory_used:.2f} GB / {memory_total:.2f} GB")
+            now = time.time()
+            self.history.append("cpu.percent", cpu_percent, now)
+            self.history.append("memory.percent", memory_percent, now)
+            for field, _ in CPU_TIME_FIELDS:
+                self.history.append(f"cpu.{field}", self.cpu_times_history[field][-1], now)
+            
+            for (resource, kind), values in self.pressure_history.items():
+                pressure = pressures[resource]
+                value = getattr(pressure, f"{kind}_avg10") if pressure is not None else None
+                values.pop(0)
+                values.append(value or 0.0)
+                if value is not None:
+                    self.history.append(f"pressure.{resource}.{kind}_avg10", value, now)
+            self.load_history.pop(0)
+            self.load_history.append(load[0])
+            for minutes, value in zip((1, 5, 15), load):
+                self.history.append(f"load.{minutes}", value, now)
+            self.check_pressure_alerts()
+            
+            if self.is_view_visible("cpu"):
+                self.draw_cpu_tab()
+            
+            if self.is_view_visible("overview"):
+                # Update CPU plot
+                with self.profiler.timed("draw.cpu"):
+                    render_history_plot(self.cpu_plot, "CPU %", 100,
+                                        [(self.cpu_history, "#3E8ADE", None)])
+                    self.cpu_canvas.draw()
+                
+                # Update CPU info
+                self.cpu_percentage.config(text=f"Current: {cpu_percent:.1f}%")
+                self.cpu_cores.config(text=f"Cores: {self.collector.cpu_count()}")
+                
+                # Update memory plot
+                with self.profiler.timed("draw.memory"):
+                    render_history_plot(self.memory_plot, "Memory %", 100,
+                                        [(self.memory_history, "#28A745", None)])
+                    self.memory_canvas.draw()
+                
+                # Update memory info
+                self.memory_percentage.config(text=f"Current: {memory_percent:.1f}%")
+                self.memory_usage.config(text=f"{memory_used:.2f} GB / {memory_total:.2f} GB")
             
             # Log high resource usage
             if cpu_percent > 90:
@@ -509,16 +1610,64 @@ class SystemDashboard(tk.Tk):
             if memory_percent > 90:
                 self.log_to_console(f"High memory usage: {memory_percent:.1f}%")
             
-            time.sleep(1)
+            self.wait_for_tick(("overview", "cpu"), sampler)
+    
+    def draw_cpu_tab(self):
+        """Refresh the per-core heatmap and CPU time breakdown in place"""
+        with self.profiler.timed("draw.cpu_heatmap"):
+            data = self.core_history.ordered()
+            self.heatmap_image.set_data(data)
+            self.heatmap_image.set_extent((0, 60, -0.5, self.core_history.rows - 0.5))
+            self.heatmap_canvas.draw()
+        
+        latest = data[:, -1]
+        busiest = int(latest.argmax())
+        self.core_balance.config(text=f"Busiest core: {busiest} ({latest[busiest]:.1f}%) | "
+                                      f"Spread: {latest.max() - latest.min():.1f}% | "
+                                      f"Cores: {self.core_history.rows}")
+        
+        with self.profiler.timed("draw.cpu_breakdown"):
+            for field, line in self.breakdown_lines.items():
+                line.set_ydata(self.cpu_times_history[field])
+            self.breakdown_canvas.draw()
+        
+        self.breakdown_label.config(text=" | ".join(
+            f"{field}: {self.cpu_times_history[field][-1]:.1f}%" for field, _ in CPU_TIME_FIELDS))
+        
+        with self.profiler.timed("draw.pressure"):
+            for key, line in self.pressure_lines.items():
+                line.set_ydata(self.pressure_history[key])
+            self.load_line.set_ydata(self.load_history)
+            peak = max(max(values) for values in self.pressure_history.values())
+            self.pressure_plot.set_ylim(0, max(10, peak * 1.2))
+            self.load_plot.set_ylim(0, max(self.core_history.rows, max(self.load_history) * 1.2))
+            self.pressure_canvas.draw()
+        
+        self.pressure_label.config(text=" | ".join(
+            [f"{resource} {kind}: {self.pressure_history[(resource, kind)][-1]:.2f}%"
+             for resource, kind, _ in PRESSURE_FIELDS] + [f"load: {self.load_history[-1]:.2f}"]))
+    
+    def check_pressure_alerts(self):
+        """Log when a pressure stall level crosses its alert threshold, in either direction"""
+        for (resource, kind), level in PRESSURE_ALERTS.items():
+            value = self.pressure_history[(resource, kind)][-1]
+            if value > level and (resource, kind) not in self.pressure_alerts:
+                self.pressure_alerts.add((resource, kind))
+                self.log_to_console(f"High {resource} pressure: {kind} {value:.1f}% stalled (avg10)")
+            elif value <= level and (resource, kind) in self.pressure_alerts:
+                self.pressure_alerts.discard((resource, kind))
+                self.log_to_console(f"{resource.capitalize()} pressure back to normal: {kind} {value:.1f}%")
     
     def update_network(self):
         """Update network statistics every second"""
+        sampler = self.samplers["network"]
         while True:
+            time_delta = sampler.begin()
             current_time = time.time()
-            time_delta = current_time - self.last_update_time
             
             # Get current network IO
-            net_io = psutil.net_io_counters()
+            with self.profiler.timed("collect.network"):
+                net_io = self.collector.net_io_counters()
             
             # Calculate speed
             sent_bytes = net_io.bytes_sent - self.last_net_io.bytes_sent
@@ -534,32 +1683,23 @@ class SystemDashboard(tk.Tk):
             self.net_recv_history.pop(0)
             self.net_recv_history.append(recv_kb_s)
             
+            self.history.append("net.sent_kbs", sent_kb_s, current_time)
+            self.history.append("net.recv_kbs", recv_kb_s, current_time)
+            
             # Calculate max for y-axis
             max_value = max(max(self.net_sent_history), max(self.net_recv_history), 100)
             
-            # Update network plot
-            self.network_plot.clear()
-            self.network_plot.set_facecolor("#2E2E2E")
-            self.network_plot.tick_params(colors="#FFFFFF")
-            self.network_plot.set_xlim(0, 60)
-            self.network_plot.set_ylim(0, max_value * 1.1)  # Add 10% margin
-            self.network_plot.set_xlabel("Time (s)", color="#FFFFFF")
-            self.network_plot.set_ylabel("KB/s", color="#FFFFFF")
-            
-            # Plot sent
-            self.network_plot.plot(range(60), self.net_sent_history, color="#3E8ADE", linewidth=2, label="Sent")
-            self.network_plot.fill_between(range(60), self.net_sent_history, color="#3E8ADE", alpha=0.2)
-            
-            # Plot received
-            self.network_plot.plot(range(60), self.net_recv_history, color="#28A745", linewidth=2, label="Received")
-            self.network_plot.fill_between(range(60), self.net_recv_history, color="#28A745", alpha=0.2)
-            
-            self.network_plot.legend(loc="upper right", facecolor="#2E2E2E", labelcolor="#FFFFFF")
-            self.network_canvas.draw()
-            
-            # Update network labels
-            self.sent_label.config(text=f"Sent: {sent_kb_s:.2f} KB/s")
-            self.recv_label.config(text=f"Received: {recv_kb_s:.2f} KB/s")
+            if self.is_view_visible("network"):
+                # Update network plot
+                with self.profiler.timed("draw.network"):
+                    render_history_plot(self.network_plot, "KB/s", max_value * 1.1,  # Add 10% margin
+                                        [(self.net_sent_history, "#3E8ADE", "Sent"),
+                                         (self.net_recv_history, "#28A745", "Received")])
+                    self.network_canvas.draw()
+                
+                # Update network labels
+                self.sent_label.config(text=f"Sent: {sent_kb_s:.2f} KB/s")
+                self.recv_label.config(text=f"Received: {recv_kb_s:.2f} KB/s")
             
             # Log high network activity
             if sent_kb_s > 1000 or recv_kb_s > 1000:
@@ -567,18 +1707,19 @@ class SystemDashboard(tk.Tk):
             
             # Store current values for next iteration
             self.last_net_io = net_io
-            self.last_update_time = current_time
             
-            time.sleep(1)
+            self.wait_for_tick("network", sampler)
     
     def update_disk(self):
         """Update disk I/O statistics every second"""
+        sampler = self.samplers["disk"]
         while True:
+            time_delta = sampler.begin()
             current_time = time.time()
-            time_delta = current_time - self.last_update_time
             
             # Get current disk IO
-            disk_io = psutil.disk_io_counters(perdisk=False)
+            with self.profiler.timed("collect.disk"):
+                disk_io = self.collector.disk_io_counters()
             
             # Calculate speed
             read_bytes = disk_io.read_bytes - self.last_disk_io.read_bytes
@@ -594,32 +1735,23 @@ class SystemDashboard(tk.Tk):
             self.disk_write_history.pop(0)
             self.disk_write_history.append(write_kb_s)
             
+            self.history.append("disk.read_kbs", read_kb_s, current_time)
+            self.history.append("disk.write_kbs", write_kb_s, current_time)
+            
             # Calculate max for y-axis
             max_value = max(max(self.disk_read_history), max(self.disk_write_history), 100)
             
-            # Update disk plot
-            self.disk_plot.clear()
-            self.disk_plot.set_facecolor("#2E2E2E")
-            self.disk_plot.tick_params(colors="#FFFFFF")
-            self.disk_plot.set_xlim(0, 60)
-            self.disk_plot.set_ylim(0, max_value * 1.1)  # Add 10% margin
-            self.disk_plot.set_xlabel("Time (s)", color="#FFFFFF")
-            self.disk_plot.set_ylabel("KB/s", color="#FFFFFF")
-            
-            # Plot read
-            self.disk_plot.plot(range(60), self.disk_read_history, color="#3E8ADE", linewidth=2, label="Read")
-            self.disk_plot.fill_between(range(60), self.disk_read_history, color="#3E8ADE", alpha=0.2)
-            
-            # Plot write
-            self.disk_plot.plot(range(60), self.disk_write_history, color="#28A745", linewidth=2, label="Write")
-            self.disk_plot.fill_between(range(60), self.disk_write_history, color="#28A745", alpha=0.2)
-            
-            self.disk_plot.legend(loc="upper right", facecolor="#2E2E2E", labelcolor="#FFFFFF")
-            self.disk_canvas.draw()
-            
-            # Update disk labels
-            self.read_label.config(text=f"Read: {read_kb_s:.2f} KB/s")
-            self.write_label.config(text=f"Write: {write_kb_s:.2f} KB/s")
+            if self.is_view_visible("disk"):
+                # Update disk plot
+                with self.profiler.timed("draw.disk"):
+                    render_history_plot(self.disk_plot, "KB/s", max_value * 1.1,  # Add 10% margin
+                                        [(self.disk_read_history, "#3E8ADE", "Read"),
+                                         (self.disk_write_history, "#28A745", "Write")])
+                    self.disk_canvas.draw()
+                
+                # Update disk labels
+                self.read_label.config(text=f"Read: {read_kb_s:.2f} KB/s")
+                self.write_label.config(text=f"Write: {write_kb_s:.2f} KB/s")
             
             # Log high disk activity
             if read_kb_s > 5000 or write_kb_s > 5000:
@@ -628,138 +1760,412 @@ class SystemDashboard(tk.Tk):
             # Store current values for next iteration
             self.last_disk_io = disk_io
             
-            time.sleep(1)
+            self.wait_for_tick("disk", sampler)
     
-    def update_status(self):
-        """Update temperature and battery status every 5 seconds"""
+    def update_memory(self):
+        """Update the memory breakdown, swap rates and memory pressure every 2 seconds
+        
+        Pressure series are recorded by update_cpu_memory, which samples all resources.
+        """
+        sampler = self.samplers["memory"]
         while True:
-            # Update CPU temperature if available
-            try:
-                # Try different methods to get temperature
-                temperature = None
-                
-                # Try psutil (works on some systems)
-                if hasattr(psutil, "sensors_temperatures"):
-                    temps = psutil.sensors_temperatures()
-                    if temps:
-                        for name, entries in temps.items():
-                            for entry in entries:
-                                if entry.current > 0:
-                                    temperature = entry.current
-                                    break
-                            if temperature:
-                                break
+            time_delta = sampler.begin()
+            current_time = time.time()
+            
+            with self.profiler.timed("collect.memory"):
+                details = self.collector.memory_details()
+                pressure = self.collector.pressure("memory")
+            
+            # Swap rates from the cumulative counters
+            swap_in_kb_s = swap_out_kb_s = 0.0
+            last = self.last_memory_details
+            if last is not None and details.swap_in is not None and last.swap_in is not None:
+                swap_in_kb_s = max(0, details.swap_in - last.swap_in) / time_delta / 1024
+                swap_out_kb_s = max(0, details.swap_out - last.swap_out) / time_delta / 1024
+            self.last_memory_details = details
+            
+            self.swap_in_history.pop(0)
+            self.swap_in_history.append(swap_in_kb_s)
+            self.swap_out_history.pop(0)
+            self.swap_out_history.append(swap_out_kb_s)
+            
+            self.history.append("memory.swap_in_kbs", swap_in_kb_s, current_time)
+            self.history.append("memory.swap_out_kbs", swap_out_kb_s, current_time)
+            for field in ("cached", "buffers", "slab", "dirty", "writeback"):
+                value = getattr(details, field)
+                if value is not None:
+                    self.history.append(f"memory.{field}_mb", value / (1024 * 1024), current_time)
+            
+            if self.is_view_visible("memory"):
+                def mb(value):
+                    return "n/a" if value is None else f"{value / (1024 * 1024):.1f} MB"
                 
-                # If not found and on Linux, try reading from thermal_zone
-                if not temperature and os.path.exists("/sys/class/thermal/thermal_zone0/temp"):
-                    with open("/sys/class/thermal/thermal_zone0/temp") as f:
-                        temperature = int(f.read().strip()) / 1000.0
+                self.memory_breakdown.config(text=(
+                    f"Used: {mb(details.used)} of {mb(details.total)} | Page cache: {mb(details.cached)} | "
+                    f"Buffers: {mb(details.buffers)} | Slab: {mb(details.slab)}\n"
+                    f"Dirty: {mb(details.dirty)} | Writeback: {mb(details.writeback)} | "
+                    f"Swap: {mb(details.swap_used)} of {mb(details.swap_total)} | "
+                    f"Swap in: {swap_in_kb_s:.1f} KB/s | Swap out: {swap_out_kb_s:.1f} KB/s"))
+                if pressure is not None:
+                    self.memory_pressure.config(text=(
+                        f"Memory pressure (PSI) - some: {pressure.some_avg10:.2f}% / {pressure.some_avg60:.2f}% / "
+                        f"{pressure.some_avg300:.2f}%, full: {pressure.full_avg10:.2f}% / "
+                        f"{pressure.full_avg60:.2f}% / {pressure.full_avg300:.2f}% (10s / 60s / 300s)"))
+                else:
+                    self.memory_pressure.config(text="Memory pressure (PSI): not available")
                 
-                if temperature:
-                    self.temp_label.config(text=f"{temperature:.1f}°C")
-                    self.temp_progress["value"] = min(100, temperature)
+                with self.profiler.timed("draw.swap"):
+                    max_value = max(max(self.swap_in_history), max(self.swap_out_history), 100)
+                    render_history_plot(self.swap_plot, "KB/s", max_value * 1.1,
+                                        [(self.swap_in_history, "#3E8ADE", "Swap in"),
+                                         (self.swap_out_history, "#DC3545", "Swap out")])
+                    self.swap_canvas.draw()
+            
+            self.wait_for_tick("memory", sampler)
+    
+    def update_top_memory(self):
+        """Refresh the top processes by memory; PSS/USS follow lazily"""
+        self._top_memory_job = None
+        if not self.is_view_visible("memory"):
+            # Refreshed as soon as the Memory tab is shown
+            self._top_memory_job = self.after(BACKGROUND_INTERVAL * 1000, self.update_top_memory)
+            return
+        sampler = self.samplers["top_memory"]
+        sampler.begin()
+        
+        with self.profiler.timed("collect.top_memory"):
+            processes = collect_processes(self.collector)
+            sort_processes(processes, "Memory")
+            processes = processes[:TOP_MEMORY_PROCESSES]
+        
+        with self.profiler.timed("tree.top_memory"):
+            for item in self.memory_tree.get_children():
+                self.memory_tree.delete(item)
+            
+            rows = {}
+            for proc in processes:
+                key = (proc['pid'], proc['created'])
+                cached = self.process_memory_cache.get(key)
+                pss = uss = "..."
+                if cached is not None:
+                    pss, uss = self.format_process_memory(cached[0])
+                item = self.memory_tree.insert('', 'end', values=(proc['pid'], proc['name'], proc['memory'], pss, uss))
+                rows[item] = key
+            self.memory_rows = rows
+            
+            # Forget processes that left the list
+            keys = set(rows.values())
+            self.process_memory_cache = {key: value for key, value in self.process_memory_cache.items() if key in keys}
+        
+        self.request_process_memory()
+        self._top_memory_job = self.schedule_tick(sampler, self.update_top_memory)
+    
+    def format_process_memory(self, memory):
+        if memory is None:
+            return "denied", "denied"
+        pss = "n/a" if memory.pss is None else f"{memory.pss / (1024 * 1024):.2f} MB"
+        return pss, f"{memory.uss / (1024 * 1024):.2f} MB"
+    
+    def request_process_memory(self):
+        """Queue PSS/USS lookups for the rows currently on screen that have no fresh value"""
+        items = self.memory_tree.get_children()
+        if not items:
+            return
+        first, last = self.memory_tree.yview()
+        start = int(first * len(items))
+        end = min(len(items), int(last * len(items)) + 1)
+        
+        now = time.monotonic()
+        for item in items[start:end]:
+            key = self.memory_rows.get(item)
+            if key is None or key in self.process_memory_pending:
+                continue
+            cached = self.process_memory_cache.get(key)
+            if cached is not None and now - cached[1] < PROCESS_MEMORY_TTL:
+                continue
+            self.process_memory_pending.add(key)
+            future = self.process_memory_pool.submit(self.collector.process_memory, key[0])
+            future.add_done_callback(
+                lambda future, item=item, key=key: self.after(0, lambda: self._apply_process_memory(item, key, future)))
+    
+    def _apply_process_memory(self, item, key, future):
+        self.process_memory_pending.discard(key)
+        try:
+            memory = future.result()
+        except psutil.Error:
+            memory = None  # Exited, or owned by another user
+        self.process_memory_cache[key] = (memory, time.monotonic())
+        
+        if self.memory_rows.get(item) == key and self.memory_tree.exists(item):
+            pss, uss = self.format_process_memory(memory)
+            self.memory_tree.set(item, "pss", pss)
+            self.memory_tree.set(item, "uss", uss)
+    
+    def update_status(self):
+        """Update temperature, fan and battery status every 5 seconds"""
+        sampler = self.samplers["status"]
+        while True:
+            sampler.begin()
+            
+            with self.profiler.timed("collect.status"):
+                # Update CPU temperature if available
+                temps = {}
+                try:
+                    temperature = None
                     
-                    # Change color based on temperature
-                    temp_style = "green.Horizontal.TProgressbar"
-                    if temperature > 70:
-                        temp_style = "red.Horizontal.TProgressbar"
-                    elif temperature > 60:
-                        temp_style = "yellow.Horizontal.TProgressbar"
-                    self.temp_progress["style"] = temp_style
+                    temps = self.collector.sensors_temperatures()
+                    for name, entries in temps.items():
+                        for entry in entries:
+                            if entry.current > 0:
+                                temperature = entry.current
+                                break
+                        if temperature:
+                            break
                     
-                    # Log high temperature
-                    if temperature > 80:
-                        self.log_to_console(f"Warning: High CPU temperature: {temperature:.1f}°C")
-                else:
+                    if temperature:
+                        self.temp_label.config(text=f"{temperature:.1f}°C")
+                        self.temp_progress["value"] = min(100, temperature)
+                        
+                        # Change color based on temperature
+                        temp_style = "green.Horizontal.TProgressbar"
+                        if temperature > 70:
+                            temp_style = "red.Horizontal.TProgressbar"
+                        elif temperature > 60:
+                            temp_style = "yellow.Horizontal.TProgressbar"
+                        self.temp_progress["style"] = temp_style
+                        
+                        # Log high temperature
+                        if temperature > 80:
+                            self.log_to_console(f"Warning: High CPU temperature: {temperature:.1f}°C")
+                    else:
+                        self.temp_label.config(text="Not available")
+                        self.temp_progress["value"] = 0
+                except Exception as e:
                     self.temp_label.config(text="Not available")
                     self.temp_progress["value"] = 0
-            except Exception as e:
-                self.temp_label.config(text="Not available")
-                self.temp_progress["value"] = 0
-            
-            # Update battery status if available
-            try:
-                battery = psutil.sensors_battery()
-                if battery:
-                    percent = battery.percent
-                    power_plugged = battery.power_plugged
-                    
-                    status = "Charging" if power_plugged else "Discharging"
-                    self.battery_label.config(text=f"{percent:.1f}% ({status})")
-                    self.battery_progress["value"] = percent
-                    
-                    # Change color based on battery level and status
-                    batt_style = "green.Horizontal.TProgressbar"
-                    if not power_plugged and percent < 20:
-                        batt_style = "red.Horizontal.TProgressbar"
-                    elif not power_plugged and percent < 50:
-                        batt_style = "yellow.Horizontal.TProgressbar"
-                    self.battery_progress["style"] = batt_style
-                    
-                    # Log low battery
-                    if not power_plugged and percent < 15:
-                        self.log_to_console(f"Warning: Low battery: {percent:.1f}%")
-                else:
+                
+                # Update battery status if available
+                try:
+                    battery = self.collector.sensors_battery()
+                    if battery:
+                        percent = battery.percent
+                        power_plugged = battery.power_plugged
+                        
+                        status = "Charging" if power_plugged else "Discharging"
+                        self.battery_label.config(text=f"{percent:.1f}% ({status})")
+                        self.battery_progress["value"] = percent
+                        
+                        # Change color based on battery level and status
+                        batt_style = "green.Horizontal.TProgressbar"
+                        if not power_plugged and percent < 20:
+                            batt_style = "red.Horizontal.TProgressbar"
+                        elif not power_plugged and percent < 50:
+                            batt_style = "yellow.Horizontal.TProgressbar"
+                        self.battery_progress["style"] = batt_style
+                        
+                        # Log low battery
+                        if not power_plugged and percent < 15:
+                            self.log_to_console(f"Warning: Low battery: {percent:.1f}%")
+                    else:
+                        self.battery_label.config(text="Not available")
+                        self.battery_progress["value"] = 0
+                except Exception as e:
                     self.battery_label.config(text="Not available")
                     self.battery_progress["value"] = 0
-            except Exception as e:
-                self.battery_label.config(text="Not available")
-                self.battery_progress["value"] = 0
+                
+                # Every temperature sensor and fan gets its own series
+                try:
+                    fans = self.collector.sensors_fans()
+                except Exception:
+                    fans = {}
+                readings = sensor_readings(temps, fans)
+            
+            now = time.time()
+            for name, value, unit, high, critical in readings:
+                self.history.append(f"sensor.{name}.{'rpm' if unit == 'RPM' else 'celsius'}", value, now)
+                extremes = self.sensor_extremes.setdefault(name, [value, value])
+                extremes[0] = min(extremes[0], value)
+                extremes[1] = max(extremes[1], value)
+            
+            if self.is_view_visible("sensors"):
+                self.after(0, lambda readings=readings: self._update_sensors_ui(readings))
+            
+            self.wait_for_tick(("overview", "sensors"), sampler)
+    
+    def _update_sensors_ui(self, readings):
+        """Update the sensor rows in place"""
+        def fmt(value, unit):
+            return "-" if value is None else f"{value:.1f} {unit}"
+        
+        with self.profiler.timed("tree.sensors"):
+            for name, value, unit, high, critical in readings:
+                low, peak = self.sensor_extremes[name]
+                values = (name, fmt(value, unit), fmt(low, unit), fmt(peak, unit), fmt(high, unit), fmt(critical, unit))
+                if self.sensors_tree.exists(name):
+                    self.sensors_tree.item(name, values=values)
+                else:
+                    self.sensors_tree.insert('', 'end', iid=name, values=values)
+    
+    def update_cgroups(self):
+        """Read cgroup v2 accounting for every group every 2 seconds"""
+        sampler = self.samplers["cgroups"]
+        while True:
+            time_delta = sampler.begin()
+            current_time = time.time()
+            
+            # One pass over the whole hierarchy per tick
+            with self.profiler.timed("collect.cgroups"):
+                groups = self.collector.cgroups()
+                rates = cgroup_rates(self.last_cgroups, groups, time_delta)
+            
+            for path, (cpu, memory, read_kb_s, write_kb_s) in rates.items():
+                if cpu is not None:
+                    self.history.append(f"cgroup.{path}.cpu_percent", cpu, current_time)
+                if memory is not None:
+                    self.history.append(f"cgroup.{path}.memory_mb", memory, current_time)
+                if read_kb_s is not None:
+                    self.history.append(f"cgroup.{path}.read_kbs", read_kb_s, current_time)
+                    self.history.append(f"cgroup.{path}.write_kbs", write_kb_s, current_time)
+            
+            self.last_cgroups = groups
             
-            time.sleep(5)
+            if self.is_view_visible("containers"):
+                self.after(0, lambda rates=rates: self._update_cgroups_ui(rates))
+            
+            self.wait_for_tick("containers", sampler)
+    
+    def _update_cgroups_ui(self, rates):
+        """Update the cgroup rows in place and summarize the busiest containers"""
+        if not rates:
+            self.cgroups_summary.config(text="cgroup v2 accounting is not available on this system")
+            return
+        
+        def fmt(value, suffix=""):
+            return "-" if value is None else f"{value:.1f}{suffix}"
+        
+        with self.profiler.timed("tree.cgroups"):
+            # Parents sort before their children, so they always exist first
+            for path in sorted(rates):
+                cpu, memory, read_kb_s, write_kb_s = rates[path]
+                values = (fmt(cpu), fmt(memory, " MB"), fmt(read_kb_s), fmt(write_kb_s))
+                if self.cgroups_tree.exists(path):
+                    self.cgroups_tree.item(path, values=values)
+                else:
+                    parent = "" if path == "/" else os.path.dirname(path)
+                    self.cgroups_tree.insert(parent, 'end', iid=path, text=cgroup_display_name(path),
+                                             values=values, open=path.count("/") < 2)
+            
+            # Drop groups that went away (children go with their parent)
+            stack = list(self.cgroups_tree.get_children())
+            while stack:
+                item = stack.pop()
+                if item not in rates:
+                    self.cgroups_tree.delete(item)
+                else:
+                    stack.extend(self.cgroups_tree.get_children(item))
+        
+        # Leaves are the containers and services themselves
+        parents = {os.path.dirname(path) for path in rates if path != "/"}
+        leaves = [path for path in rates if path not in parents]
+        top_cpu = max(leaves, key=lambda path: rates[path][0] or 0)
+        top_memory = max(leaves, key=lambda path: rates[path][1] or 0)
+        self.cgroups_summary.config(
+            text=f"Groups: {len(rates)} | Leaves: {len(leaves)} | "
+                 f"Top CPU: {cgroup_display_name(top_cpu)} ({fmt(rates[top_cpu][0], '%')}) | "
+                 f"Top memory: {cgroup_display_name(top_memory)} ({fmt(rates[top_memory][1], ' MB')})")
     
     def refresh_processes(self):
         """Refresh the process list"""
-        # Clear the list
-        for item in self.process_tree.get_children():
-            self.process_tree.delete(item)
+        with self.profiler.timed("collect.processes"):
+            processes = collect_processes(self.collector)
+            self.process_index.update(processes, self.sort_var.get())
         
-        # Get all processes
-        processes = []
-        for proc in psutil.process_iter(['pid', 'name', 'username', 'cpu_percent', 'memory_percent', 'status', 'num_threads', 'create_time']):
-            try:
-                pinfo = proc.info
-                # Get memory in MB
-                memory_mb = pinfo['memory_percent'] * psutil.virtual_memory().total / (1024 * 1024 * 100)
-                create_time = datetime.datetime.fromtimestamp(pinfo['create_time']).strftime('%Y-%m-%d %H:%M:%S')
-                processes.append({
-                    'pid': pinfo['pid'],
-                    'name': pinfo['name'],
-                    'cpu': pinfo['cpu_percent'],
-                    'memory': f"{memory_mb:.2f} MB",
-                    'memory_value': memory_mb,
-                    'status': pinfo['status'],
-                    'threads': pinfo['num_threads'],
-                    'created': create_time
-                })
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                pass
-        
-        # Sort processes
-        sort_by = self.sort_var.get()
-        if sort_by == "CPU":
-            processes.sort(key=lambda x: x['cpu'], reverse=True)
-        elif sort_by == "Memory":
-            processes.sort(key=lambda x: x['memory_value'], reverse=True)
-        elif sort_by == "Name":
-            processes.sort(key=lambda x: x['name'].lower())
-        elif sort_by == "PID":
-            processes.sort(key=lambda x: x['pid'])
-        
-        # Add processes to treeview
-        for proc in processes[:100]:  # Show top 100 processes
-            self.process_tree.insert('', 'end', values=(
-                proc['pid'],
-                proc['name'],
-                f"{proc['cpu']:.1f}",
-                proc['memory'],
-                proc['status'],
-                proc['threads'],
-                proc['created']
-            ))
+        # Drop cgroups of processes that exited
+        self.process_cgroups = {key: cgroup for key, cgroup in self.process_cgroups.items()
+                                if key in self.process_index.processes}
         
+        self.show_processes()
         self.log_to_console(f"Process list refreshed - {len(processes)} processes found")
     
+    def request_process_cmdlines(self):
+        """Fetch the command lines the filter does not know yet, off the Tk thread"""
+        keys = self.process_index.take_cmdline_requests()
+        if keys:
+            self.start_thread(lambda: self._collect_process_cmdlines(keys))
+    
+    def _collect_process_cmdlines(self, keys):
+        """Thread function reading command lines; one /proc read per process"""
+        with self.profiler.timed("collect.cmdlines"):
+            cmdlines = {key: self.collector.process_cmdline(key[0]) for key in keys}
+        self.after(0, lambda: self._apply_process_cmdlines(cmdlines))
+    
+    def _apply_process_cmdlines(self, cmdlines):
+        self.process_index.add_cmdlines(cmdlines)
+        if self.filter_var.get().strip():
+            self.show_processes()
+    
+    def show_processes(self):
+        """Show the processes matching the filter, in sort order"""
+        if self.filter_var.get().strip():
+            self.request_process_cmdlines()
+        grouped = self.group_cgroup_var.get()
+        with self.profiler.timed("filter.processes"):
+            processes = self.process_index.search(self.filter_var.get())
+            if grouped:
+                self.assign_process_cgroups(processes)
+        
+        total = len(self.process_index.processes)
+        if len(processes) < total:
+            self.filter_status.config(text=f"{len(processes)} of {total} match")
+        else:
+            self.filter_status.config(text="")
+        
+        with self.profiler.timed("tree.processes"):
+            # Clear the list
+            for item in self.process_tree.get_children():
+                self.process_tree.delete(item)
+            
+            self.process_tree.configure(show="tree headings" if grouped else "headings")
+            if grouped:
+                # Totals cover every process of a group, not just the rows shown
+                totals = {}
+                for proc in processes:
+                    total = totals.setdefault(proc['cgroup'], [0.0, 0.0, 0])
+                    total[0] += proc['cpu'] or 0
+                    total[1] += proc['memory_value']
+                    total[2] += 1
+            
+            # Add processes to treeview
+            for proc in processes[:100]:  # Show top 100 processes
+                parent = ''
+                if grouped:
+                    # Groups appear in the order of their top process
+                    parent = f"cgroup:{proc['cgroup']}"
+                    if not self.process_tree.exists(parent):
+                        cpu, memory, count = totals[proc['cgroup']]
+                        self.process_tree.insert('', 'end', iid=parent, open=True,
+                                                 text=cgroup_display_name(proc['cgroup']),
+                                                 values=("", proc['cgroup'], f"{cpu:.1f}", f"{memory:.2f} MB",
+                                                         f"{count} processes", "", ""))
+                self.process_tree.insert(parent, 'end', values=(
+                    proc['pid'],
+                    proc['name'],
+                    f"{proc['cpu']:.1f}",
+                    proc['memory'],
+                    proc['status'],
+                    proc['threads'],
+                    proc['created']
+                ))
+    
+    def assign_process_cgroups(self, processes):
+        """Set proc['cgroup'] on each process dict, looking each process up only once"""
+        for proc in processes:
+            key = (proc['pid'], proc['created'])  # Guards against pid reuse
+            cgroup = self.process_cgroups.get(key)
+            if cgroup is None:
+                cgroup = self.process_cgroups[key] = self.collector.process_cgroup(proc['pid']) or "?"
+            proc['cgroup'] = cgroup
+    
     def show_process_details(self, event):
         """Show details of the selected process"""
         selected_items = self.process_tree.selection()
@@ -767,27 +2173,16 @@ class SystemDashboard(tk.Tk):
             return
         
         item = selected_items[0]
+        if item.startswith("cgroup:"):
+            return  # A group row, not a process
         pid = int(self.process_tree.item(item, 'values')[0])
         
         try:
-            proc = psutil.Process(pid)
-            
             # Get process details
-            details = []
-            details.append(f"PID: {pid}")
-            details.append(f"Name: {proc.name()}")
-            details.append(f"Executable: {proc.exe()}")
-            details.append(f"Command Line: {' '.join(proc.cmdline())}")
-            details.append(f"Working Directory: {proc.cwd()}")
-            details.append(f"Status: {proc.status()}")
-            details.append(f"User: {proc.username()}")
-            details.append(f"CPU Usage: {proc.cpu_percent(interval=0.1):.1f}%")
-            details.append(f"Memory Usage: {proc.memory_info().rss / (1024 * 1024):.2f} MB")
-            details.append(f"Open Files: {len(proc.open_files())}")
-            details.append(f"Threads: {proc.num_threads()}")
+            details = [f"{label}: {value}" for label, value in self.collector.process_details(pid)]
             
             self.process_details.config(text='\n'.join(details))
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess) as e:
+        except psutil.Error as e:
             self.process_details.config(text=f"Error getting process details: {e}")
     
     def kill_selected_process(self):
@@ -797,6 +2192,8 @@ class SystemDashboard(tk.Tk):
             return
         
         item = selected_items[0]
+        if item.startswith("cgroup:"):
+            return  # A group row, not a process
         pid = int(self.process_tree.item(item, 'values')[0])
         name = self.process_tree.item(item, 'values')[1]
         
@@ -804,49 +2201,87 @@ class SystemDashboard(tk.Tk):
             return
         
         try:
-            proc = psutil.Process(pid)
-            proc.terminate()
+            self.collector.terminate(pid)
             self.log_to_console(f"Process {name} (PID: {pid}) terminated")
             
             # Refresh process list after a short delay
             self.after(1000, self.refresh_processes)
-        except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
+        except psutil.Error as e:
             self.log_to_console(f"Error terminating process: {e}")
             tk.messagebox.showerror("Error", f"Could not terminate process: {e}")
     
     def update_disk_usage(self):
         """Update disk usage information"""
-        # Clear existing disk frames
-        for widget in self.disks_frame.winfo_children():
-            widget.destroy()
-        
-        # Get disk partitions
-        partitions = psutil.disk_partitions()
+        self._disk_usage_job = None
+        if not self.is_view_visible("disk"):
+            # Refreshed as soon as the Disk tab is shown
+            self._disk_usage_job = self.after(BACKGROUND_INTERVAL * 1000, self.update_disk_usage)
+            return
+        self.samplers["disk_usage"].begin()
         
-        # Create a frame for each partition
-        for partition in partitions:
-            try:
-                usage = psutil.disk_usage(partition.mountpoint)
-                
-                # Create a frame for this partition
-                partition_frame = ttk.Frame(self.disks_frame)
-                partition_frame.pack(fill=tk.X, pady=5)
+        # disk_usage() can block indefinitely on a stale network mount, so stay off the Tk thread
+        self.start_thread(self._collect_disk_usage)
+    
+    def _collect_disk_usage(self):
+        """Thread function gathering partition usage through the worker pool"""
+        with self.profiler.timed("collect.disk_usage"):
+            partitions = self.collector.disk_partitions()
+            results = self.partition_pool.collect([partition.mountpoint for partition in partitions])
+        self.after(0, lambda: self._update_disk_usage_ui(partitions, results))
+    
+    def _update_disk_usage_ui(self, partitions, results):
+        """Update the partition rows in place with the collected usage"""
+        with self.profiler.timed("tree.disk_usage"):
+            shown = set()
+            for partition in partitions:
+                mountpoint = partition.mountpoint
+                if mountpoint not in results:
+                    # Skip partitions we can't access
+                    continue
+                usage, stale = results[mountpoint]
+                shown.add(mountpoint)
                 
-                # Disk info
-                info_text = f"{partition.mountpoint} ({partition.device})"
-                if partition.fstype:
-                    info_text += f" - {partition.fstype}"
+                row = self.partition_rows.get(mountpoint)
+                if row is None:
+                    # Create a frame for this partition
+                    partition_frame = ttk.Frame(self.disks_frame)
+                    partition_frame.pack(fill=tk.X, pady=5)
+                    
+                    # Disk info
+                    info_text = f"{mountpoint} ({partition.device})"
+                    if partition.fstype:
+                        info_text += f" - {partition.fstype}"
+                    
+                    label = ttk.Label(partition_frame, text=info_text)
+                    label.pack(side=tk.LEFT, padx=5)
+                    
+                    usage_label = ttk.Label(partition_frame)
+                    usage_label.pack(side=tk.RIGHT, padx=5)
+                    
+                    progress = ttk.Progressbar(partition_frame, style="green.Horizontal.TProgressbar", 
+                                              orient=tk.HORIZONTAL, length=100, mode="determinate")
+                    progress.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=5)
+                    
+                    row = self.partition_rows[mountpoint] = {
+                        "frame": partition_frame,
+                        "usage": usage_label,
+                        "progress": progress,
+                    }
                 
-                label = ttk.Label(partition_frame, text=info_text)
-                label.pack(side=tk.LEFT, padx=5)
+                if usage is None:
+                    # Never answered: most likely a hung mount
+                    row["usage"].config(text="Not responding", foreground="#AAAAAA")
+                    row["progress"]["value"] = 0
+                    continue
                 
                 # Usage text
                 used_gb = usage.used / (1024**3)
                 total_gb = usage.total / (1024**3)
                 percent = usage.percent
-                
-                usage_label = ttk.Label(partition_frame, text=f"{used_gb:.2f} GB / {total_gb:.2f} GB ({percent}%)")
-                usage_label.pack(side=tk.RIGHT, padx=5)
+                usage_text = f"{used_gb:.2f} GB / {total_gb:.2f} GB ({percent}%)"
+                if stale:
+                    usage_text += " - stale"
+                row["usage"].config(text=usage_text, foreground="#AAAAAA" if stale else "#FFFFFF")
                 
                 # Progress bar
                 style = "green.Horizontal.TProgressbar"
@@ -854,60 +2289,326 @@ class SystemDashboard(tk.Tk):
                     style = "red.Horizontal.TProgressbar"
                 elif percent > 70:
                     style = "yellow.Horizontal.TProgressbar"
-                
-                progress = ttk.Progressbar(partition_frame, style=style, 
-                                          orient=tk.HORIZONTAL, length=100, mode="determinate")
-                progress["value"] = percent
-                progress.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=5)
+                row["progress"].config(style=style)
+                row["progress"]["value"] = percent
                 
                 # Log critical disk space
-                if percent > 95:
-                    self.log_to_console(f"Critical: Disk {partition.mountpoint} is almost full ({percent}%)")
-            except (PermissionError, FileNotFoundError):
-                # Skip partitions we can't access
-                continue
+                if percent > 95 and not stale:
+                    self.log_to_console(f"Critical: Disk {mountpoint} is almost full ({percent}%)")
+            
+            # Drop rows of partitions that went away
+            for mountpoint in list(self.partition_rows):
+                if mountpoint not in shown:
+                    self.partition_rows.pop(mountpoint)["frame"].destroy()
         
         # Schedule next update
-        self.after(30000, self.update_disk_usage)  # Update every 30 seconds
+        self._disk_usage_job = self.schedule_tick(self.samplers["disk_usage"], self.update_disk_usage)  # Update every 30 seconds
     
     def update_network_connections(self):
         """Update list of network connections"""
-        # Clear existing items
-        for item in self.connections_tree.get_children():
-            self.connections_tree.delete(item)
+        self._connections_job = None
+        if not self.is_view_visible("network"):
+            # Refreshed as soon as the Network tab is shown
+            self._connections_job = self.after(BACKGROUND_INTERVAL * 1000, self.update_network_connections)
+            return
+        sampler = self.samplers["connections"]
+        sampler.begin()
         
         # Get network connections
-        connections = psutil.net_connections(kind='inet')
+        with self.profiler.timed("collect.connections"):
+            connections = collect_connections(self.collector)
         
-        # Process and add connections to the tree
-        for conn in connections:
-            try:
-                # Format addresses
-                laddr = f"{conn.laddr.ip}:{conn.laddr.port}" if conn.laddr else "-"
-                raddr = f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else "-"
-                
-                # Get process name
-                proc_name = "-"
-                if conn.pid:
-                    try:
-                        proc_name = psutil.Process(conn.pid).name()
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        pass
-                
-                # Add to tree
-                self.connections_tree.insert('', 'end', values=(
-                    conn.type,
-                    laddr,
-                    raddr,
-                    conn.status,
-                    conn.pid or "-",
-                    proc_name
-                ))
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
+        with self.profiler.timed("tree.connections"):
+            # Clear existing items
+            for item in self.connections_tree.get_children():
+                self.connections_tree.delete(item)
+            
+            # Add connections to the tree
+            for row in connections:
+                self.connections_tree.insert('', 'end', values=row)
         
         # Schedule next update
-        self.after(10000, self.update_network_connections)  # Update every 10 seconds
+        self._connections_job = self.schedule_tick(sampler, self.update_network_connections)  # Update every 10 seconds
+    
+    def update_fleet(self):
+        """Apply the host updates received since the last tick to the Fleet tab"""
+        self._fleet_job = None
+        if not self.is_view_visible("fleet"):
+            # Changes accumulate in the client until the tab is shown
+            self._fleet_job = self.after(BACKGROUND_INTERVAL * 1000, self.update_fleet)
+            return
+        sampler = self.samplers["fleet"]
+        sampler.begin()
+        
+        with self.profiler.timed("tree.fleet"):
+            # Only hosts that changed are touched, so hundreds of hosts stay cheap
+            changes = self.fleet_client.take_changes()
+            for address, (connected, data) in changes.items():
+                row = (
+                    data.get("hostname", address),
+                    address,
+                    "connected" if connected else "reconnecting",
+                    data.get("cpu", 0.0),
+                    data.get("memory", 0.0),
+                    data.get("net_sent_kbs", 0.0),
+                    data.get("net_recv_kbs", 0.0),
+                    data.get("disk_read_kbs", 0.0),
+                    data.get("disk_write_kbs", 0.0),
+                )
+                self.fleet_rows[address] = row
+                if self.fleet_tree.exists(address):
+                    self.fleet_tree.item(address, values=row)
+                else:
+                    self.fleet_tree.insert('', 'end', iid=address, values=row)
+            if changes:
+                self._order_fleet_rows()
+        
+        connected = sum(1 for row in self.fleet_rows.values() if row[2] == "connected")
+        self.fleet_summary.config(text=f"Hosts: {len(self.fleet_rows)} | Connected: {connected} | "
+                                       f"Reconnecting: {len(self.fleet_rows) - connected}")
+        
+        self._fleet_job = self.schedule_tick(sampler, self.update_fleet)
+    
+    def sort_fleet(self, column):
+        """Sort the host grid by column; clicking the same column again reverses the order"""
+        current, descending = self.fleet_sort
+        self.fleet_sort = (column, not descending if column == current else column not in ("host", "address", "status"))
+        self._order_fleet_rows()
+    
+    def _order_fleet_rows(self):
+        column, descending = self.fleet_sort
+        index = self.fleet_tree["columns"].index(column)
+        order = sorted(self.fleet_rows, key=lambda address: self.fleet_rows[address][index], reverse=descending)
+        if list(self.fleet_tree.get_children()) != order:
+            for position, address in enumerate(order):
+                self.fleet_tree.move(address, '', position)
+    
+    def open_fleet_host(self, event):
+        """Open (or raise) a window with the charts of the double-clicked host"""
+        address = self.fleet_tree.identify_row(event.y)
+        if not address:
+            return
+        if address in self.fleet_windows:
+            self.fleet_windows[address]["window"].lift()
+            return
+        
+        window = tk.Toplevel(self)
+        window.title(f"{self.fleet_rows[address][0]} ({address})")
+        window.geometry("900x600")
+        window.configure(bg="#2E2E2E")
+        
+        figure = Figure(figsize=(9, 6), dpi=100, facecolor="#2E2E2E")
+        plots = [figure.add_subplot(2, 2, i) for i in range(1, 5)]
+        for plot in plots:
+            plot.set_facecolor("#2E2E2E")
+            plot.tick_params(colors="#FFFFFF")
+        canvas = FigureCanvasTkAgg(figure, window)
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        def close():
+            self.fleet_windows.pop(address, None)
+            window.destroy()
+        
+        window.protocol("WM_DELETE_WINDOW", close)
+        self.fleet_windows[address] = {"window": window, "figure": figure, "canvas": canvas, "plots": plots}
+        self.draw_fleet_host(address)
+    
+    def draw_fleet_host(self, address):
+        """Redraw a host's chart window once a second while it is open"""
+        charts = self.fleet_windows.get(address)
+        if charts is None:
+            return
+        history = self.fleet_client.history(address)
+        cpu_plot, memory_plot, net_plot, disk_plot = charts["plots"]
+        
+        with self.profiler.timed("draw.fleet"):
+            render_history_plot(cpu_plot, "CPU %", 100, [(history["cpu"], "#3E8ADE", None)])
+            render_history_plot(memory_plot, "Memory %", 100, [(history["memory"], "#28A745", None)])
+            net_max = max(max(history["net_sent_kbs"]), max(history["net_recv_kbs"]), 100)
+            render_history_plot(net_plot, "Network KB/s", net_max * 1.1,
+                                [(history["net_sent_kbs"], "#3E8ADE", "Sent"),
+                                 (history["net_recv_kbs"], "#28A745", "Received")])
+            disk_max = max(max(history["disk_read_kbs"]), max(history["disk_write_kbs"]), 100)
+            render_history_plot(disk_plot, "Disk KB/s", disk_max * 1.1,
+                                [(history["disk_read_kbs"], "#3E8ADE", "Read"),
+                                 (history["disk_write_kbs"], "#28A745", "Write")])
+            charts["figure"].tight_layout()
+            charts["canvas"].draw()
+        
+        charts["window"].after(1000, lambda: self.draw_fleet_host(address))
+    
+    def get_self_stats(self):
+        """CPU and memory used by the dashboard process itself"""
+        with self.own_process.oneshot():
+            return {
+                "cpu_percent": self.own_process.cpu_percent(),
+                "rss_mb": self.own_process.memory_info().rss / (1024 * 1024),
+                "threads": self.own_process.num_threads(),
+            }
+    
+    def update_self_stats(self):
+        """Record the dashboard's own overhead and refresh the Self tab"""
+        sampler = self.samplers["self"]
+        sampler.begin()
+        
+        stats = self.get_self_stats()
+        now = time.time()
+        self.history.append("self.cpu_percent", stats["cpu_percent"], now)
+        self.history.append("self.rss_mb", stats["rss_mb"], now)
+        
+        if self.is_view_visible("self"):
+            self.self_process_info.config(
+                text=f"CPU: {stats['cpu_percent']:.1f}% | RSS: {stats['rss_mb']:.1f} MB | Threads: {stats['threads']}")
+            summary = self.profiler.summary()
+            
+            with self.profiler.timed("tree.self"):
+                for item in self.self_tree.get_children():
+                    self.self_tree.delete(item)
+                for name, row in summary.items():
+                    self.self_tree.insert('', 'end', values=(
+                        name,
+                        row["count"],
+                        f"{row['p50']:.2f}",
+                        f"{row['p95']:.2f}",
+                        f"{row['p99']:.2f}",
+                        f"{row['max']:.2f}"
+                    ))
+            
+            # Grouped horizontal bars: p50/p95/p99 per section
+            with self.profiler.timed("draw.self"):
+                names = list(summary)
+                positions = range(len(names))
+                self.self_plot.clear()
+                self.self_plot.set_facecolor("#2E2E2E")
+                self.self_plot.tick_params(colors="#FFFFFF")
+                for offset, (key, color) in enumerate((("p50", "#28A745"), ("p95", "#FFC107"), ("p99", "#DC3545"))):
+                    self.self_plot.barh([p + (offset - 1) * 0.25 for p in positions],
+                                        [summary[name][key] for name in names],
+                                        height=0.25, color=color, label=key)
+                self.self_plot.set_yticks(list(positions))
+                self.self_plot.set_yticklabels(names, fontsize=7)
+                self.self_plot.set_xlabel("ms", color="#FFFFFF")
+                if names:
+                    self.self_plot.legend(loc="lower right", facecolor="#2E2E2E", labelcolor="#FFFFFF")
+                self.self_figure.tight_layout()
+                self.self_canvas.draw()
+            
+            self._self_stats_job = self.schedule_tick(sampler, self.update_self_stats)
+        else:
+            self.finish_tick(sampler)
+            self._self_stats_job = self.after(BACKGROUND_INTERVAL * 1000, self.update_self_stats)
+    
+    def dump_self_profile(self):
+        """Save the dashboard's own timings to a JSON file"""
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".json", filetypes=[("JSON", "*.json")],
+            initialfile=f"dashboard_profile_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+        if not file_path:
+            return
+        try:
+            self.profiler.dump(file_path, self.get_self_stats())
+            self.log_to_console(f"Profile written to {file_path}")
+        except OSError as e:
+            tk.messagebox.showerror("Error", f"Could not write profile: {e}")
+    
+    def open_export_dialog(self):
+        """Pick series, time range and format for a history export (or cancel a running one)"""
+        if self.export_cancel is not None:
+            self.export_cancel.set()
+            return
+        
+        names = self.history.names()
+        dialog = tk.Toplevel(self)
+        dialog.title("Export History")
+        dialog.configure(bg="#2E2E2E")
+        dialog.transient(self)
+        
+        # Series to export, all selected by default
+        list_frame = ttk.LabelFrame(dialog, text="Series")
+        list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        series_list = tk.Listbox(list_frame, selectmode=tk.EXTENDED, height=15, width=60,
+                                 bg="#1E1E1E", fg="#FFFFFF", exportselection=False)
+        for name in names:
+            series_list.insert(tk.END, name)
+        series_list.select_set(0, tk.END)
+        
+        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=series_list.yview)
+        series_list.configure(yscrollcommand=scrollbar.set)
+        series_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=5)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # Time range and format
+        options_frame = ttk.Frame(dialog)
+        options_frame.pack(fill=tk.X, padx=10, pady=5)
+        
+        ttk.Label(options_frame, text="Range:").pack(side=tk.LEFT, padx=5)
+        range_var = tk.StringVar(value="Last hour")
+        ttk.Combobox(options_frame, textvariable=range_var, values=list(EXPORT_RANGES),
+                     state="readonly", width=16).pack(side=tk.LEFT, padx=5)
+        
+        formats = {FORMATS[fmt][0]: fmt for fmt in available_formats()}
+        ttk.Label(options_frame, text="Format:").pack(side=tk.LEFT, padx=5)
+        format_var = tk.StringVar(value=FORMATS["csv"][0])
+        ttk.Combobox(options_frame, textvariable=format_var, values=list(formats),
+                     state="readonly", width=12).pack(side=tk.LEFT, padx=5)
+        
+        def start():
+            selected = [names[i] for i in series_list.curselection()]
+            if not selected:
+                return
+            dialog.destroy()
+            self.export_history(selected, EXPORT_RANGES[range_var.get()], formats[format_var.get()])
+        
+        ttk.Button(options_frame, text="Export...", command=start).pack(side=tk.RIGHT, padx=5)
+    
+    def export_history(self, names, seconds, fmt):
+        """Ask for a file and stream the selected series to it from a worker thread"""
+        label, extension = FORMATS[fmt]
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=extension, filetypes=[(label, f"*{extension}")],
+            initialfile=f"dashboard_history_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}{extension}")
+        if not file_path:
+            return
+        
+        start = time.time() - seconds if seconds else None
+        self.export_cancel = threading.Event()
+        self.export_btn.config(text="Cancel Export")
+        self.log_to_console(f"Exporting {len(names)} series to {file_path}")
+        self.start_thread(lambda: self._export_history_thread(names, file_path, fmt, start))
+    
+    def _export_history_thread(self, names, file_path, fmt, start):
+        """Thread function writing the export; progress goes to the console"""
+        last_report = [time.monotonic()]
+        
+        def progress(done, total, rows):
+            # At most one console line per second
+            now = time.monotonic()
+            if now - last_report[0] >= 1:
+                last_report[0] = now
+                self.after(0, lambda: self.log_to_console(f"Export: {done}/{total} series, {rows} rows written"))
+        
+        message = "Export failed"
+        try:
+            rows = export_history(self.history, names, file_path, fmt, start=start,
+                                  progress=progress, cancel=self.export_cancel)
+            message = f"Exported {rows} rows to {file_path}"
+        except ExportCancelled:
+            message = "Export cancelled"
+            try:
+                os.remove(file_path)
+            except OSError:
+                pass
+        except Exception as e:
+            # Any writer error (pyarrow raises its own types) must still re-enable export
+            message = f"Export failed: {e}"
+        finally:
+            self.after(0, lambda: self._finish_export(message))
+    
+    def _finish_export(self, message):
+        self.export_cancel = None
+        self.export_btn.config(text="Export History...")
+        self.log_to_console(message)
     
     def analyze_directory(self):
         """Analyze the size of a directory"""
@@ -936,50 +2637,24 @@ class SystemDashboard(tk.Tk):
     def _analyze_directory_thread(self, path):
         """Thread function for directory analysis"""
         try:
-            # Get total size
-            total_size = 0
-            for dirpath, dirnames, filenames in os.walk(path):
-                for f in filenames:
-                    fp = os.path.join(dirpath, f)
-                    try:
-                        total_size += os.path.getsize(fp)
-                    except (PermissionError, FileNotFoundError):
-                        pass
-            
-            # Get subdirectories and their sizes
-            subdirs = []
-            for item in os.listdir(path):
-                item_path = os.path.join(path, item)
-                if os.path.isdir(item_path):
-                    try:
-                        dir_size = sum(os.path.getsize(os.path.join(dirpath, f))
-                                      for dirpath, dirnames, filenames in os.walk(item_path)
-                                      for f in filenames if os.path.exists(os.path.join(dirpath, f)))
-                        subdirs.append((item, dir_size))
-                    except (PermissionError, FileNotFoundError):
-                        subdirs.append((item, 0))  # Can't access
-            
-            # Sort subdirectories by size
-            subdirs.sort(key=lambda x: x[1], reverse=True)
+            with self.profiler.timed("collect.directory"):
+                scan = scan_directory(path)
             
             # Update UI
-            self.after(0, lambda: self._update_dir_analysis_ui(path, total_size, subdirs))
+            self.after(0, lambda: self._update_dir_analysis_ui(path, scan))
         except Exception as e:
             self.after(0, lambda: self._show_dir_analysis_error(str(e)))
     
-    def _update_dir_analysis_ui(self, path, total_size, subdirs):
+    def _update_dir_analysis_ui(self, path, scan):
         """Update UI with directory analysis results"""
+        total_size, subdirs = scan.total_size, scan.subdirs
+        
         # Clear existing results
         for widget in self.dir_results_frame.winfo_children():
             widget.destroy()
         
         # Format total size
-        if total_size > 1024**3:
-            size_str = f"{total_size / 1024**3:.2f} GB"
-        elif total_size > 1024**2:
-            size_str = f"{total_size / 1024**2:.2f} MB"
-        else:
-            size_str = f"{total_size / 1024:.2f} KB"
+        size_str = format_size(total_size)
         
         # Show total size
         ttk.Label(self.dir_results_frame, 
@@ -1007,12 +2682,7 @@ class SystemDashboard(tk.Tk):
         
         # Add subdirectories to the frame
         for i, (subdir, size) in enumerate(subdirs[:20]):  # Show top 20
-            if size > 1024**3:
-                size_str = f"{size / 1024**3:.2f} GB"
-            elif size > 1024**2:
-                size_str = f"{size / 1024**2:.2f} MB"
-            else:
-                size_str = f"{size / 1024:.2f} KB"
+            size_str = format_size(size)
             
             item_frame = ttk.Frame(inner_frame)
             item_frame.pack(fill=tk.X, pady=2)
@@ -1043,6 +2713,49 @@ class SystemDashboard(tk.Tk):
         canvas.config(width=500, height=min(300, inner_frame.winfo_height()))
         canvas.config(scrollregion=canvas.bbox(tk.ALL))
         
+        # Largest files, from the same scan
+        ttk.Label(self.dir_results_frame, text="Largest files:").pack(anchor=tk.W, pady=(10, 0))
+        files_tree = ttk.Treeview(self.dir_results_frame, columns=("file", "size", "modified"),
+                                  show="headings", height=min(8, max(1, len(scan.largest_files))))
+        files_tree.heading("file", text="File")
+        files_tree.heading("size", text="Size")
+        files_tree.heading("modified", text="Modified")
+        files_tree.column("file", width=450)
+        files_tree.column("size", width=100, anchor=tk.E)
+        files_tree.column("modified", width=150)
+        for size, file_path, mtime in scan.largest_files:
+            files_tree.insert('', 'end', values=(
+                os.path.relpath(file_path, path),
+                format_size(size),
+                datetime.datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M')
+            ))
+        files_tree.pack(fill=tk.X, pady=5)
+        
+        # Histograms by type, age and owner, side by side
+        histograms_frame = ttk.Frame(self.dir_results_frame)
+        histograms_frame.pack(fill=tk.X, pady=5)
+        
+        age_order = [label for _, label in AGE_BUCKETS]
+        for title, histogram, keys in (
+                ("By type", scan.by_extension, sorted(scan.by_extension, key=lambda k: scan.by_extension[k][1],
+                                                      reverse=True)[:10]),
+                ("By age", scan.by_age, [label for label in age_order if label in scan.by_age]),
+                ("By owner", scan.by_owner, sorted(scan.by_owner, key=lambda k: scan.by_owner[k][1],
+                                                   reverse=True)[:10])):
+            frame = ttk.LabelFrame(histograms_frame, text=title)
+            frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
+            tree = ttk.Treeview(frame, columns=("key", "files", "size"), show="headings", height=6)
+            tree.heading("key", text=title[3:].capitalize())
+            tree.heading("files", text="Files")
+            tree.heading("size", text="Size")
+            tree.column("key", width=110)
+            tree.column("files", width=70, anchor=tk.E)
+            tree.column("size", width=90, anchor=tk.E)
+            for key in keys:
+                files, size = histogram[key]
+                tree.insert('', 'end', values=(key, files, format_size(size)))
+            tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
         # Log completion
         self.log_to_console(f"Directory analysis completed for {path}")
     
@@ -1059,5 +2772,31 @@ class SystemDashboard(tk.Tk):
         self.log_to_console(f"Error in directory analysis: {error_message}")
 
 if __name__ == "__main__":
-    app = SystemDashboard()
-    app.mainloop()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="System Monitoring Dashboard")
+    parser.add_argument("--simulate", action="store_true",
+                        help="show a deterministic simulated system instead of this machine")
+    parser.add_argument("--processes", type=int, default=1000, help="simulated processes")
+    parser.add_argument("--connections", type=int, default=5000, help="simulated connections")
+    parser.add_argument("--disks", type=int, default=8, help="simulated disks")
+    parser.add_argument("--cores", type=int, default=8, help="simulated CPU cores")
+    parser.add_argument("--serve", metavar="HOST:PORT",
+                        help="run headless, publishing snapshots for a fleet dashboard")
+    parser.add_argument("--fleet", nargs="+", metavar="HOST:PORT", default=[],
+                        help="remote dashboards (started with --serve) to show on the Fleet tab")
+    parser.add_argument("--fleet-file", help="file listing fleet hosts, one HOST:PORT per line")
+    args = parser.parse_args()
+    
+    collector = None
+    if args.simulate:
+        collector = SimulatedCollector(args.processes, args.connections, args.disks, args.cores)
+    if args.serve:
+        fleet.serve(collector or PsutilCollector(), args.serve,
+                    on_ready=lambda addresses: print("Serving snapshots on " +
+                                                     ", ".join(f"{host}:{port}" for host, port in addresses)))
+    else:
+        fleet_hosts = list(args.fleet)
+        if args.fleet_file:
+            with open(args.fleet_file) as f:
+                fleet_hosts += [line.strip() for line in f if line.strip() and not line.startswith("#")]
+        app = SystemDashboard(collector, fleet_hosts)
+        app.mainloop()
\ No newline at end of file
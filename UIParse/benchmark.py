@@ -0,0 +1,122 @@
+"""Compare the XAML parser backends on real and synthetic workflows.
+
+Every workflow is parsed with each available backend (see uiparse_core.BACKENDS);
+the reports must be identical, and the median parse time and activities per
+second are printed per backend. Without paths only the synthetic workflow is used.
+
+    python benchmark.py                              # synthetic workflow only
+    python benchmark.py Main.xaml ~/rpa/Invoices     # plus real workflows / projects
+    python benchmark.py --activities 200000 --repeat 3
+"""
+import argparse
+import glob
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from uiparse_core import BACKENDS, parse_xaml_file
+
+XAML_HEADER = ('<Activity xmlns="http://schemas.microsoft.com/netfx/2009/xaml/activities" '
+               'xmlns:ui="http://schemas.uipath.com/workflow/activities" '
+               'xmlns:sap2010="http://schemas.microsoft.com/netfx/2010/xaml/activities/presentation">')
+
+
+def write_synthetic_workflow(path, activities):
+    """Write a workflow of Sequences holding clicks, assets, invokes and annotated log messages"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(XAML_HEADER + '<Sequence DisplayName="Main">')
+        for i in range(activities):
+            if i % 100 == 0:
+                f.write(f'<Sequence DisplayName="Block {i}">')
+            kind = i % 20
+            if kind == 0:
+                f.write(f'<ui:GetAsset DisplayName="Get asset {i}" AssetName="Asset{i % 50}" />')
+            elif kind == 1:
+                f.write(f'<ui:InvokeWorkflowFile DisplayName="Invoke {i}" WorkflowFile="Sub\\W{i % 30}.xaml" />')
+            elif kind < 10:
+                f.write(f'<ui:Click DisplayName="Click button {i}" TimeoutMS="3000" ContinueOnError="True" '
+                        f'Selector="&lt;wnd app=\'app{i % 7}.exe\' /&gt;&lt;ctrl name=\'Button {i}\' /&gt;" '
+                        f'sap2010:WorkflowViewState.IdRef="Click_{i}"><ui:Click.Target>'
+                        f'<ui:Target WaitForReady="INTERACTIVE" /></ui:Click.Target></ui:Click>')
+            else:
+                f.write(f'<ui:LogMessage DisplayName="Log {i}" Level="Info" Message="[&quot;step {i}&quot;]" '
+                        f'sap2010:Annotation.AnnotationText="Note for step {i}" />')
+            if i % 100 == 99:
+                f.write('</Sequence>')
+        if activities % 100:
+            f.write('</Sequence>')
+        f.write('</Sequence></Activity>')
+
+
+def expand_paths(paths):
+    """Workflows named on the command line; project folders contribute every .xaml below them"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, "**", "*.xaml"), recursive=True)))
+        else:
+            files.append(path)
+    return files
+
+
+def measure(files, backend, repeat):
+    """Parse all files once to warm up, then repeat times; return (durations, reports)"""
+    reports = [parse_xaml_file(f, backend) for f in files]
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for f in files:
+            parse_xaml_file(f, backend)
+        durations.append(time.perf_counter() - start)
+    return durations, reports
+
+
+def run(name, files, backends, repeat):
+    """Benchmark one set of files; return False when the backends disagree"""
+    size = sum(os.path.getsize(f) for f in files)
+    print(f"\n{name}: {len(files)} file(s), {size / 1024**2:.1f} MB")
+    print(f"{'backend':<10} {'median ms':>10} {'min ms':>10} {'activities/s':>14}")
+    reference = None
+    same = True
+    for backend in backends:
+        durations, reports = measure(files, backend, repeat)
+        activities = sum(len(r.get("activities", [])) for r in reports)
+        median = statistics.median(durations)
+        print(f"{backend:<10} {median * 1000:10.1f} {min(durations) * 1000:10.1f} "
+              f"{activities / median if median > 0 else 0:14.0f}")
+        if reference is None:
+            reference = reports
+        elif reports != reference:
+            print(f"  {backend} reports differ from {backends[0]}")
+            same = False
+    return same
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the XAML parser backends")
+    parser.add_argument("paths", nargs="*", help="workflows or project folders to parse as well")
+    parser.add_argument("--activities", type=int, default=50000,
+                        help="activities in the synthetic workflow (default 50000, 0 to skip)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per backend")
+    parser.add_argument("--backends", nargs="+", choices=sorted(BACKENDS), default=sorted(BACKENDS),
+                        help="backends to compare (default: all available)")
+    args = parser.parse_args()
+
+    if "lxml" not in BACKENDS:
+        print("lxml is not installed; only the stdlib backend is measured (pip install lxml)")
+
+    same = True
+    if args.paths:
+        same &= run("real workflows", expand_paths(args.paths), args.backends, args.repeat)
+    if args.activities:
+        with tempfile.TemporaryDirectory(prefix="uiparse-bench-") as tmp:
+            path = os.path.join(tmp, "Synthetic.xaml")
+            write_synthetic_workflow(path, args.activities)
+            same &= run(f"synthetic workflow ({args.activities} activities)", [path], args.backends, args.repeat)
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+"""Headless UiParse: analyze UiPath projects in batch, without Qt.
+
+Every PATH is either a project folder (it contains project.json) or a folder
+that is searched for projects, such as a checkout of many repositories. Each
+project's outline, invoke graph and assets are written to OUT as
+<name>.json and/or <name>.md. Projects are analyzed concurrently by a bounded
+pool of worker processes.
+
+Parse results are cached in OUT/.cache, so the analyzed checkouts are never
+written to; --cache-in-project keeps the cache in each project instead, where
+the UiParse app also finds it.
+
+    python cli.py ~/rpa/Invoices                      # one project
+    python cli.py ~/rpa/repos -o reports -j 8         # every project under repos
+    python cli.py ~/rpa/repos --format json --no-cache
+"""
+import argparse
+import json
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from uiparse_core import CACHE_FILE, build_project_map, make_outline_text
+
+FORMATS = ("json", "md")
+CACHE_DIR = ".cache"  # below the output folder
+
+
+def find_projects(path):
+    """Yield the project folders at or below path; folders inside a project are not searched."""
+    for dirpath, dirnames, filenames in os.walk(path):
+        if "project.json" in filenames:
+            dirnames[:] = []
+            yield dirpath
+        else:
+            dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+
+
+def report_name(path, project):
+    """Output name of a project: its path below the searched folder, flattened."""
+    rel = os.path.relpath(project, path)
+    base = os.path.basename(os.path.abspath(path))
+    return base if rel == "." else base + "__" + rel.replace(os.sep, "__")
+
+
+def outline_entry(rep):
+    """The per-workflow outline of the markdown report (see outline_section), as data."""
+    if "error" in rep:
+        return {"error": rep["error"]}
+    return {
+        "top_activities": dict(Counter(a["tag"] for a in rep["activities"]).most_common(10)),
+        "invokes": [{"workflow": i["workflow"], "display": i.get("display")} for i in rep.get("invokes", [])],
+        "notes": rep.get("annotations", [])[:10],
+        "sample_steps": [{"tag": s["tag"], "display": s["display"], "selector": s["selector"] or None,
+                          "coerror": s["coerror"]} for s in rep["activities"][:30]],
+    }
+
+
+def make_json_report(root, result):
+    return {
+        "root": root,
+        "entry": result["entry"],
+        "outline": {key: outline_entry(rep) for key, rep in result["files"].items()},
+        "graph": result["graph"],
+        "assets": result["assets_table"],
+        "activity_counts": result["activity_counts"],
+        "errors": {key: rep["error"] for key, rep in result["files"].items() if "error" in rep},
+    }
+
+
+def make_markdown_report(root, result):
+    lines = [make_outline_text(result), "\n## Assets"]
+    if result["assets_table"]:
+        lines.append("| AssetName | Refs | Kinds | Files |")
+        lines.append("|---|---|---|---|")
+        for row in result["assets_table"]:
+            lines.append(f"| {row['AssetName']} | {row['Refs']} | {row['Kinds']} | {row['Files']} |")
+    else:
+        lines.append("- none")
+    lines.append("\n## Graph")
+    for parent, children in result["graph"].items():
+        for child in children:
+            lines.append(f"- {parent} -> {child}")
+    return "\n".join(lines) + "\n"
+
+
+def analyze(root, out, name, formats, cache):
+    """Build one project's map and write its reports; returns (name, workflows, broken workflows, error).
+
+    cache is passed to build_project_map: False, True for the project's own cache, or a cache file.
+    """
+    result = build_project_map(root, workers=1, cache=cache)
+    if "error" in result:
+        return name, 0, 0, result["error"]
+    if "json" in formats:
+        with open(os.path.join(out, name + ".json"), "w", encoding="utf-8") as f:
+            json.dump(make_json_report(root, result), f, indent=2)
+    if "md" in formats:
+        with open(os.path.join(out, name + ".md"), "w", encoding="utf-8") as f:
+            f.write(make_markdown_report(root, result))
+    broken = sum(1 for rep in result["files"].values() if "error" in rep)
+    return name, len(result["files"]), broken, None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analyze UiPath projects and write outline, graph and assets reports")
+    parser.add_argument("paths", nargs="+", metavar="PATH", help="project folder, or folder to search for projects")
+    parser.add_argument("-o", "--out", default="uiparse-reports", help="output folder (default uiparse-reports)")
+    parser.add_argument("-f", "--format", nargs="+", choices=FORMATS, default=list(FORMATS),
+                        help="report formats (default: json md)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="projects analyzed at once (default: one per core)")
+    parser.add_argument("--no-cache", action="store_true", help="do not read or write a parse cache")
+    parser.add_argument("--cache-in-project", action="store_true",
+                        help=f"cache parse results in each project ({CACHE_FILE}) instead of below the output folder")
+    args = parser.parse_args(argv)
+
+    jobs = []
+    names = set()
+    for path in args.paths:
+        for project in find_projects(path):
+            name = report_name(path, project)
+            while name in names:
+                name += "_"
+            names.add(name)
+            jobs.append((project, name))
+    if not jobs:
+        print("No project.json found under the given paths", file=sys.stderr)
+        return 2
+
+    os.makedirs(args.out, exist_ok=True)
+    cache_dir = os.path.join(args.out, CACHE_DIR)
+    if not (args.no_cache or args.cache_in_project):
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def project_cache(name):
+        if args.no_cache:
+            return False
+        return True if args.cache_in_project else os.path.join(cache_dir, name + ".sqlite")
+
+    failed = 0
+    with ProcessPoolExecutor(max_workers=max(1, min(args.jobs, len(jobs)))) as pool:
+        futures = {pool.submit(analyze, project, args.out, name, args.format, project_cache(name)): name
+                   for project, name in jobs}
+        for done, future in enumerate(as_completed(futures), 1):
+            try:
+                name, files, broken, error = future.result()
+            except Exception as e:  # one broken project must not stop the batch
+                name, files, broken, error = futures[future], 0, 0, f"{type(e).__name__}: {e}"
+            if error:
+                failed += 1
+                print(f"[{done}/{len(jobs)}] {name}: ERROR {error}", file=sys.stderr)
+            else:
+                print(f"[{done}/{len(jobs)}] {name}: {files} workflows, {broken} with errors", file=sys.stderr)
+
+    print(f"{len(jobs) - failed} of {len(jobs)} projects analyzed; reports in {args.out}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,216 +1,153 @@
+import io
 import os
+import re
 import sys
 import json
+import time
 import yaml
+import bisect
+import threading
 import xmltodict
-import xml.dom.minidom as minidom
-import xml.etree.ElementTree as ET
-from collections import defaultdict, Counter, deque
+from collections import Counter, defaultdict
 
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QPushButton, QFileDialog, QPlainTextEdit,
-    QMessageBox, QComboBox, QHBoxLayout, QTabWidget, QTreeWidget, QTreeWidgetItem,
-    QTableWidget, QTableWidgetItem, QLabel, QHeaderView
+    QMessageBox, QComboBox, QHBoxLayout, QTabWidget, QTreeView, QTableView,
+    QLabel, QHeaderView, QProgressBar
+)
+from PyQt6.QtGui import QSyntaxHighlighter, QTextCharFormat, QTextCursor, QColor, QFont, QPainter
+from PyQt6.QtCore import (
+    QRect, Qt, QObject, QTimer, QRunnable, QThreadPool, pyqtSignal,
+    QAbstractTableModel, QAbstractItemModel, QModelIndex
+)
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:  # watch mode falls back to polling
+    Observer = None
+    FileSystemEventHandler = object
+
+from uiparse_core import (
+    build_project_map, make_outline_text, outline_section, outline_totals, ProjectModel
 )
-from PyQt6.QtGui import QSyntaxHighlighter, QTextCharFormat, QColor, QFont, QPainter
-from PyQt6.QtCore import QRect, Qt
 
 # -------------------------
-# Helpers for UiPath parsing
+# Converters
 # -------------------------
 
-def _lname(tag: str) -> str:
-    return tag.split('}')[-1] if '}' in tag else tag
+def iter_tree_lines(node, leaf_prefix=""):
+    """Yield an xmltodict tree as indented "key:" lines with the values below their keys.
+
+    Walks an explicit stack, so deeply nested workflows cannot hit the recursion limit.
+    """
+    stack = [(node, 0, False)]
+    while stack:
+        value, indent, is_line = stack.pop()
+        if is_line:
+            yield value
+        elif isinstance(value, dict):
+            spacing = "    " * indent
+            for key, child in reversed(value.items()):
+                stack.append((child, indent + 1, False))
+                stack.append((f"{spacing}{key}:\n", 0, True))
+        elif isinstance(value, list):
+            stack.extend((item, indent, False) for item in reversed(value))
+        else:
+            yield f"{'    ' * indent}{leaf_prefix}{value}\n"
 
-ASSET_ACTS = {"GetAsset", "GetCredential", "GetRobotAsset"}
-INVOKE_ACT = "InvokeWorkflowFile"
+def write_pseudocode(xaml_dict, out):
+    out.writelines(iter_tree_lines(xaml_dict))
 
-def parse_xaml_file(path: str):
-    """Parse a single XAML and return activities, invokes, assets, annotations."""
-    acts = []
-    invokes = []
-    assets = []
-    annotations = []
-    try:
-        for event, elem in ET.iterparse(path, events=("start",)):
-            name = _lname(elem.tag)
-
-            # pull common attributes (namespace-agnostic)
-            rec = {"tag": name}
-            for attr in ("DisplayName", "Selector", "TimeoutMS", "ContinueOnError", "WorkflowFile",
-                         "AssetName", "Name", "Value"):
-                if attr in elem.attrib:
-                    rec[attr] = elem.attrib.get(attr)
-                else:
-                    for k, v in elem.attrib.items():
-                        if k.endswith(attr):
-                            rec[attr] = v
-
-            # collect invokes
-            if name == INVOKE_ACT:
-                wf = rec.get("WorkflowFile")
-                if wf:
-                    invokes.append({"workflow": wf, "display": rec.get("DisplayName")})
-
-            # collect assets
-            if name in ASSET_ACTS:
-                assets.append({
-                    "activity": name,
-                    "asset": rec.get("AssetName") or rec.get("Name"),
-                    "display": rec.get("DisplayName")
-                })
-
-            # collect annotations: sap2010:Annotation.AnnotationText
-            for k, v in elem.attrib.items():
-                if k.endswith("Annotation.AnnotationText") and v:
-                    annotations.append({"for": rec.get("DisplayName") or name, "note": v})
-
-            # trimmed activity rows (skip containers)
-            if name not in {"Sequence", "Flowchart", "State", "StateMachine", "TryCatch", "ActivityAction"}:
-                acts.append({
-                    "tag": name,
-                    "display": rec.get("DisplayName"),
-                    "selector": (rec.get("Selector") or "")[:220],
-                    "timeout": rec.get("TimeoutMS"),
-                    "coerror": rec.get("ContinueOnError")
-                })
-
-            elem.clear()
-    except ET.ParseError as e:
-        return {"error": f"ParseError in {os.path.basename(path)}: {e}"}
-
-    return {"activities": acts, "invokes": invokes, "assets": assets, "annotations": annotations}
-
-def read_project_main(project_json_path: str) -> str:
-    with open(project_json_path, "r", encoding="utf-8") as f:
-        pj = json.load(f)
-    return pj.get("main", "Main.xaml")
-
-def build_project_map(root: str):
-    """Walk from project.json main → follow invokes → return graph + reports."""
-    pj_path = os.path.join(root, "project.json")
-    if not os.path.exists(pj_path):
-        return {"error": f"project.json not found in {root}"}
-
-    main = read_project_main(pj_path)
-    q = deque([main])
-    seen = set()
-    graph = defaultdict(list)
-    file_reports = {}
-    all_assets = []
-    activity_counter = Counter()
-
-    def norm(base, rel):
-        p = os.path.normpath(os.path.join(os.path.dirname(base), rel))
-        return os.path.relpath(p, root)
-
-    while q:
-        cur = q.popleft()
-        if cur in seen:
-            continue
-        seen.add(cur)
-        full = os.path.join(root, cur)
-        if not os.path.exists(full):
-            file_reports[cur] = {"error": f"Missing file: {cur}"}
-            continue
-
-        rep = parse_xaml_file(full)
-        file_reports[cur] = rep
-
-        # Graph edges
-        for inv in rep.get("invokes", []):
-            wf = inv["workflow"]
-            tgt = norm(cur, wf)
-            tgt_full = os.path.join(root, tgt)
-            graph[cur].append(tgt if os.path.exists(tgt_full) else f"{wf} (MISSING)")
-            if os.path.exists(tgt_full):
-                q.append(tgt)
-
-        # Assets + Activity counts
-        for a in rep.get("assets", []):
-            a["file"] = cur
-            all_assets.append(a)
-        for a in rep.get("activities", []):
-            activity_counter[a["tag"]] += 1
-
-    # Summarize assets
-    assets_summary = defaultdict(lambda: {"count": 0, "files": set(), "kinds": set()})
-    for a in all_assets:
-        name = a.get("asset")
-        if not name:
-            continue
-        assets_summary[name]["count"] += 1
-        assets_summary[name]["files"].add(a["file"])
-        assets_summary[name]["kinds"].add(a["activity"])
-
-    assets_table = []
-    for name, meta in sorted(assets_summary.items()):
-        assets_table.append({
-            "AssetName": name,
-            "Refs": meta["count"],
-            "Kinds": ",".join(sorted(meta["kinds"])),
-            "Files": ", ".join(sorted(meta["files"]))
-        })
-
-    return {
-        "entry": main,
-        "graph": dict(graph),
-        "files": file_reports,
-        "assets_table": assets_table,
-        "activity_counts": dict(activity_counter),
-    }
-
-def make_outline_text(result):
-    if "error" in result:
-        return f"ERROR: {result['error']}"
-
-    lines = [f"# Entry: {result['entry']}"]
-    for xaml, rep in result["files"].items():
-        lines.append(f"\n## {xaml}")
-        if "error" in rep:
-            lines.append(f"- ERROR: {rep['error']}")
-            continue
-
-        # Top activities (grouped)
-        c = Counter(a["tag"] for a in rep["activities"])
-        if c:
-            tops = ", ".join(f"{k}×{v}" for k, v in c.most_common(10))
-            lines.append(f"- Top activities: {tops}")
-
-        # Invokes
-        inv = rep.get("invokes", [])
-        if inv:
-            lines.append("- Invokes:")
-            for i in inv:
-                lines.append(f"  - {i['workflow']} ({i.get('display') or 'no display'})")
-
-        # Annotations (show a few)
-        ann = rep.get("annotations", [])
-        for a in ann[:10]:
-            lines.append(f"- Note [{a['for']}]: {a['note']}")
-
-        # Sample steps
-        steps = rep["activities"][:30]
-        if steps:
-            lines.append("- Sample steps:")
-            for s in steps:
-                desc = s["display"] or s["tag"]
-                sel = f" selector={s['selector']}" if s.get("selector") else ""
-                coe = f" coe={s['coerror']}" if s.get("coerror") else ""
-                lines.append(f"  · {s['tag']}: {desc}{sel}{coe}")
-
-    # Global activity counts
-    lines.append("\n## Global activity counts (top 25)")
-    c_all = Counter()
-    for rep in result["files"].values():
-        if isinstance(rep, dict) and "activities" in rep:
-            for a in rep["activities"]:
-                c_all[a["tag"]] += 1
-    for k, v in c_all.most_common(25):
-        lines.append(f"- {k}: {v}")
-
-    return "\n".join(lines)
+def write_visual_basic(xaml_dict, out):
+    out.writelines(iter_tree_lines(xaml_dict, "' "))
 
+def write_yaml(xaml_dict, out):
+    """Same text as yaml.dump(default_flow_style=False, sort_keys=False), emitted as the tree is walked.
+
+    yaml.dump represents the whole document as a node graph before writing a
+    byte; feeding the emitter events directly keeps memory flat.
+    """
+    dumper = yaml.Dumper(out, default_flow_style=False, sort_keys=False)
+    try:
+        dumper.emit(yaml.StreamStartEvent())
+        dumper.emit(yaml.DocumentStartEvent())
+        stack = [xaml_dict]
+        while stack:
+            value = stack.pop()
+            if isinstance(value, yaml.Event):
+                dumper.emit(value)
+            elif isinstance(value, dict):
+                dumper.emit(yaml.MappingStartEvent(None, None, True, flow_style=False))
+                stack.append(yaml.MappingEndEvent())
+                for key, child in reversed(value.items()):
+                    stack.append(child)
+                    stack.append(key)
+            elif isinstance(value, list):
+                dumper.emit(yaml.SequenceStartEvent(None, None, True, flow_style=False))
+                stack.append(yaml.SequenceEndEvent())
+                stack.extend(reversed(value))
+            else:
+                node = dumper.represent_data(value)
+                implicit = (node.tag == dumper.resolve(yaml.ScalarNode, node.value, (True, False)),
+                            node.tag == dumper.resolve(yaml.ScalarNode, node.value, (False, True)))
+                dumper.emit(yaml.ScalarEvent(None, node.tag, implicit, node.value, style=node.style))
+        dumper.emit(yaml.DocumentEndEvent())
+        dumper.emit(yaml.StreamEndEvent())
+    finally:
+        dumper.dispose()
+
+def write_json(xaml_dict, out):
+    out.writelines(json.JSONEncoder(indent=4).iterencode(xaml_dict))
+
+def write_xml(xaml_dict, out):
+    xmltodict.unparse(xaml_dict, output=out, pretty=True)
+
+# format dropdown entry -> (highlighter language, writer)
+CONVERTERS = {
+    "Python-like Pseudocode": ("Python", write_pseudocode),
+    "Visual Basic (VB)": ("VB", write_visual_basic),
+    "YAML": ("YAML", write_yaml),
+    "JSON": ("JSON", write_json),
+    "XML (Formatted)": ("XML", write_xml),
+}
+
+class ConversionCancelled(Exception):
+    pass
+
+class ChunkedOutput(io.TextIOBase):
+    """Text stream that hands what is written to emit() in chunks of about chunk_size characters."""
+    def __init__(self, emit, cancel, chunk_size=64 * 1024):
+        super().__init__()
+        self.emit = emit
+        self.cancel = cancel
+        self.chunk_size = chunk_size
+        self.parts = []
+        self.size = 0
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        if self.cancel.is_set():
+            raise ConversionCancelled()
+        self.parts.append(text)
+        self.size += len(text)
+        if self.size >= self.chunk_size:
+            self.flush()
+        return len(text)
+
+    def flush(self):
+        if self.parts:
+            self.emit("".join(self.parts))
+            self.parts = []
+            self.size = 0
+
+    def close(self):
+        # IOBase.close() flushes, also from __del__; text left over from a failed or
+        # cancelled conversion must not be emitted after it has finished
+        self.parts = []
+        super().close()
 
 # -------------------------
 # UI Components
@@ -247,41 +184,323 @@ class LineNumberArea(QWidget):
             bottom = top + self.editor.blockBoundingRect(block).height()
             block_number += 1
 
+class WatchdogHandler(FileSystemEventHandler):
+    def __init__(self, watcher):
+        super().__init__()
+        self.watcher = watcher
+
+    def on_any_event(self, event):
+        keys = set()
+        for path in (event.src_path, getattr(event, "dest_path", None)):
+            if path and (path.lower().endswith(".xaml") or os.path.basename(path) == "project.json"):
+                keys.add(os.path.relpath(path, self.watcher.model.root))
+        if keys:
+            self.watcher.changed.emit(keys)  # queued over to the UI thread
+
+class ProjectWatcher(QObject):
+    """Reports changed project files: inotify & co. through watchdog when installed, else polling."""
+    changed = pyqtSignal(object)  # set of project-relative paths
+
+    def __init__(self, model, parent=None, interval_ms=1000):
+        super().__init__(parent)
+        self.model = model
+        self.observer = None
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self.poll)
+
+    def start(self):
+        if Observer is not None:
+            self.observer = Observer()
+            self.observer.schedule(WatchdogHandler(self), self.model.root, recursive=True)
+            self.observer.daemon = True
+            self.observer.start()
+        else:
+            self.model.poll()
+            self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer = None
+
+    def poll(self):
+        changed = self.model.poll()
+        if changed:
+            self.changed.emit(changed)
+
+class AssetsModel(QAbstractTableModel):
+    """Rows of the assets table, kept sorted by asset name."""
+    COLUMNS = ["AssetName", "Refs", "Kinds", "Files"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []
+        self.names = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and index.isValid():
+            return str(self.rows[index.row()].get(self.COLUMNS[index.column()], ""))
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.COLUMNS[section]
+        return None
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self.rows = list(rows)
+        self.names = [row["AssetName"] for row in self.rows]
+        self.endResetModel()
+
+    def update_rows(self, rows, names):
+        """Insert, update or remove only the rows of the given asset names; rows maps name -> new row."""
+        for name in sorted(names):
+            r = bisect.bisect_left(self.names, name)
+            present = r < len(self.names) and self.names[r] == name
+            if name not in rows:
+                if present:
+                    self.beginRemoveRows(QModelIndex(), r, r)
+                    del self.rows[r], self.names[r]
+                    self.endRemoveRows()
+            elif present:
+                self.rows[r] = rows[name]
+                self.dataChanged.emit(self.index(r, 0), self.index(r, len(self.COLUMNS) - 1))
+            else:
+                self.beginInsertRows(QModelIndex(), r, r)
+                self.rows.insert(r, rows[name])
+                self.names.insert(r, name)
+                self.endInsertRows()
+
+class GraphNode:
+    __slots__ = ("key", "label", "parent", "row", "children")
+
+    def __init__(self, key, label, parent, row):
+        self.key = key
+        self.label = label
+        self.parent = parent
+        self.row = row
+        self.children = None  # created on first expand
+
+class GraphModel(QAbstractItemModel):
+    """Invoke tree whose nodes are created only when their parent is expanded.
+
+    Child lists are read from the shared graph dict, so a sub-workflow invoked
+    from many places costs nothing until one of its paths is opened, however
+    large its subtree is.
+    """
+    HEADER = "Workflow Graph (double-click node to show file outline sample)"
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.graph = {}
+        self.roots = []
+        self.nodes_by_key = defaultdict(list)
+
+    def reset(self, graph, entry=None, error=None):
+        self.beginResetModel()
+        self.graph = graph
+        self.nodes_by_key = defaultdict(list)
+        self.roots = []
+        if error:
+            self.roots.append(GraphNode(None, error, None, 0))
+        elif entry:
+            self.roots.append(self._make_node(entry, f"Entry: {entry}", None, 0))
+        self.endResetModel()
+
+    def _make_node(self, key, label, parent, row):
+        node = GraphNode(key, label, parent, row)
+        self.nodes_by_key[key].append(node)
+        return node
+
+    def _children_of(self, key):
+        return list(dict.fromkeys(self.graph.get(key, [])))
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        siblings = parent.internalPointer().children if parent.isValid() else self.roots
+        return self.createIndex(row, column, siblings[row])
+
+    def parent(self, index):
+        node = index.internalPointer() if index.isValid() else None
+        if node is None or node.parent is None:
+            return QModelIndex()
+        return self.createIndex(node.parent.row, 0, node.parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self.roots)
+        children = parent.internalPointer().children
+        return len(children) if children else 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def hasChildren(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return bool(self.roots)
+        node = parent.internalPointer()
+        return bool(node.children) if node.children is not None else bool(self.graph.get(node.key))
+
+    def canFetchMore(self, parent):
+        if not parent.isValid():
+            return False
+        node = parent.internalPointer()
+        return node.children is None and bool(self.graph.get(node.key))
+
+    def fetchMore(self, parent):
+        node = parent.internalPointer()
+        keys = self._children_of(node.key)
+        self.beginInsertRows(parent, 0, len(keys) - 1)
+        node.children = [self._make_node(key, key, node, row) for row, key in enumerate(keys)]
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return index.internalPointer().label
+        if role == Qt.ItemDataRole.UserRole:
+            return index.internalPointer().key
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADER
+        return None
+
+    def add_edges(self, key, edges):
+        """Record the edges of a file merged while building; True when a node of it is already on screen."""
+        self.graph[key] = edges
+        return bool(edges) and key in self.nodes_by_key
+
+    def refresh_expanders(self):
+        """Let the view re-ask hasChildren() for the nodes on screen."""
+        self.layoutAboutToBeChanged.emit()
+        self.layoutChanged.emit()
+
+class BuildSignals(QObject):
+    progress = pyqtSignal(int, int)  # workflows merged, workflows known so far
+    partial = pyqtSignal(object)     # [(key, report, edges)] in final outline order
+    finished = pyqtSignal(object)    # the result of build_project_map
+
+class BuildWorker(QRunnable):
+    """Runs build_project_map on the thread pool, streaming merged files in batches."""
+    def __init__(self, root, emit_interval=0.1):
+        super().__init__()
+        self.root = root
+        self.emit_interval = emit_interval
+        self.signals = BuildSignals()
+        self.cancel = threading.Event()
+        self.batch = []
+        self.counts = (0, 0)
+        self.last_emit = 0.0
+
+    def run(self):
+        try:
+            result = build_project_map(self.root, progress=self.on_progress, on_file=self.on_file, cancel=self.cancel)
+        except Exception as e:
+            result = {"error": f"{type(e).__name__}: {e}"}
+        self.flush()
+        self.signals.finished.emit(result)
+
+    def on_file(self, key, rep, edges):
+        self.batch.append((key, rep, list(edges)))
+
+    def on_progress(self, done, queued):
+        self.counts = (done, queued)
+        # batching keeps the UI thread from drowning in signals on cache hits
+        if time.monotonic() - self.last_emit >= self.emit_interval:
+            self.flush()
+
+    def flush(self):
+        self.last_emit = time.monotonic()
+        if self.batch:
+            self.signals.partial.emit(self.batch)
+            self.batch = []
+        self.signals.progress.emit(*self.counts)
+
+class ConvertSignals(QObject):
+    chunk = pyqtSignal(str)     # the next piece of converted text
+    finished = pyqtSignal(str)  # error message, empty on success
+
+class ConvertWorker(QRunnable):
+    """Parses one XAML and streams its conversion on the thread pool."""
+    def __init__(self, xaml_text, format_choice, in_flight=2):
+        super().__init__()
+        self.xaml_text = xaml_text
+        self.format_choice = format_choice
+        self.signals = ConvertSignals()
+        self.cancel = threading.Event()
+        # chunks emitted but not yet appended; the UI releases one per chunk shown
+        self.slots = threading.Semaphore(in_flight)
+
+    def run(self):
+        error = ""
+        try:
+            xaml_dict = xmltodict.parse(self.xaml_text)
+            out = ChunkedOutput(self.emit_chunk, self.cancel)
+            CONVERTERS[self.format_choice][1](xaml_dict, out)
+            out.flush()
+        except ConversionCancelled:
+            return
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        self.signals.finished.emit(error)
+
+    def emit_chunk(self, text):
+        # the converters outrun the text view; wait rather than queue the whole output as signals
+        while not self.slots.acquire(timeout=0.1):
+            if self.cancel.is_set():
+                raise ConversionCancelled()
+        self.signals.chunk.emit(text)
+
+QUOTE_RE = re.compile("[\"']")
+
 class MultiSyntaxHighlighter(QSyntaxHighlighter):
     def __init__(self, document, language):
         super().__init__(document)
         self.language = language
-    def highlightBlock(self, text):
-        if self.language == "Python":
+        # formats are built once here; highlightBlock runs for every line of a big conversion
+        if language == "Python":
             keywords = ['for', 'while', 'if', 'else', 'def', 'class', 'return', 'import', 'from', 'as']
             color_keyword = QColor("#569CD6"); color_comment = QColor("#6A9955"); color_string = QColor("#CE9178")
-        elif self.language in ["JSON", "YAML", "XML"]:
+        elif language in ["JSON", "YAML", "XML"]:
             keywords = []; color_keyword = QColor("#D19A66"); color_comment = QColor("#6A9955"); color_string = QColor("#98C379")
-        elif self.language == "VB":
+        elif language == "VB":
             keywords = ["Dim", "As", "Sub", "Function", "End", "If", "Then", "Else", "For", "Next", "Do", "Loop"]
             color_keyword = QColor("#C586C0"); color_comment = QColor("#6A9955"); color_string = QColor("#CE9178")
         else:
+            self.keywords = None
             return
-        format_keyword = QTextCharFormat(); format_keyword.setForeground(color_keyword); format_keyword.setFontWeight(QFont.Weight.Bold)
-        format_comment = QTextCharFormat(); format_comment.setForeground(color_comment)
-        format_string = QTextCharFormat(); format_string.setForeground(color_string)
-        for word in keywords:
+        self.keywords = keywords
+        self.format_keyword = QTextCharFormat(); self.format_keyword.setForeground(color_keyword); self.format_keyword.setFontWeight(QFont.Weight.Bold)
+        self.format_comment = QTextCharFormat(); self.format_comment.setForeground(color_comment)
+        self.format_string = QTextCharFormat(); self.format_string.setForeground(color_string)
+    def highlightBlock(self, text):
+        if self.keywords is None:
+            return
+        for word in self.keywords:
             index = text.find(word)
             while index >= 0:
-                self.setFormat(index, len(word), format_keyword)
+                self.setFormat(index, len(word), self.format_keyword)
                 index = text.find(word, index + len(word))
         if "#" in text:
             index = text.find("#")
-            self.setFormat(index, len(text) - index, format_comment)
-        # naive string highlight
-        in_string = False; start = -1
-        for i, ch in enumerate(text):
-            if ch in ('"', "'"):
-                if in_string:
-                    self.setFormat(start, i - start + 1, format_string)
-                    in_string = False
-                else:
-                    in_string = True; start = i
+            self.setFormat(index, len(text) - index, self.format_comment)
+        # naive string highlight: quotes pair up in order, whichever kind they are
+        quotes = [m.start() for m in QUOTE_RE.finditer(text)]
+        for start, end in zip(quotes[0::2], quotes[1::2]):
+            self.setFormat(start, end - start + 1, self.format_string)
 
 class XAMLConverterApp(QWidget):
     def __init__(self):
@@ -292,6 +511,19 @@ class XAMLConverterApp(QWidget):
         self.xaml_data = None
         self.project_root = None
         self.result_cache = None
+        self.project_model = None
+        self.watcher = None
+        self.outline_sections = {}
+        self.build_worker = None
+        self.build_notify = True
+        self.convert_worker = None
+
+        # changes are applied once the editor has finished saving
+        self.pending_changes = set()
+        self.change_timer = QTimer(self)
+        self.change_timer.setSingleShot(True)
+        self.change_timer.setInterval(300)
+        self.change_timer.timeout.connect(self.apply_pending_changes)
 
         # ---------- Top controls ----------
         top_bar = QHBoxLayout()
@@ -311,6 +543,12 @@ class XAMLConverterApp(QWidget):
         self.build_map_btn.clicked.connect(self.build_map)
         top_bar.addWidget(self.build_map_btn)
 
+        self.watch_btn = QPushButton("Watch")
+        self.watch_btn.setCheckable(True)
+        self.watch_btn.setStyleSheet("background-color:#16a085;color:white;font-weight:bold;padding:6px;border-radius:6px;")
+        self.watch_btn.toggled.connect(self.toggle_watch)
+        top_bar.addWidget(self.watch_btn)
+
         self.format_dropdown = QComboBox()
         self.format_dropdown.addItems(["Python-like Pseudocode", "Visual Basic (VB)", "YAML", "JSON", "XML (Formatted)"])
         top_bar.addWidget(self.format_dropdown)
@@ -354,20 +592,36 @@ class XAMLConverterApp(QWidget):
         self.tabs.addTab(self.outline_view, "Outline")
 
         # Assets tab
-        self.assets_table = QTableWidget(0, 4)
-        self.assets_table.setHorizontalHeaderLabels(["AssetName", "Refs", "Kinds", "Files"])
+        self.assets_model = AssetsModel(self)
+        self.assets_table = QTableView()
+        self.assets_table.setModel(self.assets_model)
         self.assets_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.tabs.addTab(self.assets_table, "Assets")
 
         # Graph tab
-        self.graph_tree = QTreeWidget()
-        self.graph_tree.setHeaderLabels(["Workflow Graph (double-click node to show file outline sample)"])
-        self.graph_tree.itemDoubleClicked.connect(self.on_graph_item_double_click)
+        self.graph_model = GraphModel(self)
+        self.graph_tree = QTreeView()
+        self.graph_tree.setModel(self.graph_model)
+        self.graph_tree.setUniformRowHeights(True)
+        self.graph_tree.doubleClicked.connect(self.on_graph_item_double_click)
         self.tabs.addTab(self.graph_tree, "Graph")
 
+        # ---------- Build progress (shown while a build runs) ----------
+        progress_bar = QHBoxLayout()
+        self.build_progress = QProgressBar()
+        self.build_progress.setFormat("%v / %m workflows")
+        progress_bar.addWidget(self.build_progress)
+        self.cancel_build_btn = QPushButton("Cancel")
+        self.cancel_build_btn.setStyleSheet("background-color:#c0392b;color:white;font-weight:bold;padding:6px;border-radius:6px;")
+        self.cancel_build_btn.clicked.connect(self.cancel_build)
+        progress_bar.addWidget(self.cancel_build_btn)
+        self.progress_widget = QWidget(); self.progress_widget.setLayout(progress_bar)
+        self.progress_widget.hide()
+
         # Layout root
         root = QVBoxLayout()
         root.addLayout(top_bar)
+        root.addWidget(self.progress_widget)
         root.addWidget(self.tabs)
         self.setLayout(root)
 
@@ -379,6 +633,7 @@ class XAMLConverterApp(QWidget):
     def upload_xaml(self):
         file_path, _ = QFileDialog.getOpenFileName(self, "Open XAML File", "", "XAML Files (*.xaml)")
         if file_path:
+            self.discard_conversion()
             with open(file_path, "r", encoding="utf-8") as f:
                 self.xaml_data = f.read()
             self.output_area.setPlainText(self.xaml_data)
@@ -396,41 +651,160 @@ class XAMLConverterApp(QWidget):
         if not self.project_root:
             QMessageBox.warning(self, "Warning", "Please choose a UiPath project folder first.")
             return
-        result = build_project_map(self.project_root)
+        self.start_build()
+
+    # ---------- Background build ----------
+    def start_build(self, notify=True):
+        """Build the map on the thread pool; Outline and Graph fill in as files are parsed."""
+        if self.build_worker is not None:
+            return
+        self.build_notify = notify
+        self.outline_view.clear()
+        self.assets_model.set_rows([])
+        self.graph_model.reset({})
+
+        worker = self.build_worker = BuildWorker(self.project_root)
+        worker.signals.progress.connect(self.on_build_progress)
+        worker.signals.partial.connect(self.on_build_partial)
+        worker.signals.finished.connect(self.on_build_finished)
+        self.build_map_btn.setEnabled(False)
+        self.cancel_build_btn.setEnabled(True)
+        self.build_progress.setRange(0, 0)
+        self.progress_widget.show()
+        QThreadPool.globalInstance().start(worker)
+
+    def on_build_progress(self, done, queued):
+        self.build_progress.setRange(0, max(queued, 1))
+        self.build_progress.setValue(done)
+
+    def on_build_partial(self, batch):
+        shown = False
+        for key, rep, edges in batch:
+            if not self.graph_model.roots:
+                # the first file merged is the entry point
+                self.outline_view.setPlainText(f"# Entry: {key}")
+                self.graph_model.reset({}, entry=key)
+            self.outline_view.appendPlainText("\n".join(outline_section(key, rep)))
+            shown |= self.graph_model.add_edges(key, edges)
+            if key == self.graph_model.roots[0].key:
+                self.graph_tree.expand(self.graph_model.index(0, 0))
+        if shown:
+            self.graph_model.refresh_expanders()
+
+    def on_build_finished(self, result):
+        self.build_worker = None
+        self.progress_widget.hide()
+        self.build_map_btn.setEnabled(True)
+        self.load_result(result, streamed="error" not in result)
+        if not self.build_notify:
+            return
+        if result.get("cancelled"):
+            QMessageBox.information(self, "Cancelled", f"Build cancelled; showing the {len(result['files'])} workflows parsed so far.")
+        else:
+            QMessageBox.information(self, "Done", "Project map built.")
+
+    def cancel_build(self):
+        if self.build_worker is not None:
+            self.build_worker.cancel.set()
+            self.cancel_build_btn.setEnabled(False)
+
+    def discard_build(self):
+        """Cancel a running build and drop whatever it still delivers."""
+        worker = self.build_worker
+        if worker is None:
+            return
+        worker.cancel.set()
+        for signal in (worker.signals.progress, worker.signals.partial, worker.signals.finished):
+            signal.disconnect()
+        self.build_worker = None
+        self.progress_widget.hide()
+        self.build_map_btn.setEnabled(True)
+
+    def load_result(self, result, streamed=False):
+        """Show a build result; a streamed build already has its graph on screen."""
         self.result_cache = result
+        complete = "error" not in result and not result.get("cancelled")
+        self.project_model = ProjectModel(self.project_root, result) if complete else None
+        if self.watcher is not None:
+            self.watcher.model = self.project_model or self.watcher.model
 
         # Fill Outline tab
-        self.outline_view.setPlainText(make_outline_text(result))
+        if "error" in result:
+            self.outline_sections = {}
+            self.outline_view.setPlainText(make_outline_text(result))
+        else:
+            self.outline_sections = {key: "\n".join(outline_section(key, rep)) for key, rep in result["files"].items()}
+            self.render_outline()
 
         # Fill Assets tab
-        self.assets_table.setRowCount(0)
-        for row in result.get("assets_table", []):
-            r = self.assets_table.rowCount()
-            self.assets_table.insertRow(r)
-            self.assets_table.setItem(r, 0, QTableWidgetItem(row.get("AssetName", "")))
-            self.assets_table.setItem(r, 1, QTableWidgetItem(str(row.get("Refs", 0))))
-            self.assets_table.setItem(r, 2, QTableWidgetItem(row.get("Kinds", "")))
-            self.assets_table.setItem(r, 3, QTableWidgetItem(row.get("Files", "")))
-
-        # Fill Graph tab
-        self.graph_tree.clear()
+        self.assets_model.set_rows(result.get("assets_table", []))
+
+        # Fill Graph tab (the streamed edges are the final ones; keep what the user expanded)
+        if streamed:
+            self.graph_model.graph = result["graph"]
+        else:
+            self.fill_graph()
+
+    def render_outline(self):
+        """Join the cached per-file sections; the scroll position survives the update."""
+        result = self.result_cache
+        text = "\n".join([f"# Entry: {result['entry']}"]
+                         + [self.outline_sections[key] for key in result["files"]]
+                         + outline_totals(Counter(result["activity_counts"])))
+        bar = self.outline_view.verticalScrollBar()
+        pos = bar.value()
+        self.outline_view.setPlainText(text)
+        bar.setValue(pos)
+
+    def fill_graph(self):
+        result = self.result_cache
         if "error" in result:
-            QTreeWidgetItem(self.graph_tree, [result["error"]])
+            self.graph_model.reset({}, error=result["error"])
         else:
-            root_item = QTreeWidgetItem(self.graph_tree, [f"Entry: {result['entry']}"])
-            added = set()
-            def add_children(parent_item, parent_key):
-                for child in result["graph"].get(parent_key, []):
-                    if (parent_key, child) in added:
-                        continue
-                    added.add((parent_key, child))
-                    ci = QTreeWidgetItem(parent_item, [child])
-                    if child in result["graph"]:
-                        add_children(ci, child)
-            add_children(root_item, result["entry"])
-            self.graph_tree.expandAll()
-
-        QMessageBox.information(self, "Done", "Project map built.")
+            self.graph_model.reset(result["graph"], entry=result["entry"])
+            self.graph_tree.expand(self.graph_model.index(0, 0))
+
+    # ---------- Watch mode ----------
+    def toggle_watch(self, checked):
+        if not checked:
+            if self.watcher is not None:
+                self.watcher.stop()
+                self.watcher = None
+            return
+        if self.project_model is None:
+            QMessageBox.warning(self, "Warning", "Build the project map before watching it.")
+            self.watch_btn.setChecked(False)
+            return
+        self.watcher = ProjectWatcher(self.project_model, self)
+        self.watcher.changed.connect(self.queue_changes)
+        self.watcher.start()
+
+    def queue_changes(self, keys):
+        self.pending_changes |= keys
+        self.change_timer.start()
+
+    def apply_pending_changes(self):
+        keys, self.pending_changes = self.pending_changes, set()
+        if self.project_model is None:
+            return
+        delta = self.project_model.apply_changes(keys)
+        if delta is None:
+            # the entry point moved: nothing to patch
+            self.start_build(notify=False)
+            return
+
+        files = self.result_cache["files"]
+        for key in delta["files"]:
+            if key in files:
+                self.outline_sections[key] = "\n".join(outline_section(key, files[key]))
+            else:
+                self.outline_sections.pop(key, None)
+        if delta["files"]:
+            self.render_outline()
+        self.assets_model.update_rows({row["AssetName"]: row for row in self.result_cache["assets_table"]
+                                       if row["AssetName"] in delta["assets"]}, delta["assets"])
+        if delta["graph"]:
+            self.fill_graph()
 
     # ---------- Converters (single XAML) ----------
     def convert_xaml(self):
@@ -438,57 +812,47 @@ class XAMLConverterApp(QWidget):
             QMessageBox.warning(self, "Warning", "No XAML file loaded in Raw tab!")
             return
 
-        xaml_dict = xmltodict.parse(self.xaml_data)
+        self.discard_conversion()
         format_choice = self.format_dropdown.currentText()
+        language = CONVERTERS[format_choice][0]
 
-        if format_choice == "Python-like Pseudocode":
-            converted_code = self.to_pseudocode(xaml_dict); language = "Python"
-        elif format_choice == "Visual Basic (VB)":
-            converted_code = self.to_visual_basic(xaml_dict); language = "VB"
-        elif format_choice == "YAML":
-            converted_code = yaml.dump(xaml_dict, default_flow_style=False, sort_keys=False); language = "YAML"
-        elif format_choice == "JSON":
-            converted_code = json.dumps(xaml_dict, indent=4); language = "JSON"
-        elif format_choice == "XML (Formatted)":
-            xml_string = xmltodict.unparse(xaml_dict, pretty=True)
-            converted_code = minidom.parseString(xml_string).toprettyxml()
-            language = "XML"
-        else:
-            converted_code = ""
-            language = "Python"
-
-        self.output_area.setPlainText(converted_code)
+        # the output arrives in chunks, highlighted as it is appended
+        self.output_area.clear()
+        if self.highlighter is not None:
+            self.highlighter.setDocument(None)
         self.highlighter = MultiSyntaxHighlighter(self.output_area.document(), language)
         self.current_language = language
 
-    # ---------- Pretty printers ----------
-    def to_pseudocode(self, xaml_dict, indent=0):
-        pseudocode = ""
-        spacing = "    " * indent
-        if isinstance(xaml_dict, dict):
-            for key, value in xaml_dict.items():
-                pseudocode += f"{spacing}{key}:\n"
-                pseudocode += self.to_pseudocode(value, indent + 1)
-        elif isinstance(xaml_dict, list):
-            for item in xaml_dict:
-                pseudocode += self.to_pseudocode(item, indent)
-        else:
-            pseudocode += f"{'    '*indent}{xaml_dict}\n"
-        return pseudocode
-
-    def to_visual_basic(self, xaml_dict, indent=0):
-        vb_code = ""
-        spacing = "    " * indent
-        if isinstance(xaml_dict, dict):
-            for key, value in xaml_dict.items():
-                vb_code += f"{spacing}{key}:\n"
-                vb_code += self.to_visual_basic(value, indent + 1)
-        elif isinstance(xaml_dict, list):
-            for item in xaml_dict:
-                vb_code += self.to_visual_basic(item, indent)
-        else:
-            vb_code += f"{spacing}' {xaml_dict}\n"
-        return vb_code
+        worker = self.convert_worker = ConvertWorker(self.xaml_data, format_choice)
+        worker.signals.chunk.connect(self.append_output)
+        worker.signals.finished.connect(self.on_conversion_finished)
+        self.convert_btn.setEnabled(False)
+        QThreadPool.globalInstance().start(worker)
+
+    def append_output(self, text):
+        if self.convert_worker is None:
+            return
+        cursor = QTextCursor(self.output_area.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.insertText(text)
+        self.convert_worker.slots.release()
+
+    def on_conversion_finished(self, error):
+        self.convert_worker = None
+        self.convert_btn.setEnabled(True)
+        if error:
+            QMessageBox.warning(self, "Conversion failed", error)
+
+    def discard_conversion(self):
+        """Cancel a running conversion and drop whatever it still delivers."""
+        worker = self.convert_worker
+        if worker is None:
+            return
+        worker.cancel.set()
+        for signal in (worker.signals.chunk, worker.signals.finished):
+            signal.disconnect()
+        self.convert_worker = None
+        self.convert_btn.setEnabled(True)
 
     # ---------- Utilities ----------
     def copy_to_clipboard(self):
@@ -502,10 +866,15 @@ class XAMLConverterApp(QWidget):
         QMessageBox.information(self, "Copied", "Copied current tab content to clipboard.")
 
     def reset_output(self):
+        self.discard_build()
+        self.discard_conversion()
+        self.watch_btn.setChecked(False)
+        self.project_model = None
         self.output_area.clear()
         self.outline_view.clear()
-        self.assets_table.setRowCount(0)
-        self.graph_tree.clear()
+        self.assets_model.set_rows([])
+        self.graph_model.reset({})
+        self.outline_sections = {}
         self.xaml_data = None
         self.result_cache = None
 
@@ -538,11 +907,11 @@ class XAMLConverterApp(QWidget):
                 lines.append(f"{parent} -> {ch}")
         return "\n".join(lines)
 
-    def on_graph_item_double_click(self, item, col):
+    def on_graph_item_double_click(self, index):
         if not self.result_cache or "files" not in self.result_cache:
             return
         # Try to show sample for this node if it is a file key
-        key = item.text(0)
+        key = index.data(Qt.ItemDataRole.UserRole)
         rep = self.result_cache["files"].get(key)
         if not rep:
             return
@@ -560,6 +929,12 @@ class XAMLConverterApp(QWidget):
         self.outline_view.setPlainText("\n".join(lines))
         self.tabs.setCurrentWidget(self.outline_view)
 
+    def closeEvent(self, event):
+        self.discard_build()
+        self.discard_conversion()
+        self.watch_btn.setChecked(False)
+        super().closeEvent(event)
+
 
 # -------------------------
 # Main
@@ -0,0 +1,90 @@
+"""Regression checks for the project outline; run with python -m unittest test_outline."""
+import os
+import shutil
+import tempfile
+import unittest
+
+from uiparse_core import build_project_map, make_outline_text
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+MAIN_XAML = """<Activity xmlns="http://schemas.microsoft.com/netfx/2009/xaml/activities" \
+xmlns:ui="http://schemas.uipath.com/workflow/activities" \
+xmlns:sap2010="http://schemas.microsoft.com/netfx/2010/xaml/activities/presentation">
+  <Sequence DisplayName="Main">
+    <ui:LogMessage DisplayName="Start" sap2010:Annotation.AnnotationText="Entry point" />
+    <ui:InvokeWorkflowFile DisplayName="Run child" WorkflowFile="Sub/Child.xaml" />
+    <ui:Click DisplayName="Submit" ContinueOnError="True" Selector="&lt;wnd app='app.exe' /&gt;" />
+  </Sequence>
+</Activity>
+"""
+
+CHILD_XAML = """<Activity xmlns="http://schemas.microsoft.com/netfx/2009/xaml/activities" \
+xmlns:ui="http://schemas.uipath.com/workflow/activities">
+  <Sequence DisplayName="Child">
+    <ui:GetAsset DisplayName="Read credentials" AssetName="Login" />
+    <ui:InvokeWorkflowFile WorkflowFile="Missing.xaml" />
+  </Sequence>
+</Activity>
+"""
+
+# Outline produced by main.py before the analysis moved to uiparse_core
+EXPECTED_OUTLINE = """# Entry: Main.xaml
+
+## Main.xaml
+- Top activities: Activity×1, LogMessage×1, InvokeWorkflowFile×1, Click×1
+- Invokes:
+  - Sub/Child.xaml (Run child)
+- Note [Start]: Entry point
+- Sample steps:
+  · Activity: Activity
+  · LogMessage: Start
+  · InvokeWorkflowFile: Run child
+  · Click: Submit selector=<wnd app='app.exe' /> coe=True
+
+## Sub/Child.xaml
+- Top activities: Activity×1, GetAsset×1, InvokeWorkflowFile×1
+- Invokes:
+  - Missing.xaml (no display)
+- Sample steps:
+  · Activity: Activity
+  · GetAsset: Read credentials
+  · InvokeWorkflowFile: InvokeWorkflowFile
+
+## Global activity counts (top 25)
+- Activity: 2
+- InvokeWorkflowFile: 2
+- LogMessage: 1
+- Click: 1
+- GetAsset: 1"""
+
+
+class OutlineTest(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp(prefix="uiparse-test-")
+        self.addCleanup(shutil.rmtree, self.root)
+
+    def write(self, name, text):
+        path = os.path.join(self.root, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def test_matches_pre_split_outline(self):
+        self.write("project.json", '{"main": "Main.xaml"}')
+        self.write("Main.xaml", MAIN_XAML)
+        self.write(os.path.join("Sub", "Child.xaml"), CHILD_XAML)
+        for cache in (False, True, True):  # uncached, then writing and reading the cache
+            self.assertEqual(make_outline_text(build_project_map(self.root, workers=1, cache=cache)),
+                             EXPECTED_OUTLINE)
+
+    def test_sample_workflow_lists_steps(self):
+        self.write("project.json", '{"main": "Main.xaml"}')
+        shutil.copy(os.path.join(HERE, "Main.xaml"), os.path.join(self.root, "Main.xaml"))
+        outline = make_outline_text(build_project_map(self.root, workers=1, cache=False))
+        self.assertIn("- Top activities: String×21, AssemblyReference×17", outline)
+        self.assertEqual(outline.count("\n  · "), 30)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,642 @@
+"""UiPath project analysis without any GUI dependency.
+
+Parses XAML workflows, walks the invoke graph from project.json and builds the
+outline, graph and assets reports shown by the UiParse app (main.py) and written
+by the command line tool (cli.py). Only the standard library is imported here,
+so worker processes and CI jobs start without loading Qt.
+
+XAML is parsed with lxml when it is installed and with the stdlib ElementTree
+otherwise; UIPARSE_PARSER=stdlib|lxml overrides the choice. Both backends return
+the same reports, and benchmark.py compares their speed on your workflows.
+"""
+import os
+import sys
+import json
+import zlib
+import sqlite3
+import hashlib
+import multiprocessing
+import xml.etree.ElementTree as ET
+from collections import defaultdict, Counter
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
+# -------------------------
+# Helpers for UiPath parsing
+# -------------------------
+
+_local_names = {}  # qualified tag or attribute name -> interned local name
+
+def _lname(tag: str) -> str:
+    local = _local_names.get(tag)
+    if local is None:
+        local = _local_names[tag] = sys.intern(tag.rsplit('}', 1)[-1])
+    return local
+
+def local_attrib(items):
+    """Map each attribute's local name to its value in one pass.
+
+    "Name" and "{http://schemas.microsoft.com/winfx/2006/xaml}Name" (x:Name)
+    both become "Name"; when both are present the un-namespaced one wins.
+    """
+    attrs = {}
+    for k, v in items:
+        local = _lname(k)
+        if k == local or local not in attrs:
+            attrs[local] = v
+    return attrs
+
+ASSET_ACTS = {"GetAsset", "GetCredential", "GetRobotAsset"}
+INVOKE_ACT = "InvokeWorkflowFile"
+
+# -------------------------
+# Parser backends
+# -------------------------
+
+def _stdlib_iterparse(path):
+    return ET.iterparse(path, events=("start", "end"))
+
+def _lxml_iterparse(path):
+    # huge_tree lifts libxml2's depth and text-size limits that big workflows hit
+    return lxml_etree.iterparse(path, events=("start", "end"), huge_tree=True,
+                                remove_comments=True, remove_pis=True)
+
+BACKENDS = {"stdlib": _stdlib_iterparse}
+PARSE_ERRORS = (ET.ParseError,)
+if lxml_etree is not None:
+    BACKENDS["lxml"] = _lxml_iterparse
+    PARSE_ERRORS += (lxml_etree.XMLSyntaxError,)
+
+# lxml parses large workflows faster (benchmark.py: ~560 vs ~650 ms median on
+# 50k activities); UIPARSE_PARSER picks a backend explicitly
+DEFAULT_BACKEND = os.environ.get("UIPARSE_PARSER", "lxml" if "lxml" in BACKENDS else "stdlib")
+if DEFAULT_BACKEND not in BACKENDS:
+    DEFAULT_BACKEND = "stdlib"
+
+CONTAINER_ACTS = {"Sequence", "Flowchart", "State", "StateMachine", "TryCatch", "ActivityAction"}
+
+class Activity:
+    """One activity row. __slots__ keeps millions of rows small; reads like the dict it replaced."""
+    __slots__ = ("tag", "display", "selector", "timeout", "coerror")
+
+    def __init__(self, tag, display, selector, timeout, coerror):
+        self.tag = tag
+        self.display = display
+        self.selector = selector
+        self.timeout = timeout
+        self.coerror = coerror
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+    def __eq__(self, other):
+        return isinstance(other, Activity) and all(getattr(self, s) == getattr(other, s) for s in self.__slots__)
+
+    def __repr__(self):
+        return f"Activity({', '.join(f'{s}={getattr(self, s)!r}' for s in self.__slots__)})"
+
+def parse_xaml_file(path: str, backend=None):
+    """Parse a single XAML and return activities, invokes, assets, annotations.
+
+    Elements are handled on their start event and dropped from the tree on their
+    end event, so memory stays flat however large the file is; only the rows
+    collected below grow with it. backend is a key of BACKENDS (default
+    DEFAULT_BACKEND).
+    """
+    iterparse = BACKENDS[backend or DEFAULT_BACKEND]
+    acts = []
+    invokes = []
+    assets = []
+    annotations = []
+    stack = []  # open elements, for detaching each finished one from its parent
+    try:
+        for event, elem in iterparse(path):
+            if event == "end":
+                stack.pop()
+                elem.clear()
+                if stack:
+                    del stack[-1][0]  # the finished element is always its parent's first child by now
+                continue
+            stack.append(elem)
+            name = _lname(elem.tag)
+
+            # common attributes (namespace-agnostic)
+            items = elem.items()
+            attrs = local_attrib(items) if items else {}
+            display = attrs.get("DisplayName")
+
+            # collect invokes
+            if name == INVOKE_ACT:
+                wf = attrs.get("WorkflowFile")
+                if wf:
+                    invokes.append({"workflow": wf, "display": display})
+
+            # collect assets
+            if name in ASSET_ACTS:
+                assets.append({
+                    "activity": name,
+                    "asset": attrs.get("AssetName") or attrs.get("Name"),
+                    "display": display
+                })
+
+            # collect annotations: sap2010:Annotation.AnnotationText
+            note = attrs.get("Annotation.AnnotationText")
+            if note:
+                annotations.append({"for": display or name, "note": note})
+
+            # trimmed activity rows (skip containers)
+            if name not in CONTAINER_ACTS:
+                acts.append(Activity(name, display, (attrs.get("Selector") or "")[:220],
+                                     attrs.get("TimeoutMS"), attrs.get("ContinueOnError")))
+    except PARSE_ERRORS as e:
+        return {"error": f"ParseError in {os.path.basename(path)}: {e}"}
+
+    return {"activities": acts, "invokes": invokes, "assets": assets, "annotations": annotations}
+
+def invoke_target(root: str, cur: str, workflow: str) -> str:
+    """Project-relative path of a WorkflowFile invoked from cur."""
+    p = os.path.normpath(os.path.join(root, os.path.dirname(cur), workflow))
+    return os.path.relpath(p, root)
+
+def read_project_main(project_json_path: str) -> str:
+    with open(project_json_path, "r", encoding="utf-8") as f:
+        pj = json.load(f)
+    return pj.get("main", "Main.xaml")
+
+# -------------------------
+# Parse cache
+# -------------------------
+
+CACHE_FILE = ".uiparse-cache.sqlite"
+CACHE_VERSION = 4  # bump whenever the output of parse_xaml_file or its encoding changes
+
+def file_digest(path: str) -> str:
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+def parse_with_digest(path: str):
+    """Parse a XAML and fingerprint its content, for storing in the cache."""
+    return parse_xaml_file(path), file_digest(path)
+
+def dump_report(report) -> bytes:
+    """Encode a parse_xaml_file report for the cache: zlib-compressed JSON, activities as lists."""
+    if "activities" in report:
+        report = dict(report, activities=[[a.tag, a.display, a.selector, a.timeout, a.coerror]
+                                          for a in report["activities"]])
+    return zlib.compress(json.dumps(report, separators=(",", ":")).encode("utf-8"))
+
+def load_report(blob: bytes):
+    """Decode dump_report's output; raises ValueError or TypeError on anything else."""
+    report = json.loads(zlib.decompress(blob))
+    if not isinstance(report, dict):
+        raise ValueError("cached report is not an object")
+    if "activities" in report:
+        report["activities"] = [Activity(*row) for row in report["activities"]]
+    return report
+
+class ParseCache:
+    """parse_xaml_file results kept in SQLite, one zlib-compressed JSON row per file.
+
+    A row is reused while the file's size and mtime_ns are unchanged; when only
+    the mtime moved (checkout, copy, touch) the content hash decides. The file
+    ships with the project, so rows are plain data and one that does not decode
+    is a miss. Writes are queued and stored by flush() in one short transaction,
+    and a cache locked by another build or on a read-only mount is skipped.
+    """
+    def __init__(self, path: str, timeout=5.0):
+        self.db = sqlite3.connect(path, timeout=timeout)
+        self.db.execute("CREATE TABLE IF NOT EXISTS reports (path TEXT PRIMARY KEY, size INTEGER, "
+                        "mtime_ns INTEGER, digest TEXT, version INTEGER, report BLOB)")
+        self.rows = []     # reports waiting for flush()
+        self.touched = []  # (mtime_ns, path) of reused rows whose file only got a new mtime
+
+    def get(self, key: str, full: str):
+        """Return (report, stat) for the file; report is None when the row is missing, stale or unreadable."""
+        st = os.stat(full)
+        try:
+            row = self.db.execute("SELECT size, mtime_ns, digest, report FROM reports WHERE path = ? AND version = ?",
+                                  (key, CACHE_VERSION)).fetchone()
+        except sqlite3.Error:
+            return None, st
+        if row is None or row[0] != st.st_size:
+            return None, st
+        if row[1] != st.st_mtime_ns and file_digest(full) != row[2]:
+            return None, st
+        try:
+            rep = load_report(row[3])
+        except (zlib.error, ValueError, TypeError):
+            return None, st
+        if row[1] != st.st_mtime_ns:
+            self.touched.append((st.st_mtime_ns, key))
+        return rep, st
+
+    def put(self, key: str, st, digest: str, report):
+        self.rows.append((key, st.st_size, st.st_mtime_ns, digest, CACHE_VERSION, dump_report(report)))
+
+    def flush(self):
+        """Store the queued writes; they are dropped when the cache is locked or read-only."""
+        if not (self.rows or self.touched):
+            return
+        try:
+            with self.db:
+                self.db.executemany("INSERT OR REPLACE INTO reports VALUES (?, ?, ?, ?, ?, ?)", self.rows)
+                self.db.executemany("UPDATE reports SET mtime_ns = ? WHERE path = ?", self.touched)
+        except sqlite3.Error:
+            pass
+        self.rows = []
+        self.touched = []
+
+    def close(self):
+        self.flush()
+        self.db.close()
+
+def open_cache(root: str, cache, timeout=5.0):
+    """Open the cache for build_project_map's cache argument, or None when disabled or unwritable."""
+    if not cache:
+        return None
+    try:
+        return ParseCache(os.path.join(root, CACHE_FILE) if cache is True else cache, timeout)
+    except sqlite3.Error:
+        return None
+
+def parse_level(paths, pool=None, workers=1, func=parse_xaml_file):
+    """Parse a list of XAMLs, on the pool when there is more than one.
+
+    Results are yielded lazily in input order, as soon as each one is ready.
+    """
+    if pool is None or len(paths) < 2:
+        return (func(p) for p in paths)
+    return pool.map(func, paths, chunksize=max(1, len(paths) // (4 * workers)))
+
+def pool_context():
+    """Start method of the parse pool.
+
+    build_project_map runs on a worker thread in the Qt app, and forking a
+    multithreaded process can deadlock the child, so fork is never used.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(["uiparse_core"])
+        return context
+    return multiprocessing.get_context("spawn")
+
+def build_project_map(root: str, workers=None, cache=True, progress=None, on_file=None, cancel=None):
+    """Walk from project.json main → follow invokes → return graph + reports.
+
+    The invoke graph is walked one BFS level at a time and each level is parsed
+    on a process pool (workers=None uses every core, workers=1 parses serially).
+    Results are merged in queue order, so the output is identical to a serial walk.
+
+    Unchanged files are served from the parse cache: cache=True keeps it in the
+    project root, a path puts it elsewhere and False parses every file.
+
+    For callers running the build in the background, progress(done, queued) and
+    on_file(key, report, edges) are called as each file is merged, in final
+    order. Setting the cancel event stops the walk; the map of the files merged
+    so far is returned with "cancelled": True.
+    """
+    pj_path = os.path.join(root, "project.json")
+    if not os.path.exists(pj_path):
+        return {"error": f"project.json not found in {root}"}
+
+    main = read_project_main(pj_path)
+    level = [main]
+    seen = set()
+    graph = defaultdict(list)
+    file_reports = {}
+    all_assets = []
+    activity_counter = Counter()
+
+    workers = workers or os.cpu_count() or 1
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=pool_context()) if workers > 1 else None
+    parse_cache = open_cache(root, cache)
+    cancelled = False
+    try:
+        while level and not cancelled:
+            # the level's unseen files, in queue order (a serial BFS pops them in this order)
+            todo = []
+            for cur in level:
+                if cur not in seen:
+                    seen.add(cur)
+                    todo.append(cur)
+            reports = {}
+            misses = []
+            for cur in todo:
+                full = os.path.join(root, cur)
+                if not os.path.exists(full):
+                    continue
+                rep, st = parse_cache.get(cur, full) if parse_cache else (None, None)
+                if rep is None:
+                    misses.append((cur, st))
+                else:
+                    reports[cur] = rep
+
+            paths = [os.path.join(root, cur) for cur, _ in misses]
+            parsed = parse_level(paths, pool, workers, parse_with_digest if parse_cache else parse_xaml_file)
+            stats = dict(misses)
+
+            level = []
+            upcoming = set()  # distinct unseen files of the next level, for progress
+            for done, cur in enumerate(todo, 1):
+                if cancel is not None and cancel.is_set():
+                    cancelled = True
+                    break
+                if cur in reports:
+                    rep = reports[cur]
+                elif cur in stats:
+                    # misses come back in todo order
+                    if parse_cache:
+                        rep, digest = next(parsed)
+                        parse_cache.put(cur, stats[cur], digest, rep)
+                    else:
+                        rep = next(parsed)
+                else:
+                    rep = {"error": f"Missing file: {cur}"}
+                file_reports[cur] = rep
+
+                # Graph edges
+                for inv in rep.get("invokes", []):
+                    wf = inv["workflow"]
+                    tgt = invoke_target(root, cur, wf)
+                    tgt_full = os.path.join(root, tgt)
+                    graph[cur].append(tgt if os.path.exists(tgt_full) else f"{wf} (MISSING)")
+                    if os.path.exists(tgt_full):
+                        level.append(tgt)
+                        if tgt not in seen:
+                            upcoming.add(tgt)
+
+                # Assets + Activity counts
+                for a in rep.get("assets", []):
+                    a["file"] = cur
+                    all_assets.append(a)
+                for a in rep.get("activities", []):
+                    activity_counter[a["tag"]] += 1
+
+                if on_file:
+                    on_file(cur, rep, graph.get(cur, []))
+                if progress:
+                    progress(len(file_reports), len(file_reports) + len(todo) - done + len(upcoming))
+            if parse_cache:
+                parse_cache.flush()
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        if parse_cache:
+            parse_cache.close()
+
+    # Summarize assets
+    assets_summary = defaultdict(lambda: {"count": 0, "files": set(), "kinds": set()})
+    for a in all_assets:
+        name = a.get("asset")
+        if not name:
+            continue
+        assets_summary[name]["count"] += 1
+        assets_summary[name]["files"].add(a["file"])
+        assets_summary[name]["kinds"].add(a["activity"])
+
+    assets_table = []
+    for name, meta in sorted(assets_summary.items()):
+        assets_table.append({
+            "AssetName": name,
+            "Refs": meta["count"],
+            "Kinds": ",".join(sorted(meta["kinds"])),
+            "Files": ", ".join(sorted(meta["files"]))
+        })
+
+    result = {
+        "entry": main,
+        "graph": dict(graph),
+        "files": file_reports,
+        "assets_table": assets_table,
+        "activity_counts": dict(activity_counter),
+    }
+    if cancelled:
+        result["cancelled"] = True
+    return result
+
+def outline_section(xaml, rep):
+    """Outline lines for one workflow."""
+    lines = [f"\n## {xaml}"]
+    if "error" in rep:
+        lines.append(f"- ERROR: {rep['error']}")
+        return lines
+
+    # Top activities (grouped)
+    c = Counter(a["tag"] for a in rep["activities"])
+    if c:
+        tops = ", ".join(f"{k}×{v}" for k, v in c.most_common(10))
+        lines.append(f"- Top activities: {tops}")
+
+    # Invokes
+    inv = rep.get("invokes", [])
+    if inv:
+        lines.append("- Invokes:")
+        for i in inv:
+            lines.append(f"  - {i['workflow']} ({i.get('display') or 'no display'})")
+
+    # Annotations (show a few)
+    ann = rep.get("annotations", [])
+    for a in ann[:10]:
+        lines.append(f"- Note [{a['for']}]: {a['note']}")
+
+    # Sample steps
+    steps = rep["activities"][:30]
+    if steps:
+        lines.append("- Sample steps:")
+        for s in steps:
+            desc = s["display"] or s["tag"]
+            sel = f" selector={s['selector']}" if s.get("selector") else ""
+            coe = f" coe={s['coerror']}" if s.get("coerror") else ""
+            lines.append(f"  · {s['tag']}: {desc}{sel}{coe}")
+    return lines
+
+def outline_totals(counter):
+    lines = ["\n## Global activity counts (top 25)"]
+    for k, v in counter.most_common(25):
+        lines.append(f"- {k}: {v}")
+    return lines
+
+def make_outline_text(result):
+    if "error" in result:
+        return f"ERROR: {result['error']}"
+
+    lines = [f"# Entry: {result['entry']}"]
+    for xaml, rep in result["files"].items():
+        lines.extend(outline_section(xaml, rep))
+
+    # Global activity counts
+    c_all = Counter()
+    for rep in result["files"].values():
+        if isinstance(rep, dict) and "activities" in rep:
+            for a in rep["activities"]:
+                c_all[a["tag"]] += 1
+    lines.extend(outline_totals(c_all))
+
+    return "\n".join(lines)
+
+def asset_row(name, refs):
+    """Assets table row from a Counter of (file, activity) references."""
+    return {
+        "AssetName": name,
+        "Refs": sum(refs.values()),
+        "Kinds": ",".join(sorted({kind for _, kind in refs})),
+        "Files": ", ".join(sorted({f for f, _ in refs}))
+    }
+
+class ProjectModel:
+    """A built project map that is patched in place as workflows change.
+
+    Only changed or newly reachable files are re-parsed. The invoke graph is
+    re-walked from the reports already in memory, and activity counts and asset
+    rows are adjusted by the difference of each touched file, so the result stays
+    equal to what build_project_map would return for the files on disk.
+    """
+    def __init__(self, root: str, result, cache=True):
+        self.root = root
+        self.result = result
+        self.cache = cache
+        self.activity_counter = Counter()
+        self.asset_refs = defaultdict(Counter)  # asset name -> Counter of (file, activity)
+        for key, rep in result["files"].items():
+            self._count(key, rep, 1)
+        self.missing = set()
+        for key, rep in result["files"].items():
+            for inv in rep.get("invokes", []):
+                tgt = invoke_target(root, key, inv["workflow"])
+                if not os.path.exists(os.path.join(root, tgt)):
+                    self.missing.add(tgt)
+        self.stamps = {key: self._stamp(key) for key in self.watched()}
+
+    def watched(self):
+        """Project-relative paths whose changes can alter the map."""
+        return {"project.json"} | set(self.result["files"]) | self.missing
+
+    def _stamp(self, key):
+        try:
+            st = os.stat(os.path.join(self.root, key))
+        except OSError:
+            return None
+        return st.st_size, st.st_mtime_ns
+
+    def poll(self):
+        """Return the watched paths whose size or mtime changed since the last poll or update."""
+        changed = set()
+        for key in self.watched():
+            stamp = self._stamp(key)
+            if self.stamps.get(key) != stamp:
+                self.stamps[key] = stamp
+                changed.add(key)
+        return changed
+
+    def _count(self, key, rep, sign):
+        """Add (sign=1) or remove (sign=-1) a report's activities and assets; return the asset names touched."""
+        for a in rep.get("activities", []):
+            self.activity_counter[a["tag"]] += sign
+            if not self.activity_counter[a["tag"]]:
+                del self.activity_counter[a["tag"]]
+        names = set()
+        for a in rep.get("assets", []):
+            a["file"] = key
+            name = a.get("asset")
+            if name:
+                self.asset_refs[name][(key, a["activity"])] += sign
+                names.add(name)
+        return names
+
+    def _parse(self, key, parse_cache):
+        full = os.path.join(self.root, key)
+        if not os.path.exists(full):
+            return {"error": f"Missing file: {key}"}
+        rep, st = parse_cache.get(key, full) if parse_cache else (None, None)
+        if rep is None:
+            rep, digest = parse_with_digest(full)
+            if parse_cache:
+                parse_cache.put(key, st, digest, rep)
+        return rep
+
+    def apply_changes(self, keys):
+        """Patch the result for changed paths.
+
+        Returns {"files", "assets", "graph"}: the workflows whose reports changed or
+        left the map, the asset names whose rows changed and whether the graph
+        edges changed. Returns None when the entry point moved and the map has to be
+        rebuilt.
+        """
+        res = self.result
+        if "project.json" in keys:
+            pj_path = os.path.join(self.root, "project.json")
+            if not os.path.exists(pj_path) or read_project_main(pj_path) != res["entry"]:
+                return None
+
+        old_files = res["files"]
+        # called on the UI thread: do not wait long for a cache a running build has locked
+        parse_cache = open_cache(self.root, self.cache, timeout=0.2)
+        try:
+            fresh = {key: self._parse(key, parse_cache) for key in keys if key in old_files}
+
+            # re-walk the invokes; only files new to the map are parsed
+            files = {}
+            graph = defaultdict(list)
+            missing = set()
+            level = [res["entry"]]
+            while level:
+                next_level = []
+                for cur in level:
+                    if cur in files:
+                        continue
+                    if cur not in fresh and cur not in old_files:
+                        fresh[cur] = self._parse(cur, parse_cache)
+                    rep = files[cur] = fresh.get(cur, old_files.get(cur))
+                    for inv in rep.get("invokes", []):
+                        wf = inv["workflow"]
+                        tgt = invoke_target(self.root, cur, wf)
+                        if os.path.exists(os.path.join(self.root, tgt)):
+                            graph[cur].append(tgt)
+                            next_level.append(tgt)
+                        else:
+                            graph[cur].append(f"{wf} (MISSING)")
+                            missing.add(tgt)
+                level = next_level
+        finally:
+            if parse_cache:
+                parse_cache.close()
+
+        touched = set(fresh) | (old_files.keys() - files.keys())
+        names = set()
+        for key in touched:
+            if key in old_files:
+                names |= self._count(key, old_files[key], -1)
+            if key in files:
+                names |= self._count(key, files[key], 1)
+
+        rows = {row["AssetName"]: row for row in res["assets_table"]}
+        for name in names:
+            refs = +self.asset_refs[name]
+            if refs:
+                self.asset_refs[name] = refs
+                rows[name] = asset_row(name, refs)
+            else:
+                del self.asset_refs[name]
+                rows.pop(name, None)
+
+        graph = dict(graph)
+        graph_changed = graph != res["graph"]
+        res.update(files=files, graph=graph, assets_table=[rows[name] for name in sorted(rows)],
+                   activity_counts=dict(self.activity_counter))
+        self.missing = missing
+        for key in self.watched():
+            self.stamps[key] = self._stamp(key)
+        return {"files": touched, "assets": names, "graph": graph_changed}